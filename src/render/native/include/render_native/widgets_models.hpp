@@ -1,6 +1,6 @@
 #pragma once
 
-#include <deque>
+#include <cstddef>
 #include <string>
 #include <vector>
 
@@ -117,8 +117,14 @@ class SparkLineModel {
     [[nodiscard]] double fill_opacity() const;
 
   private:
+    // Index of the i-th oldest sample in ring_.
+    [[nodiscard]] std::size_t ring_index(std::size_t i) const;
+
     SparkLineConfig config_;
-    std::deque<double> buffer_;
+    // Fixed-capacity ring of buffer_size samples; head_ is the oldest one.
+    std::vector<double> ring_;
+    std::size_t head_{0};
+    std::size_t count_{0};
 };
 
 class TimelineModel {
@@ -2,6 +2,7 @@
 
 #include "render_native/math.hpp"
 
+#include <cmath>
 #include <ctime>
 #include <iomanip>
 #include <sstream>
@@ -35,29 +36,71 @@ std::tm utc_tm_from_epoch(double timestamp) {
     return utc_tm;
 }
 
-}  // namespace
+// Two-digit "00".."59" lookup used by the HH:MM:SS label.
+constexpr char kTwoDigits[] =
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859";
+
+void write_two_digits(char* out, int value) {
+    const int safe = (value >= 0 && value < 60) ? value : 0;
+    out[0] = kTwoDigits[safe * 2];
+    out[1] = kTwoDigits[(safe * 2) + 1];
+}
 
-SnapshotLines format_snapshot_lines(double timestamp, double cpu_percent, double memory_percent) {
-    const double safe_cpu = sanitize_percent(cpu_percent);
-    const double safe_memory = sanitize_percent(memory_percent);
-    const std::tm utc_tm = utc_tm_from_epoch(timestamp);
+// The UTC label only changes once per whole second, while callers format it
+// on every tick.  Keep the last label per thread and rebuild it on change.
+const std::string& updated_label_for(double timestamp) {
+    thread_local std::time_t cached_second = static_cast<std::time_t>(-1);
+    thread_local std::string cached_label;
+
+    const std::time_t second = static_cast<std::time_t>(timestamp);
+    if (second != cached_second || cached_label.empty()) {
+        const std::tm utc_tm = utc_tm_from_epoch(timestamp);
+        char buffer[] = "Updated 00:00:00 UTC";
+        write_two_digits(buffer + 8, utc_tm.tm_hour);
+        write_two_digits(buffer + 11, utc_tm.tm_min);
+        write_two_digits(buffer + 14, utc_tm.tm_sec);
+        cached_label.assign(buffer);
+        cached_second = second;
+    }
+    return cached_label;
+}
 
-    std::ostringstream ts;
-    ts << std::setfill('0')
-       << std::setw(2) << utc_tm.tm_hour << ":"
-       << std::setw(2) << utc_tm.tm_min << ":"
-       << std::setw(2) << utc_tm.tm_sec << " UTC";
+struct PercentLabelCache {
+    bool valid = false;
+    double value = 0.0;
+    std::string label;
+};
+
+// Re-formats a "<prefix> NN.N%" label only when the sanitized value differs
+// from the last one seen on this thread.  Memory load in particular tends to
+// repeat across ticks, and scrubbing re-applies the same snapshot.
+const std::string& percent_label_for(PercentLabelCache& cache, const char* prefix, double value) {
+    // signbit keeps -0.0 (printed "-0.0") apart from 0.0.
+    if (!cache.valid || cache.value != value || std::signbit(cache.value) != std::signbit(value)) {
+        std::ostringstream out;
+        out << prefix << ' ' << std::fixed << std::setprecision(1) << value << "%";
+        cache.label = out.str();
+        cache.value = value;
+        cache.valid = true;
+    }
+    return cache.label;
+}
 
-    std::ostringstream cpu;
-    cpu << "CPU " << std::fixed << std::setprecision(1) << safe_cpu << "%";
+}  // namespace
 
-    std::ostringstream memory;
-    memory << "Memory " << std::fixed << std::setprecision(1) << safe_memory << "%";
+SnapshotLines format_snapshot_lines(double timestamp, double cpu_percent, double memory_percent) {
+    thread_local PercentLabelCache cpu_cache;
+    thread_local PercentLabelCache memory_cache;
 
     return SnapshotLines{
-        cpu.str(),
-        memory.str(),
-        "Updated " + ts.str(),
+        percent_label_for(cpu_cache, "CPU", sanitize_percent(cpu_percent)),
+        percent_label_for(memory_cache, "Memory", sanitize_percent(memory_percent)),
+        updated_label_for(timestamp),
     };
 }
 
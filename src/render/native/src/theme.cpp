@@ -4,6 +4,7 @@
 
 #include <array>
 #include <cctype>
+#include <cstddef>
 #include <cmath>
 #include <stdexcept>
 
@@ -11,46 +12,49 @@ namespace aura::render_native {
 
 namespace {
 
-int parse_hex_nibble(char c) {
-    if (c >= '0' && c <= '9') {
-        return c - '0';
+// Byte-indexed decode table: hex digit value, or -1 for anything else.
+constexpr std::array<signed char, 256> make_hex_value_table() {
+    std::array<signed char, 256> table{};
+    for (auto& entry : table) {
+        entry = -1;
     }
-    if (c >= 'a' && c <= 'f') {
-        return 10 + (c - 'a');
+    for (int i = 0; i < 10; ++i) {
+        table[static_cast<std::size_t>('0' + i)] = static_cast<signed char>(i);
     }
-    if (c >= 'A' && c <= 'F') {
-        return 10 + (c - 'A');
+    for (int i = 0; i < 6; ++i) {
+        table[static_cast<std::size_t>('a' + i)] = static_cast<signed char>(10 + i);
+        table[static_cast<std::size_t>('A' + i)] = static_cast<signed char>(10 + i);
     }
-    throw std::invalid_argument("Expected #RRGGBB color.");
+    return table;
 }
 
-int parse_hex_byte(char hi, char lo) {
-    return (parse_hex_nibble(hi) * 16) + parse_hex_nibble(lo);
-}
+constexpr std::array<signed char, 256> kHexValue = make_hex_value_table();
+constexpr char kHexDigits[] = "0123456789abcdef";
 
-char to_hex_char(int value) {
-    static constexpr std::array<char, 16> kHex = {
-        '0', '1', '2', '3', '4', '5', '6', '7',
-        '8', '9', 'a', 'b', 'c', 'd', 'e', 'f',
-    };
-    if (value < 0 || value > 15) {
-        throw std::invalid_argument("hex nibble out of range");
+int parse_hex_nibble(char c) {
+    const int value = kHexValue[static_cast<unsigned char>(c)];
+    if (value < 0) {
+        throw std::invalid_argument("Expected #RRGGBB color.");
     }
-    return kHex[static_cast<std::size_t>(value)];
+    return value;
+}
+
+int parse_hex_byte(char hi, char lo) {
+    return (parse_hex_nibble(hi) * 16) + parse_hex_nibble(lo);
 }
 
 // Build a "#rrggbb" string from clamped 0-255 channel values.
 std::string rgb_to_hex(int red, int green, int blue) {
-    std::string out;
-    out.reserve(7);
-    out.push_back('#');
-    out.push_back(to_hex_char((red >> 4) & 0x0f));
-    out.push_back(to_hex_char(red & 0x0f));
-    out.push_back(to_hex_char((green >> 4) & 0x0f));
-    out.push_back(to_hex_char(green & 0x0f));
-    out.push_back(to_hex_char((blue >> 4) & 0x0f));
-    out.push_back(to_hex_char(blue & 0x0f));
-    return out;
+    char out[7] = {
+        '#',
+        kHexDigits[(red >> 4) & 0x0f],
+        kHexDigits[red & 0x0f],
+        kHexDigits[(green >> 4) & 0x0f],
+        kHexDigits[green & 0x0f],
+        kHexDigits[(blue >> 4) & 0x0f],
+        kHexDigits[blue & 0x0f],
+    };
+    return std::string(out, sizeof(out));
 }
 
 // Linearise a single 8-bit sRGB channel for WCAG luminance computation.
@@ -125,6 +129,7 @@ RgbColor blend_rgb(const RgbColor& a, const RgbColor& b, double t) {
 
 }  // namespace
 
+
 RgbColor interpolate_gauge_color(double percent) {
     // Guard against NaN / Inf — treat as 0.
     if (!std::isfinite(percent)) {
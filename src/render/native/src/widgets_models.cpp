@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include <cmath>
+#include <cstddef>
 #include <stdexcept>
 #include <utility>
 
@@ -99,33 +100,51 @@ SparkLineModel::SparkLineModel(SparkLineConfig config) : config_(std::move(confi
     if (config_.min_height < 1) {
         throw std::invalid_argument("min_height must be >= 1.");
     }
+    ring_.assign(static_cast<std::size_t>(config_.buffer_size), 0.0);
 }
 
 int SparkLineModel::buffer_len() const {
-    return static_cast<int>(buffer_.size());
+    return static_cast<int>(count_);
 }
 
 double SparkLineModel::latest() const {
-    if (buffer_.empty()) {
+    if (count_ == 0U) {
         return 0.0;
     }
-    return buffer_.back();
+    return ring_[ring_index(count_ - 1U)];
 }
 
 bool SparkLineModel::has_data() const {
-    return !buffer_.empty();
+    return count_ != 0U;
+}
+
+std::size_t SparkLineModel::ring_index(const std::size_t i) const {
+    const std::size_t index = head_ + i;
+    return index < ring_.size() ? index : index - ring_.size();
 }
 
 void SparkLineModel::push(double value) {
-    if (static_cast<int>(buffer_.size()) == config_.buffer_size) {
-        buffer_.pop_front();
+    // A full ring overwrites its oldest slot and advances the head.
+    const double sanitized = sanitize_percent(value);
+    if (count_ == ring_.size()) {
+        ring_[head_] = sanitized;
+        head_ = ring_index(1U);
+        return;
     }
-    buffer_.push_back(sanitize_percent(value));
+    ring_[ring_index(count_)] = sanitized;
+    ++count_;
 }
 
 void SparkLineModel::push_many(const std::vector<double>& values) {
-    for (const double value : values) {
-        push(value);
+    // Only the trailing buffer_size values can survive the batch, so the
+    // rest are skipped before being written into the ring.
+    const std::size_t capacity = ring_.size();
+    auto first = values.begin();
+    if (values.size() > capacity) {
+        first = values.end() - static_cast<std::ptrdiff_t>(capacity);
+    }
+    for (auto it = first; it != values.end(); ++it) {
+        push(*it);
     }
 }
 
@@ -134,21 +153,29 @@ void SparkLineModel::push_many(const std::vector<double>& values) {
 // ---------------------------------------------------------------------------
 
 double SparkLineModel::buffer_min() const {
-    if (buffer_.empty()) {
+    if (count_ == 0U) {
         return 0.0;
     }
-    return *std::min_element(buffer_.begin(), buffer_.end());
+    double lo = ring_[head_];
+    for (std::size_t i = 1; i < count_; ++i) {
+        lo = std::min(lo, ring_[ring_index(i)]);
+    }
+    return lo;
 }
 
 double SparkLineModel::buffer_max() const {
-    if (buffer_.empty()) {
+    if (count_ == 0U) {
         return 0.0;
     }
-    return *std::max_element(buffer_.begin(), buffer_.end());
+    double hi = ring_[head_];
+    for (std::size_t i = 1; i < count_; ++i) {
+        hi = std::max(hi, ring_[ring_index(i)]);
+    }
+    return hi;
 }
 
 std::vector<double> SparkLineModel::normalized_buffer() const {
-    if (buffer_.empty()) {
+    if (count_ == 0U) {
         return {};
     }
 
@@ -156,19 +183,15 @@ std::vector<double> SparkLineModel::normalized_buffer() const {
     const double hi = buffer_max();
     const double range = hi - lo;
 
-    std::vector<double> out;
-    out.reserve(buffer_.size());
-
     if (range < 1e-9) {
         // All values are effectively equal — map them all to 0.5 so the
         // spark line still renders at mid-height rather than collapsing.
-        for (std::size_t i = 0; i < buffer_.size(); ++i) {
-            out.push_back(0.5);
-        }
-    } else {
-        for (const double v : buffer_) {
-            out.push_back(clamp_unit((v - lo) / range));
-        }
+        return std::vector<double>(count_, 0.5);
+    }
+
+    std::vector<double> out(count_);
+    for (std::size_t i = 0; i < count_; ++i) {
+        out[i] = clamp_unit((ring_[ring_index(i)] - lo) / range);
     }
     return out;
 }
@@ -178,7 +201,7 @@ double SparkLineModel::fill_opacity() const {
     // Empty buffer falls back to the minimum opacity.
     static constexpr double kOpacityMin = 0.1;
     static constexpr double kOpacityMax = 0.9;
-    if (buffer_.empty()) {
+    if (count_ == 0U) {
         return kOpacityMin;
     }
     const double normalized = clamp_unit(latest() / 100.0);
@@ -83,6 +83,21 @@ AURA_PLATFORM_EXPORT int aura_store_append(
     aura_error_t* out_error
 );
 
+/* out_total_count may be NULL; when set it receives the retained row count. */
+AURA_PLATFORM_EXPORT int aura_store_append_many(
+    aura_store_t* store,
+    const aura_snapshot_t* snapshots,
+    int count,
+    int* out_total_count,
+    aura_error_t* out_error
+);
+
+AURA_PLATFORM_EXPORT int aura_store_set_retention(
+    aura_store_t* store,
+    double retention_seconds,
+    aura_error_t* out_error
+);
+
 AURA_PLATFORM_EXPORT int aura_collect_snapshot(
     aura_snapshot_t* out_snapshot,
     aura_error_t* out_error
@@ -7,6 +7,7 @@
 #include <memory>
 #include <string>
 #include <utility>
+#include <vector>
 
 using aura::platform::ConfigRequest;
 using aura::platform::DbSource;
@@ -229,6 +230,64 @@ AURA_PLATFORM_EXPORT int aura_store_append(
     }
 }
 
+AURA_PLATFORM_EXPORT int aura_store_append_many(
+    aura_store_t* store,
+    const aura_snapshot_t* snapshots,
+    const int count,
+    int* out_total_count,
+    aura_error_t* out_error
+) {
+    if (store == nullptr) {
+        SetError(out_error, AURA_ERR_INVALID_ARGUMENT, "store must not be null.");
+        return AURA_ERR_INVALID_ARGUMENT;
+    }
+    if (count < 0) {
+        SetError(out_error, AURA_ERR_INVALID_ARGUMENT, "count must be non-negative.");
+        return AURA_ERR_INVALID_ARGUMENT;
+    }
+    if (count > 0 && snapshots == nullptr) {
+        SetError(out_error, AURA_ERR_INVALID_ARGUMENT, "snapshots must not be null when count > 0.");
+        return AURA_ERR_INVALID_ARGUMENT;
+    }
+
+    try {
+        std::vector<Snapshot> batch;
+        batch.reserve(static_cast<std::size_t>(count));
+        for (int i = 0; i < count; ++i) {
+            batch.push_back(ToInternalSnapshot(snapshots[i]));
+        }
+        auto* typed_store = reinterpret_cast<AuraStore*>(store);
+        const int total_count = typed_store->store->AppendMany(batch);
+        if (out_total_count != nullptr) {
+            *out_total_count = total_count;
+        }
+        ClearError(out_error);
+        return AURA_OK;
+    } catch (const std::exception& exc) {
+        return HandleException(exc, out_error);
+    }
+}
+
+AURA_PLATFORM_EXPORT int aura_store_set_retention(
+    aura_store_t* store,
+    const double retention_seconds,
+    aura_error_t* out_error
+) {
+    if (store == nullptr) {
+        SetError(out_error, AURA_ERR_INVALID_ARGUMENT, "store must not be null.");
+        return AURA_ERR_INVALID_ARGUMENT;
+    }
+
+    try {
+        auto* typed_store = reinterpret_cast<AuraStore*>(store);
+        typed_store->store->SetRetention(retention_seconds);
+        ClearError(out_error);
+        return AURA_OK;
+    } catch (const std::exception& exc) {
+        return HandleException(exc, out_error);
+    }
+}
+
 AURA_PLATFORM_EXPORT int aura_collect_snapshot(
     aura_snapshot_t* out_snapshot,
     aura_error_t* out_error
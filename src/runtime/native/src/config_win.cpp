@@ -2,30 +2,43 @@
 
 #include <algorithm>
 #include <cctype>
+#include <cstdint>
 #include <cstdlib>
 #include <filesystem>
 #include <fstream>
+#include <map>
+#include <mutex>
 #include <sstream>
 #include <stdexcept>
+#include <string_view>
+#include <utility>
 
 namespace aura::platform {
 namespace {
 
-std::string Trim(std::string value) {
-    auto not_space = [](unsigned char c) { return !std::isspace(c); };
-    value.erase(value.begin(), std::find_if(value.begin(), value.end(), not_space));
-    value.erase(std::find_if(value.rbegin(), value.rend(), not_space).base(), value.end());
+std::string_view TrimView(std::string_view value) {
+    auto is_space = [](char c) { return std::isspace(static_cast<unsigned char>(c)) != 0; };
+    while (!value.empty() && is_space(value.front())) {
+        value.remove_prefix(1);
+    }
+    while (!value.empty() && is_space(value.back())) {
+        value.remove_suffix(1);
+    }
     return value;
 }
 
-std::string StripQuotes(const std::string& value) {
+std::string Trim(const std::string& value) {
+    return std::string(TrimView(value));
+}
+
+std::string_view StripQuotes(const std::string_view value) {
     if (value.size() >= 2 && ((value.front() == '"' && value.back() == '"') || (value.front() == '\'' && value.back() == '\''))) {
         return value.substr(1, value.size() - 2);
     }
     return value;
 }
 
-std::string StripInlineTomlComment(const std::string& line) {
+std::string_view StripInlineTomlComment(const std::string_view line) {
     bool in_single_quote = false;
     bool in_double_quote = false;
     bool escaped = false;
@@ -102,25 +115,73 @@ std::optional<double> ParsePositiveFiniteOptional(const std::string& value, cons
     }
 }
 
-std::filesystem::path ResolveWindowsBaseDataPath() {
-    if (const auto appdata = ReadEnvOptional("APPDATA")) {
-        return std::filesystem::path(*appdata);
+struct DataDirInputs {
+    std::optional<std::string> appdata;
+    std::optional<std::string> localappdata;
+    std::optional<std::string> userprofile;
+
+    bool operator==(const DataDirInputs&) const = default;
+};
+
+std::filesystem::path ResolveWindowsBaseDataPath(const DataDirInputs& inputs) {
+    if (inputs.appdata.has_value()) {
+        return std::filesystem::path(*inputs.appdata);
     }
-    if (const auto localappdata = ReadEnvOptional("LOCALAPPDATA")) {
-        return std::filesystem::path(*localappdata);
+    if (inputs.localappdata.has_value()) {
+        return std::filesystem::path(*inputs.localappdata);
     }
-    if (const auto home = ReadEnvOptional("USERPROFILE")) {
-        return std::filesystem::path(*home) / "AppData" / "Roaming";
+    if (inputs.userprofile.has_value()) {
+        std::filesystem::path roaming(*inputs.userprofile);
+        roaming /= "AppData";
+        roaming /= "Roaming";
+        return roaming;
     }
     return std::filesystem::current_path();
 }
 
-std::filesystem::path ResolveDefaultDbPath() {
-    return ResolveWindowsBaseDataPath() / "Aura" / "telemetry.sqlite";
+struct DefaultPaths {
+    std::filesystem::path config_path;
+    std::string db_path;
+};
+
+// Both paths are appended in place onto one data-dir path instead of
+// composing a temporary path per segment.
+DefaultPaths BuildDefaultPaths(const DataDirInputs& inputs) {
+    DefaultPaths out;
+    out.config_path = ResolveWindowsBaseDataPath(inputs);
+    out.config_path /= "Aura";
+    out.config_path /= "telemetry.sqlite";
+    out.db_path = out.config_path.string();
+    out.config_path.replace_filename("aura.toml");
+    return out;
 }
 
-std::filesystem::path ResolveDefaultConfigPath() {
-    return ResolveWindowsBaseDataPath() / "Aura" / "aura.toml";
+// Resolves the default %APPDATA%\Aura config and db paths together.  The env
+// inputs are re-read on every call and the composed paths are reused while
+// they stay unchanged; the current-directory fallback is never cached
+// because the working directory can move.
+DefaultPaths ResolveDefaultPaths() {
+    static std::mutex cache_mutex;
+    static std::optional<DataDirInputs> cached_inputs;
+    static DefaultPaths cached_paths;
+
+    DataDirInputs inputs{
+        ReadEnvOptional("APPDATA"),
+        ReadEnvOptional("LOCALAPPDATA"),
+        ReadEnvOptional("USERPROFILE"),
+    };
+    const bool cacheable = inputs.appdata.has_value() || inputs.localappdata.has_value() ||
+                           inputs.userprofile.has_value();
+    if (!cacheable) {
+        return BuildDefaultPaths(inputs);
+    }
+
+    std::lock_guard<std::mutex> lock(cache_mutex);
+    if (!cached_inputs.has_value() || *cached_inputs != inputs) {
+        cached_paths = BuildDefaultPaths(inputs);
+        cached_inputs = std::move(inputs);
+    }
+    return cached_paths;
 }
 
 struct FileConfig {
@@ -128,21 +189,22 @@ struct FileConfig {
     std::optional<double> retention_seconds;
 };
 
-FileConfig LoadFileConfig(const std::optional<std::string>& config_path_override) {
-    const std::filesystem::path config_path = config_path_override.has_value()
-        ? std::filesystem::path(*config_path_override)
-        : ResolveDefaultConfigPath();
-
-    std::ifstream input(config_path);
+FileConfig ParseFileConfig(const std::filesystem::path& config_path) {
+    // Binary mode skips the CRT newline translation pass; a trailing '\r'
+    // from CRLF files is removed by TrimView like any other whitespace.
+    std::ifstream input(config_path, std::ios::in | std::ios::binary);
     if (!input.is_open()) {
         return {};
     }
 
+    // The file is streamed line by line through one reused buffer, and lines
+    // are sliced with string_views; only the accepted values are copied.
     FileConfig out;
     bool in_persistence = false;
     std::string line;
+    line.reserve(256);
     while (std::getline(input, line)) {
-        const std::string trimmed = Trim(StripInlineTomlComment(line));
+        const std::string_view trimmed = TrimView(StripInlineTomlComment(line));
         if (trimmed.empty()) {
             continue;
         }
@@ -155,25 +217,67 @@ FileConfig LoadFileConfig(const std::optional<std::string>& config_path_override
         }
 
         const std::size_t eq = trimmed.find('=');
-        if (eq == std::string::npos) {
+        if (eq == std::string_view::npos) {
             continue;
         }
-        const std::string key = Trim(trimmed.substr(0, eq));
-        const std::string value = Trim(trimmed.substr(eq + 1));
+        const std::string_view key = TrimView(trimmed.substr(0, eq));
+        const std::string_view value = TrimView(trimmed.substr(eq + 1));
 
         if (key == "db_path") {
-            const std::string parsed = StripQuotes(value);
+            const std::string_view parsed = StripQuotes(value);
             if (!parsed.empty()) {
-                out.db_path = parsed;
+                out.db_path = std::string(parsed);
             }
         } else if (key == "retention_seconds") {
-            out.retention_seconds = ParsePositiveFiniteOptional(value, "retention_seconds");
+            out.retention_seconds = ParsePositiveFiniteOptional(std::string(value), "retention_seconds");
         }
     }
 
     return out;
 }
 
+struct CachedFileConfig {
+    std::filesystem::file_time_type mtime;
+    std::uintmax_t size = 0;
+    FileConfig config;
+};
+
+constexpr std::size_t kMaxCachedFileConfigs = 8;
+
+// Parsed config files are reused until their mtime or size changes.  Files
+// that fail to parse are never cached so the error is reported every call.
+FileConfig LoadFileConfig(const std::filesystem::path& config_path) {
+    std::error_code stat_error;
+    const auto mtime = std::filesystem::last_write_time(config_path, stat_error);
+    if (stat_error) {
+        return {};
+    }
+    const std::uintmax_t size = std::filesystem::file_size(config_path, stat_error);
+    if (stat_error) {
+        return ParseFileConfig(config_path);
+    }
+
+    static std::mutex cache_mutex;
+    static std::map<std::string, CachedFileConfig> cache;
+    const std::string cache_key = config_path.string();
+    {
+        std::lock_guard<std::mutex> lock(cache_mutex);
+        const auto it = cache.find(cache_key);
+        if (it != cache.end() && it->second.mtime == mtime && it->second.size == size) {
+            return it->second.config;
+        }
+    }
+
+    FileConfig parsed = ParseFileConfig(config_path);
+
+    std::lock_guard<std::mutex> lock(cache_mutex);
+    if (cache.size() >= kMaxCachedFileConfigs && cache.find(cache_key) == cache.end()) {
+        cache.clear();
+    }
+    cache[cache_key] = CachedFileConfig{mtime, size, parsed};
+    return parsed;
+}
+
 } // namespace
 
 void ValidatePositiveFinite(const double value, const char* field_name) {
@@ -189,8 +293,34 @@ void ValidateFinite(const double value, const char* field_name) {
 }
 
 RuntimeConfig ResolveRuntimeConfig(const ConfigRequest& request) {
-    const FileConfig file_cfg = LoadFileConfig(request.config_path_override);
+    // Default paths are resolved at most once per call, and only when a
+    // branch actually needs them.
+    std::optional<DefaultPaths> defaults;
+    auto default_paths = [&defaults]() -> DefaultPaths& {
+        if (!defaults.has_value()) {
+            defaults = ResolveDefaultPaths();
+        }
+        return *defaults;
+    };
+
+    // The config file is likewise only opened once a setting falls through
+    // CLI and env to it.  Like a malformed env value under a CLI flag, a
+    // malformed file is therefore only reported when it is consulted: if CLI
+    // and env settle both retention and db path, the file is never read.
+    std::optional<FileConfig> file_config;
+    auto file_cfg = [&]() -> FileConfig& {
+        if (!file_config.has_value()) {
+            file_config = LoadFileConfig(
+                request.config_path_override.has_value()
+                    ? std::filesystem::path(*request.config_path_override)
+                    : default_paths().config_path
+            );
+        }
+        return *file_config;
+    };
 
+    // The per-call config, env and default-path values are locals, so the
+    // chosen db path is moved into the result rather than copied.
     RuntimeConfig out;
     out.persistence_enabled = !request.no_persist;
 
@@ -199,8 +329,8 @@ RuntimeConfig ResolveRuntimeConfig(const ConfigRequest& request) {
         out.retention_seconds = *request.cli_retention_seconds;
     } else if (const auto env_retention = ReadEnvOptional("AURA_RETENTION_SECONDS")) {
         out.retention_seconds = ParsePositiveFiniteOptional(*env_retention, "AURA_RETENTION_SECONDS").value();
-    } else if (file_cfg.retention_seconds.has_value()) {
-        out.retention_seconds = *file_cfg.retention_seconds;
+    } else if (file_cfg().retention_seconds.has_value()) {
+        out.retention_seconds = *file_cfg().retention_seconds;
     } else {
         out.retention_seconds = kDefaultRetentionSeconds;
     }
@@ -217,20 +347,20 @@ RuntimeConfig ResolveRuntimeConfig(const ConfigRequest& request) {
         return out;
     }
 
-    if (const auto env_db_path = ReadEnvOptional("AURA_DB_PATH")) {
+    if (auto env_db_path = ReadEnvOptional("AURA_DB_PATH")) {
         out.db_source = DbSource::Env;
-        out.db_path = *env_db_path;
+        out.db_path = std::move(*env_db_path);
         return out;
     }
 
-    if (file_cfg.db_path.has_value() && !file_cfg.db_path->empty()) {
+    if (file_cfg().db_path.has_value() && !file_cfg().db_path->empty()) {
         out.db_source = DbSource::Config;
-        out.db_path = *file_cfg.db_path;
+        out.db_path = std::move(*file_cfg().db_path);
         return out;
     }
 
     out.db_source = DbSource::Auto;
-    out.db_path = ResolveDefaultDbPath().string();
+    out.db_path = std::move(default_paths().db_path);
     return out;
 }
 
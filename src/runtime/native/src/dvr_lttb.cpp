@@ -1,65 +1,68 @@
 #include "platform_internal.hpp"
 
+#include <algorithm>
 #include <cmath>
 #include <stdexcept>
 
 namespace aura::platform {
 
-std::vector<Snapshot> DownsampleLttb(const std::vector<Snapshot>& snapshots, int target) {
-    if (target < 2) {
-        throw std::runtime_error("target must be an integer >= 2.");
-    }
+namespace {
 
-    const int n = static_cast<int>(snapshots.size());
-    if (n <= target) {
-        return snapshots;
-    }
+// LTTB selection kernel.  Works purely on the two axis arrays with scalar
+// locals and returns the chosen indices; callers gather their own records.
+// Requires 2 < target < n.
+std::vector<int> SelectLttbIndices(const double* xs, const double* ys, const int n, const int target) {
+    std::vector<int> indices(static_cast<std::size_t>(target));
+    indices.front() = 0;
+    indices.back() = n - 1;
 
-    std::vector<Snapshot> selected;
-    selected.reserve(static_cast<std::size_t>(target));
+    const double bucket_size = static_cast<double>(n - 2) / static_cast<double>(target - 2);
 
-    selected.push_back(snapshots.front());
-    if (target == 2) {
-        selected.push_back(snapshots.back());
-        return selected;
+    // Bucket i spans [edges[i], edges[i + 1]); computing every edge once
+    // replaces the per-iteration float multiplies and casts.  k * bucket_size
+    // is at most n - 2 (up to rounding well below one), so every edge
+    // already lies in [1, n - 1] and needs no clamp.
+    const int bucket_count = target - 2;
+    std::vector<int> edges(static_cast<std::size_t>(bucket_count) + 1);
+    for (int k = 0; k <= bucket_count; ++k) {
+        edges[static_cast<std::size_t>(k)] = static_cast<int>(1 + (k * bucket_size));
     }
 
-    const double bucket_size = static_cast<double>(n - 2) / static_cast<double>(target - 2);
+    double prev_x = xs[0];
+    double prev_y = ys[0];
 
-    double prev_x = snapshots.front().timestamp;
-    double prev_y = snapshots.front().cpu_percent;
+    for (int i = 0; i < bucket_count; ++i) {
+        const std::size_t edge = static_cast<std::size_t>(i);
+        const int bucket_start = edges[edge];
+        const int bucket_end = edges[edge + 1];
 
-    for (int i = 0; i < target - 2; ++i) {
-        const int bucket_start = static_cast<int>(1 + (i * bucket_size));
-        int bucket_end = static_cast<int>(1 + ((i + 1) * bucket_size));
-        bucket_end = std::min(bucket_end, n - 1);
-
-        int next_start = static_cast<int>(1 + ((i + 1) * bucket_size));
-        int next_end = static_cast<int>(1 + ((i + 2) * bucket_size));
-        next_end = std::min(next_end, n - 1);
-        if (i == target - 3) {
-            next_start = n - 1;
-            next_end = n - 1;
-        }
+        // The last bucket looks ahead to the final point only.
+        const bool last_bucket = i == bucket_count - 1;
+        const int next_start = last_bucket ? n - 1 : edges[edge + 1];
+        const int next_end = last_bucket ? n - 1 : edges[edge + 2];
 
         double avg_x = 0.0;
         double avg_y = 0.0;
         const int next_count = (next_end - next_start + 1);
         for (int j = next_start; j <= next_end; ++j) {
-            avg_x += snapshots[static_cast<std::size_t>(j)].timestamp;
-            avg_y += snapshots[static_cast<std::size_t>(j)].cpu_percent;
+            avg_x += xs[j];
+            avg_y += ys[j];
         }
         avg_x /= static_cast<double>(next_count);
         avg_y /= static_cast<double>(next_count);
 
+        // The x-weight of the triangle area is the same for every candidate
+        // in the bucket; hoist it out of the scan.
+        const double x_weight = avg_y - prev_y;
         double best_area = -1.0;
         int best_idx = bucket_start;
         for (int j = bucket_start; j < bucket_end; ++j) {
-            const Snapshot& candidate = snapshots[static_cast<std::size_t>(j)];
+            const double x = xs[j];
+            const double y = ys[j];
             const double area = std::abs(
-                prev_x * (candidate.cpu_percent - avg_y) +
-                candidate.timestamp * (avg_y - prev_y) +
-                avg_x * (prev_y - candidate.cpu_percent)
+                prev_x * (y - avg_y) +
+                x * x_weight +
+                avg_x * (prev_y - y)
             );
             if (area > best_area) {
                 best_area = area;
@@ -67,13 +70,47 @@ std::vector<Snapshot> DownsampleLttb(const std::vector<Snapshot>& snapshots, int
             }
         }
 
-        const Snapshot& chosen = snapshots[static_cast<std::size_t>(best_idx)];
-        selected.push_back(chosen);
-        prev_x = chosen.timestamp;
-        prev_y = chosen.cpu_percent;
+        indices[static_cast<std::size_t>(i) + 1] = best_idx;
+        prev_x = xs[best_idx];
+        prev_y = ys[best_idx];
+    }
+
+    return indices;
+}
+
+} // namespace
+
+std::vector<Snapshot> DownsampleLttb(const std::vector<Snapshot>& snapshots, int target) {
+    if (target < 2) {
+        throw std::runtime_error("target must be an integer >= 2.");
+    }
+
+    const int n = static_cast<int>(snapshots.size());
+    if (n <= target) {
+        return snapshots;
     }
 
-    selected.push_back(snapshots.back());
+    if (target == 2) {
+        return {snapshots.front(), snapshots.back()};
+    }
+
+    // Pull the two LTTB axes into contiguous arrays once so the bucket
+    // reductions stream plain doubles instead of striding over 40-byte
+    // snapshots; the compiler can vectorise these loops.
+    std::vector<double> xs(static_cast<std::size_t>(n));
+    std::vector<double> ys(static_cast<std::size_t>(n));
+    for (std::size_t k = 0; k < static_cast<std::size_t>(n); ++k) {
+        xs[k] = snapshots[k].timestamp;
+        ys[k] = snapshots[k].cpu_percent;
+    }
+
+    const std::vector<int> indices = SelectLttbIndices(xs.data(), ys.data(), n, target);
+
+    std::vector<Snapshot> selected;
+    selected.reserve(indices.size());
+    for (const int index : indices) {
+        selected.push_back(snapshots[static_cast<std::size_t>(index)]);
+    }
     return selected;
 }
 
@@ -87,9 +124,11 @@ std::vector<Snapshot> QueryTimeline(
         throw std::runtime_error("resolution must be an integer >= 2.");
     }
 
-    const std::vector<Snapshot> snapshots = store.Between(start, end);
-    if (snapshots.empty()) {
-        return {};
+    std::vector<Snapshot> snapshots = store.Between(start, end);
+    if (static_cast<int>(snapshots.size()) <= resolution) {
+        // Nothing to reduce: hand the query result straight back rather than
+        // letting DownsampleLttb copy it.
+        return snapshots;
     }
     return DownsampleLttb(snapshots, resolution);
 }
@@ -27,11 +27,12 @@ enum class DbSource {
     Disabled = 4,
 };
 
+// Field order keeps the small members together so the struct packs tightly.
 struct RuntimeConfig {
-    bool persistence_enabled = true;
     double retention_seconds = kDefaultRetentionSeconds;
-    DbSource db_source = DbSource::Auto;
     std::string db_path;
+    DbSource db_source = DbSource::Auto;
+    bool persistence_enabled = true;
 };
 
 struct ConfigRequest {
@@ -51,6 +52,9 @@ class TelemetryStore {
     virtual ~TelemetryStore() = default;
 
     virtual void Append(const Snapshot& snapshot) = 0;
+    // Returns the number of retained rows after the batch is committed.
+    virtual int AppendMany(const std::vector<Snapshot>& snapshots) = 0;
+    virtual void SetRetention(double retention_seconds) = 0;
     virtual int Count() = 0;
     virtual std::vector<Snapshot> Latest(int limit) = 0;
     virtual std::vector<Snapshot> Between(
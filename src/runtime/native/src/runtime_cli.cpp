@@ -1,16 +1,19 @@
 #include "aura_platform.h"
 #include "platform_internal.hpp"
 
+#include <algorithm>
+#include <array>
 #include <atomic>
 #include <chrono>
 #include <cctype>
 #include <cmath>
 #include <csignal>
+#include <cstdio>
 #include <cstring>
 #include <exception>
-#include <iomanip>
 #include <iostream>
 #include <limits>
+#include <memory>
 #include <optional>
 #include <sstream>
 #include <stdexcept>
@@ -47,18 +50,20 @@ struct CliOptions {
     std::optional<std::string> config_path;
 };
 
-std::string TrimCopy(std::string value) {
+std::string TrimCopy(const std::string& value) {
     auto is_space = [](const unsigned char ch) {
         return std::isspace(ch) != 0;
     };
 
-    while (!value.empty() && is_space(static_cast<unsigned char>(value.front()))) {
-        value.erase(value.begin());
+    std::size_t begin = 0;
+    std::size_t end = value.size();
+    while (begin < end && is_space(static_cast<unsigned char>(value[begin]))) {
+        ++begin;
     }
-    while (!value.empty() && is_space(static_cast<unsigned char>(value.back()))) {
-        value.pop_back();
+    while (end > begin && is_space(static_cast<unsigned char>(value[end - 1]))) {
+        --end;
     }
-    return value;
+    return value.substr(begin, end - begin);
 }
 
 void RequirePositiveFinite(const double value, const char* field_name) {
@@ -101,6 +106,12 @@ double ParseFiniteDouble(const std::string& raw, const char* field_name) {
     }
 }
 
+double ParsePositiveFinite(const std::string& raw, const char* field_name) {
+    const double parsed = ParseFiniteDouble(raw, field_name);
+    RequirePositiveFinite(parsed, field_name);
+    return parsed;
+}
+
 void PrintUsage() {
     std::cout
         << "Aura native platform runtime (Windows-first)\n"
@@ -142,15 +153,11 @@ CliOptions ParseArgs(const int argc, char** argv) {
         } else if (arg == "--watch") {
             options.watch = true;
         } else if (arg == "--interval") {
-            const double parsed = ParseFiniteDouble(require_value("--interval"), "interval");
-            RequirePositiveFinite(parsed, "interval");
-            options.interval_seconds = parsed;
+            options.interval_seconds = ParsePositiveFinite(require_value("--interval"), "interval");
         } else if (arg == "--count") {
             options.count = ParsePositiveInt(require_value("--count"), "count");
         } else if (arg == "--retention-seconds") {
-            const double parsed = ParseFiniteDouble(require_value("--retention-seconds"), "retention");
-            RequirePositiveFinite(parsed, "retention");
-            options.retention_seconds = parsed;
+            options.retention_seconds = ParsePositiveFinite(require_value("--retention-seconds"), "retention");
         } else if (arg == "--no-persist") {
             options.no_persist = true;
         } else if (arg == "--latest") {
@@ -195,25 +202,44 @@ CliOptions ParseArgs(const int argc, char** argv) {
     return options;
 }
 
-void PrintSnapshot(const aura::platform::Snapshot& snapshot, const bool output_json) {
-    if (output_json) {
-        std::cout
-            << "{\"cpu_percent\": " << std::fixed << std::setprecision(1) << snapshot.cpu_percent
-            << ", \"memory_percent\": " << std::fixed << std::setprecision(1) << snapshot.memory_percent
-            << ", \"disk_read_bps\": " << std::fixed << std::setprecision(1) << snapshot.disk_read_bps
-            << ", \"disk_write_bps\": " << std::fixed << std::setprecision(1) << snapshot.disk_write_bps
-            << ", \"timestamp\": " << std::setprecision(3) << snapshot.timestamp
-            << "}" << '\n';
-        return;
+// Formats one snapshot line (without the trailing newline) into `buffer` and
+// returns its length.  snprintf with fixed format strings avoids re-applying
+// stream manipulators for every field on every tick.
+std::size_t FormatSnapshot(
+    const aura::platform::Snapshot& snapshot,
+    const bool output_json,
+    char* buffer,
+    const std::size_t buffer_size
+) {
+    static constexpr const char* kJsonFormat =
+        "{\"cpu_percent\": %.1f, \"memory_percent\": %.1f, \"disk_read_bps\": %.1f, "
+        "\"disk_write_bps\": %.1f, \"timestamp\": %.3f}";
+    static constexpr const char* kTextFormat =
+        "cpu=%.1f%% mem=%.1f%% disk_read_bps=%.1f disk_write_bps=%.1f ts=%.3f";
+
+    const int written = std::snprintf(
+        buffer,
+        buffer_size,
+        output_json ? kJsonFormat : kTextFormat,
+        snapshot.cpu_percent,
+        snapshot.memory_percent,
+        snapshot.disk_read_bps,
+        snapshot.disk_write_bps,
+        snapshot.timestamp
+    );
+    if (written <= 0) {
+        return 0;
     }
+    return std::min(static_cast<std::size_t>(written), buffer_size - 1);
+}
 
-    std::cout
-        << "cpu=" << std::fixed << std::setprecision(1) << snapshot.cpu_percent << "% "
-        << "mem=" << std::fixed << std::setprecision(1) << snapshot.memory_percent << "% "
-        << "disk_read_bps=" << std::fixed << std::setprecision(1) << snapshot.disk_read_bps << " "
-        << "disk_write_bps=" << std::fixed << std::setprecision(1) << snapshot.disk_write_bps << " "
-        << "ts=" << std::setprecision(3) << snapshot.timestamp
-        << '\n';
+void PrintSnapshot(const aura::platform::Snapshot& snapshot, const bool output_json) {
+    // Large byte rates print with every integer digit, so size for the worst
+    // case rather than a typical line.
+    char line[2048];
+    const std::size_t length = FormatSnapshot(snapshot, output_json, line, sizeof(line));
+    line[length] = '\n';
+    std::cout.write(line, static_cast<std::streamsize>(length + 1));
 }
 
 std::vector<aura::platform::Snapshot> LoadSnapshots(
@@ -270,6 +296,216 @@ std::vector<aura::platform::Snapshot> LoadSnapshots(
     return snapshots;
 }
 
+// Watch mode buffers samples and persists them in batches: every
+// kFlushEverySamples samples or kFlushIntervalSeconds, whichever comes first,
+// and once more on exit.
+constexpr std::size_t kFlushEverySamples = 64;
+constexpr double kFlushIntervalSeconds = 2.0;
+
+// Watch output at sub-100ms intervals is flushed to the console every
+// kStdoutFlushEveryLines lines or kStdoutFlushIntervalSeconds instead of per
+// line; slower intervals still flush each line as soon as it is printed.
+constexpr int kStdoutFlushEveryLines = 64;
+constexpr double kStdoutFlushIntervalSeconds = 0.1;
+
+aura_snapshot_t ToAbiSnapshot(const aura::platform::Snapshot& snapshot) {
+    aura_snapshot_t raw{};
+    raw.timestamp = snapshot.timestamp;
+    raw.cpu_percent = snapshot.cpu_percent;
+    raw.memory_percent = snapshot.memory_percent;
+    raw.disk_read_bps = snapshot.disk_read_bps;
+    raw.disk_write_bps = snapshot.disk_write_bps;
+    return raw;
+}
+
+// Writes the pending batch and clears it.  On failure persistence is disabled
+// for the rest of the run, matching the single-append behaviour, and the
+// reason is returned rather than printed so the caller decides which thread
+// reports it.
+std::optional<std::string> FlushPending(aura_store_t*& store, std::vector<aura_snapshot_t>& pending) {
+    if (store == nullptr || pending.empty()) {
+        pending.clear();
+        return std::nullopt;
+    }
+
+    aura_error_t err{};
+    const int rc = aura_store_append_many(
+        store, pending.data(), static_cast<int>(pending.size()), nullptr, &err
+    );
+    pending.clear();
+    if (rc != AURA_OK) {
+        aura_store_close(store);
+        store = nullptr;
+        return std::string(err.message[0] != '\0' ? err.message : "store append failed");
+    }
+    return std::nullopt;
+}
+
+// Long watch runs re-resolve the config this often so retention edits in
+// aura.toml apply without a restart.  Each check is a full
+// ResolveRuntimeConfig: the env reads, the default-path cache check and, for
+// an unchanged file, a last_write_time and a file_size call plus a parse-cache
+// hit.  That is cheap at this cadence, so the result is not cached further.
+constexpr double kConfigRevalidateSeconds = 30.0;
+
+void RevalidateRetention(
+    const aura_config_request_t& config_request,
+    aura_store_t* store,
+    double& retention_seconds
+) {
+    aura_runtime_config_t refreshed{};
+    aura_error_t err{};
+    if (aura_config_resolve(&config_request, &refreshed, &err) != AURA_OK) {
+        // Keep serving the last good config while the file is mid-edit.
+        return;
+    }
+    if (refreshed.retention_seconds == retention_seconds) {
+        return;
+    }
+    if (aura_store_set_retention(store, refreshed.retention_seconds, &err) == AURA_OK) {
+        retention_seconds = refreshed.retention_seconds;
+    }
+}
+
+// Lock-free single-producer/single-consumer ring between the watch loop and
+// the store writer thread.  Each index is written by one side only, so a
+// push or pop is one acquire load and one release store.
+class SnapshotRing {
+  public:
+    bool TryPush(const aura_snapshot_t& snapshot) {
+        const std::size_t head = head_.load(std::memory_order_relaxed);
+        if (head - tail_.load(std::memory_order_acquire) == kCapacity) {
+            return false;
+        }
+        slots_[head & (kCapacity - 1)] = snapshot;
+        head_.store(head + 1, std::memory_order_release);
+        return true;
+    }
+
+    bool TryPop(aura_snapshot_t& snapshot) {
+        const std::size_t tail = tail_.load(std::memory_order_relaxed);
+        if (tail == head_.load(std::memory_order_acquire)) {
+            return false;
+        }
+        snapshot = slots_[tail & (kCapacity - 1)];
+        tail_.store(tail + 1, std::memory_order_release);
+        return true;
+    }
+
+  private:
+    static constexpr std::size_t kCapacity = 1024;
+    static_assert((kCapacity & (kCapacity - 1)) == 0, "capacity must be a power of two");
+
+    std::array<aura_snapshot_t, kCapacity> slots_{};
+    alignas(64) std::atomic<std::size_t> head_{0};
+    alignas(64) std::atomic<std::size_t> tail_{0};
+};
+
+// Owns the store for a watch run.  The sampling loop only pushes into the
+// ring; batching, appends, retention revalidation and any compaction the
+// store does all happen on the writer thread, so disk I/O never delays a
+// sample.  The writer thread never touches the console streams: a failure is
+// recorded and reported by the sampling thread through TakeFailure().
+class StoreWriter {
+  public:
+    StoreWriter(aura_store_t* store, const aura_config_request_t& config_request, double retention_seconds)
+        : store_(store),
+          config_request_(config_request),
+          retention_seconds_(retention_seconds),
+          thread_([this]() { Run(); }) {}
+
+    StoreWriter(const StoreWriter&) = delete;
+    StoreWriter& operator=(const StoreWriter&) = delete;
+
+    ~StoreWriter() {
+        Stop();
+    }
+
+    // Waits only if the writer has fallen a full ring behind.
+    void Push(const aura_snapshot_t& snapshot) {
+        while (!ring_.TryPush(snapshot)) {
+            std::this_thread::yield();
+        }
+    }
+
+    // Drains and persists everything pushed so far, then closes the store.
+    void Stop() {
+        if (thread_.joinable()) {
+            stop_requested_.store(true, std::memory_order_release);
+            thread_.join();
+        }
+    }
+
+    // Returns the reason persistence was disabled, once.  Call from the
+    // sampling thread only.
+    std::optional<std::string> TakeFailure() {
+        if (failure_taken_ || !failed_.load(std::memory_order_acquire)) {
+            return std::nullopt;
+        }
+        failure_taken_ = true;
+        return failure_message_;
+    }
+
+  private:
+    static constexpr auto kIdleWait = std::chrono::milliseconds(20);
+
+    void Drain(std::vector<aura_snapshot_t>& pending) {
+        aura_snapshot_t snapshot{};
+        while (ring_.TryPop(snapshot)) {
+            if (store_ != nullptr) {
+                pending.push_back(snapshot);
+            }
+        }
+    }
+
+    void Run() {
+        // Persistence can lag a little; sampling cadence should not.
+        SetThreadPriority(GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL);
+        std::vector<aura_snapshot_t> pending;
+        pending.reserve(kFlushEverySamples);
+        auto last_flush = std::chrono::steady_clock::now();
+        auto last_config_check = last_flush;
+        while (!stop_requested_.load(std::memory_order_acquire)) {
+            Drain(pending);
+            const auto now = std::chrono::steady_clock::now();
+            const std::chrono::duration<double> since_flush = now - last_flush;
+            if (pending.size() >= kFlushEverySamples || since_flush.count() >= kFlushIntervalSeconds) {
+                RecordFailure(FlushPending(store_, pending));
+                last_flush = now;
+            }
+            const std::chrono::duration<double> since_config_check = now - last_config_check;
+            if (store_ != nullptr && since_config_check.count() >= kConfigRevalidateSeconds) {
+                RevalidateRetention(config_request_, store_, retention_seconds_);
+                last_config_check = now;
+            }
+            std::this_thread::sleep_for(kIdleWait);
+        }
+        Drain(pending);
+        RecordFailure(FlushPending(store_, pending));
+        aura_store_close(store_);
+        store_ = nullptr;
+    }
+
+    // A failed flush closes the store, so this runs at most once and the
+    // message is never written again after it is published.
+    void RecordFailure(std::optional<std::string> failure) {
+        if (failure.has_value() && !failed_.load(std::memory_order_relaxed)) {
+            failure_message_ = std::move(*failure);
+            failed_.store(true, std::memory_order_release);
+        }
+    }
+
+    SnapshotRing ring_;
+    aura_store_t* store_;
+    const aura_config_request_t& config_request_;
+    double retention_seconds_;
+    std::atomic<bool> stop_requested_{false};
+    std::string failure_message_;
+    std::atomic<bool> failed_{false};
+    bool failure_taken_ = false;
+    std::thread thread_;
+};
+
 aura::platform::Snapshot CollectSnapshotViaApi() {
     aura_snapshot_t raw{};
     aura_error_t err{};
@@ -292,6 +528,11 @@ aura::platform::Snapshot CollectSnapshotViaApi() {
 int main(int argc, char** argv) {
     try {
         SetConsoleCtrlHandler(CtrlHandler, TRUE);
+        // cout and cerr are only ever used from this thread (the store writer
+        // reports failures back through StoreWriter::TakeFailure), so
+        // decoupling them from C stdio lets cout buffer whole lines instead
+        // of forwarding each write.
+        std::ios::sync_with_stdio(false);
 
         const CliOptions options = ParseArgs(argc, argv);
 
@@ -336,34 +577,63 @@ int main(int argc, char** argv) {
             const auto snapshots = LoadSnapshots(store, options.latest, options.since, options.until);
             for (const auto& snapshot : snapshots) {
                 PrintSnapshot(snapshot, options.output_json);
+                if (std::cout.fail()) {
+                    break;
+                }
             }
             aura_store_close(store);
             return 0;
         }
 
         if (options.watch) {
+            // Keep the sampling cadence steady on a loaded machine.  This is
+            // best effort: without the right, the loop runs at normal priority.
+            SetThreadPriority(GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL);
             std::optional<int> remaining = options.count;
+            std::unique_ptr<StoreWriter> writer;
+            if (store != nullptr) {
+                writer = std::make_unique<StoreWriter>(store, config_request, config.retention_seconds);
+                store = nullptr;
+            }
+            const auto report_store_failure = [&writer]() {
+                if (const auto failure = writer->TakeFailure()) {
+                    std::cerr << "DVR persistence disabled: " << *failure << '\n';
+                }
+            };
+            const bool flush_every_line = options.interval_seconds >= kStdoutFlushIntervalSeconds;
+            int unflushed_lines = 0;
+            auto last_stdout_flush = std::chrono::steady_clock::now();
+            // Samples are paced against the monotonic clock: each one is due
+            // a fixed interval after the previous deadline, so collection
+            // and printing time do not stretch the period and wall-clock
+            // adjustments do not disturb it.  Snapshot timestamps stay
+            // wall-clock.
+            const auto sample_interval = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+                std::chrono::duration<double>(options.interval_seconds)
+            );
+            auto next_sample_at = last_stdout_flush;
             while (!g_stop_requested.load()) {
                 aura::platform::Snapshot snapshot = CollectSnapshotViaApi();
-                if (store != nullptr) {
-                    aura_snapshot_t raw{};
-                    raw.timestamp = snapshot.timestamp;
-                    raw.cpu_percent = snapshot.cpu_percent;
-                    raw.memory_percent = snapshot.memory_percent;
-                    raw.disk_read_bps = snapshot.disk_read_bps;
-                    raw.disk_write_bps = snapshot.disk_write_bps;
-                    const int rc = aura_store_append(store, &raw, &err);
-                    if (rc != AURA_OK) {
-                        std::cerr << "DVR persistence disabled: "
-                                  << (err.message[0] != '\0' ? err.message : "store append failed")
-                                  << '\n';
-                        aura_store_close(store);
-                        store = nullptr;
-                    }
+                if (writer != nullptr) {
+                    writer->Push(ToAbiSnapshot(snapshot));
+                    report_store_failure();
                 }
 
                 PrintSnapshot(snapshot, options.output_json);
-                std::cout.flush();
+                ++unflushed_lines;
+                const auto printed_at = std::chrono::steady_clock::now();
+                const std::chrono::duration<double> since_stdout_flush = printed_at - last_stdout_flush;
+                if (flush_every_line || unflushed_lines >= kStdoutFlushEveryLines ||
+                    since_stdout_flush.count() >= kStdoutFlushIntervalSeconds) {
+                    std::cout.flush();
+                    unflushed_lines = 0;
+                    last_stdout_flush = printed_at;
+                }
+                // A closed consumer (e.g. `aura --watch | head`) leaves the
+                // stream failed; one state check ends the loop cleanly.
+                if (std::cout.fail()) {
+                    break;
+                }
 
                 if (remaining.has_value()) {
                     *remaining -= 1;
@@ -372,22 +642,23 @@ int main(int argc, char** argv) {
                     }
                 }
 
-                const auto sleep_ms = static_cast<int>(options.interval_seconds * 1000.0);
-                std::this_thread::sleep_for(std::chrono::milliseconds(sleep_ms));
+                // After a stall, resume from now instead of sampling in a
+                // burst to catch up.
+                next_sample_at = std::max(next_sample_at + sample_interval, std::chrono::steady_clock::now());
+                std::this_thread::sleep_until(next_sample_at);
             }
 
-            aura_store_close(store);
+            std::cout.flush();
+            if (writer != nullptr) {
+                writer->Stop();
+                report_store_failure();
+            }
             return 0;
         }
 
         aura::platform::Snapshot snapshot = CollectSnapshotViaApi();
         if (store != nullptr) {
-            aura_snapshot_t raw{};
-            raw.timestamp = snapshot.timestamp;
-            raw.cpu_percent = snapshot.cpu_percent;
-            raw.memory_percent = snapshot.memory_percent;
-            raw.disk_read_bps = snapshot.disk_read_bps;
-            raw.disk_write_bps = snapshot.disk_write_bps;
+            const aura_snapshot_t raw = ToAbiSnapshot(snapshot);
             const int rc = aura_store_append(store, &raw, &err);
             if (rc != AURA_OK) {
                 std::cerr << "DVR persistence disabled: "
@@ -1,6 +1,9 @@
 #include "platform_internal.hpp"
 
 #include <algorithm>
+#include <array>
+#include <charconv>
+#include <cstddef>
 #include <cstring>
 #include <filesystem>
 #include <fstream>
@@ -93,6 +96,23 @@ void ReplaceFileAtomically(
 #endif
 }
 
+// New samples are appended to the end of the store file, so it must end on a
+// line boundary; a hand-edited or truncated file is rewritten on open.
+bool EndsWithNewlineOrEmpty(const std::string& path) {
+    std::ifstream input(path, std::ios::binary | std::ios::ate);
+    if (!input.is_open()) {
+        return true;
+    }
+    const std::streamoff size = input.tellg();
+    if (size <= 0) {
+        return true;
+    }
+    input.seekg(-1, std::ios::end);
+    char last = '\0';
+    input.get(last);
+    return last == '\n';
+}
+
 Snapshot ParseSnapshotLine(const std::string& line) {
     std::istringstream input(line);
     std::string ts_raw;
@@ -129,12 +149,28 @@ Snapshot ParseSnapshotLine(const std::string& line) {
     return out;
 }
 
-std::string SerializeSnapshotLine(const Snapshot& snapshot) {
-    std::ostringstream output;
-    output.precision(17);
-    output << snapshot.timestamp << ',' << snapshot.cpu_percent << ',' << snapshot.memory_percent
-           << ',' << snapshot.disk_read_bps << ',' << snapshot.disk_write_bps;
-    return output.str();
+// Appends one newline-terminated row to `out`.  Fields are written with
+// std::to_chars in the same %.17g form the stream-based writer produced, so
+// rows are built without a stream or a temporary string per snapshot.
+void AppendSnapshotLine(std::string& out, const Snapshot& snapshot) {
+    const double fields[] = {
+        snapshot.timestamp,
+        snapshot.cpu_percent,
+        snapshot.memory_percent,
+        snapshot.disk_read_bps,
+        snapshot.disk_write_bps,
+    };
+    std::array<char, 32> buffer{};
+    for (std::size_t i = 0; i < std::size(fields); ++i) {
+        if (i > 0) {
+            out.push_back(',');
+        }
+        const auto result = std::to_chars(
+            buffer.data(), buffer.data() + buffer.size(), fields[i], std::chars_format::general, 17
+        );
+        out.append(buffer.data(), result.ptr);
+    }
+    out.push_back('\n');
 }
 
 class FileBackedStore final : public TelemetryStore {
@@ -157,30 +193,54 @@ class FileBackedStore final : public TelemetryStore {
                 migrated_legacy_sqlite = true;
             }
             const bool had_parse_failures = LoadFromDisk();
-            const bool pruned = PruneExpiredLocked();
-            if (migrated_legacy_sqlite || had_parse_failures || pruned) {
-                RewriteAllLocked();
+            stale_lines_on_disk_ = PruneExpiredLocked();
+            if (migrated_legacy_sqlite || had_parse_failures || !EndsWithNewlineOrEmpty(db_path_)) {
+                WriteStoreFile(snapshots_);
+                stale_lines_on_disk_ = 0;
+            } else {
+                std::lock_guard<std::mutex> io_lock(io_mu_);
+                CompactIfDue();
             }
         }
     }
 
     void Append(const Snapshot& snapshot) override {
         ValidateSnapshot(snapshot);
+        CommitAppended(&snapshot, &snapshot + 1);
+    }
 
-        std::lock_guard<std::mutex> lock(mu_);
-        snapshots_.push_back(snapshot);
-        PruneExpiredLocked();
-        if (db_path_ != ":memory:") {
-            RewriteAllLocked();
+    // Appends a batch with a single prune and a single write to the backing
+    // file.  The whole batch is validated first so a bad sample rejects it
+    // without a partial write.  The returned row count comes from the
+    // in-memory rows, so callers need no separate Count() round trip.
+    int AppendMany(const std::vector<Snapshot>& snapshots) override {
+        if (snapshots.empty()) {
+            return Count();
+        }
+        for (const Snapshot& snapshot : snapshots) {
+            ValidateSnapshot(snapshot);
+        }
+
+        return CommitAppended(snapshots.data(), snapshots.data() + snapshots.size());
+    }
+
+    // Applies a new retention window in place; samples that fall outside it
+    // are pruned immediately.
+    void SetRetention(const double retention_seconds) override {
+        ValidatePositiveFinite(retention_seconds, "retention_seconds");
+
+        std::lock_guard<std::mutex> io_lock(io_mu_);
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            retention_seconds_ = retention_seconds;
+            stale_lines_on_disk_ += PruneExpiredLocked();
         }
+        CompactIfDue();
     }
 
     int Count() override {
         std::lock_guard<std::mutex> lock(mu_);
-        const bool pruned = PruneExpiredLocked();
-        if (pruned && db_path_ != ":memory:") {
-            RewriteAllLocked();
-        }
+        stale_lines_on_disk_ += PruneExpiredLocked();
         return static_cast<int>(snapshots_.size());
     }
 
@@ -190,10 +250,7 @@ class FileBackedStore final : public TelemetryStore {
         }
 
         std::lock_guard<std::mutex> lock(mu_);
-        const bool pruned = PruneExpiredLocked();
-        if (pruned && db_path_ != ":memory:") {
-            RewriteAllLocked();
-        }
+        stale_lines_on_disk_ += PruneExpiredLocked();
 
         const int start = std::max<int>(0, static_cast<int>(snapshots_.size()) - limit);
         return std::vector<Snapshot>(snapshots_.begin() + start, snapshots_.end());
@@ -214,9 +271,20 @@ class FileBackedStore final : public TelemetryStore {
         }
 
         std::lock_guard<std::mutex> lock(mu_);
-        const bool pruned = PruneExpiredLocked();
-        if (pruned && db_path_ != ":memory:") {
-            RewriteAllLocked();
+        stale_lines_on_disk_ += PruneExpiredLocked();
+
+        if (timestamps_sorted_) {
+            // Rows are in timestamp order, so the window is one contiguous
+            // range found by binary search.
+            const auto first = start_timestamp.has_value()
+                                   ? std::lower_bound(
+                                         snapshots_.begin(), snapshots_.end(), *start_timestamp, TimestampBefore
+                                     )
+                                   : snapshots_.begin();
+            const auto last = end_timestamp.has_value()
+                                  ? std::upper_bound(first, snapshots_.end(), *end_timestamp, TimestampAfter)
+                                  : snapshots_.end();
+            return std::vector<Snapshot>(first, last);
         }
 
         std::vector<Snapshot> out;
@@ -302,9 +370,111 @@ class FileBackedStore final : public TelemetryStore {
         return parse_failures > 0;
     }
 
-    bool PruneExpiredLocked() {
+    // Group commit for the file store: each call appends its samples to the
+    // file in one write, and expired rows stay on disk until enough
+    // accumulate to justify one atomic rewrite.
+    //
+    // Locking: io_mu_ serialises everything that touches the store file and
+    // is always taken before mu_.  mu_ only guards the in-memory rows, so
+    // readers never wait behind disk I/O; they prune in memory and leave any
+    // compaction to the next writer.
+    int CommitAppended(const Snapshot* begin, const Snapshot* end) {
+        std::lock_guard<std::mutex> io_lock(io_mu_);
+        int row_count = 0;
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            if (timestamps_sorted_) {
+                timestamps_sorted_ = AppendKeepsTimestampOrderLocked(begin, end);
+            }
+            snapshots_.insert(snapshots_.end(), begin, end);
+            stale_lines_on_disk_ += PruneExpiredLocked();
+            row_count = static_cast<int>(snapshots_.size());
+        }
+        if (db_path_ == ":memory:") {
+            return row_count;
+        }
+        AppendLines(begin, end);
+        CompactIfDue();
+        return row_count;
+    }
+
+    // Requires io_mu_.
+    void CompactIfDue() {
+        if (db_path_ == ":memory:") {
+            return;
+        }
+
+        std::vector<Snapshot> rows;
+        std::size_t compacted_stale = 0;
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            const std::size_t threshold = std::max(kMinStaleLinesBeforeCompaction, snapshots_.size() / 4);
+            if (stale_lines_on_disk_ < threshold) {
+                return;
+            }
+            rows = snapshots_;
+            compacted_stale = stale_lines_on_disk_;
+        }
+
+        WriteStoreFile(rows);
+
+        // Readers may have pruned more rows while the file was written; those
+        // are still on disk and stay counted.
+        std::lock_guard<std::mutex> lock(mu_);
+        stale_lines_on_disk_ -= compacted_stale;
+    }
+
+    // Requires io_mu_.
+    void AppendLines(const Snapshot* begin, const Snapshot* end) {
+        std::string batch;
+        batch.reserve(static_cast<std::size_t>(end - begin) * 96U);
+        for (const Snapshot* it = begin; it != end; ++it) {
+            AppendSnapshotLine(batch, *it);
+        }
+
+        std::ofstream output(db_path_, std::ios::app | std::ios::binary);
+        if (!output.is_open()) {
+            throw std::runtime_error("Unable to append to telemetry store at: " + db_path_);
+        }
+        output.write(batch.data(), static_cast<std::streamsize>(batch.size()));
+        output.flush();
+        if (!output.good()) {
+            throw std::runtime_error("Unable to append to telemetry store at: " + db_path_);
+        }
+    }
+
+    static bool TimestampBefore(const Snapshot& snapshot, const double timestamp) {
+        return snapshot.timestamp < timestamp;
+    }
+
+    static bool TimestampAfter(const double timestamp, const Snapshot& snapshot) {
+        return timestamp < snapshot.timestamp;
+    }
+
+    // Requires mu_.  True when appending [begin, end) leaves the rows in
+    // non-decreasing timestamp order.
+    bool AppendKeepsTimestampOrderLocked(const Snapshot* begin, const Snapshot* end) const {
+        double previous = snapshots_.empty() ? begin->timestamp : snapshots_.back().timestamp;
+        for (const Snapshot* it = begin; it != end; ++it) {
+            if (it->timestamp < previous) {
+                return false;
+            }
+            previous = it->timestamp;
+        }
+        return true;
+    }
+
+    std::size_t PruneExpiredLocked() {
         const std::size_t before = snapshots_.size();
         const double cutoff = NowUnixSeconds() - retention_seconds_;
+        if (timestamps_sorted_) {
+            // Expired rows form a prefix; an unexpired store costs one search.
+            snapshots_.erase(
+                snapshots_.begin(),
+                std::lower_bound(snapshots_.begin(), snapshots_.end(), cutoff, TimestampBefore)
+            );
+            return before - snapshots_.size();
+        }
         snapshots_.erase(
             std::remove_if(
                 snapshots_.begin(),
@@ -313,10 +483,12 @@ class FileBackedStore final : public TelemetryStore {
             ),
             snapshots_.end()
         );
-        return snapshots_.size() != before;
+        return before - snapshots_.size();
     }
 
-    void RewriteAllLocked() {
+    // Atomically replaces the store file with `rows`.  Requires io_mu_ (or
+    // the constructor).
+    void WriteStoreFile(const std::vector<Snapshot>& rows) {
         if (db_path_ == ":memory:") {
             return;
         }
@@ -328,8 +500,11 @@ class FileBackedStore final : public TelemetryStore {
         if (!output.is_open()) {
             throw std::runtime_error("Unable to write telemetry temp store at: " + temp_path.string());
         }
-        for (const Snapshot& snapshot : snapshots_) {
-            output << SerializeSnapshotLine(snapshot) << '\n';
+        std::string line;
+        for (const Snapshot& snapshot : rows) {
+            line.clear();
+            AppendSnapshotLine(line, snapshot);
+            output.write(line.data(), static_cast<std::streamsize>(line.size()));
         }
 
         output.flush();
@@ -347,10 +522,19 @@ class FileBackedStore final : public TelemetryStore {
         ReplaceFileAtomically(temp_path, db_path, db_path_);
     }
 
+    // Compaction waits for at least this many expired rows, or a quarter of
+    // the live rows when that is larger.
+    static constexpr std::size_t kMinStaleLinesBeforeCompaction = 256;
+
     std::string db_path_;
     double retention_seconds_;
+    std::mutex io_mu_;
     std::mutex mu_;
     std::vector<Snapshot> snapshots_;
+    // Rows are loaded sorted and normally appended in time order; an
+    // out-of-order append clears this and the scans fall back to linear.
+    bool timestamps_sorted_ = true;
+    std::size_t stale_lines_on_disk_ = 0;
 };
 
 } // namespace
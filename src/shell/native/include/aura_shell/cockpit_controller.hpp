@@ -1,6 +1,8 @@
 #pragma once
 
+#include <chrono>
 #include <cstddef>
+#include <future>
 #include <memory>
 #include <optional>
 #include <string>
@@ -21,9 +23,15 @@ public:
         std::optional<std::string> db_path;
         std::size_t timeline_live_capacity{120};
         double timeline_window_seconds{300.0};
-        int timeline_resolution{64};
         std::size_t timeline_refresh_ticks{5};
+        // When positive, the DVR timeline is re-queried at most once per this
+        // many seconds of tick time instead of every timeline_refresh_ticks.
+        double timeline_refresh_interval_seconds{0.0};
+        int timeline_resolution{64};
         bool prefer_dvr_timeline{true};
+        // Enumerate processes on a worker thread at poll_interval_seconds
+        // instead of on every tick; ticks use the latest finished sample.
+        bool background_process_refresh{false};
     };
 
     CockpitController(
@@ -41,6 +49,11 @@ public:
     const CockpitUiState& last_state() const;
 
 private:
+    struct ProcessCollection {
+        std::vector<ProcessSample> samples;
+        std::string error;
+    };
+
     static double now_seconds();
     static double clamp_percent(double value);
     static SnapshotLines fallback_snapshot_lines(double timestamp, double cpu_percent, double memory_percent);
@@ -57,8 +70,9 @@ private:
         double cpu_percent,
         double memory_percent
     );
+    ProcessCollection collect_processes_now() const;
+    ProcessCollection latest_processes();
     void append_live_timeline_point(double timestamp, double cpu_percent, double memory_percent);
-    std::vector<TimelinePoint> copy_live_timeline_window(double now_timestamp) const;
     void populate_timeline_state(CockpitUiState& state, std::optional<std::string>& stream_error);
     std::string fallback_status_line(const std::optional<std::string>& error) const;
     CockpitUiState degraded_from_last_state(double timestamp, const std::string& reason) const;
@@ -69,11 +83,18 @@ private:
     Config config_;
     double frame_phase_{0.0};
     std::size_t ticks_since_timeline_query_{0U};
+    double last_timeline_query_timestamp_{0.0};
     bool has_dvr_timeline_cache_{false};
     std::vector<TimelinePoint> live_timeline_points_;
     std::vector<TimelinePoint> dvr_timeline_cache_;
     bool has_last_good_state_{false};
     CockpitUiState last_state_{};
+    // Declared after the bridges so an in-flight refresh is joined before
+    // the telemetry bridge it uses is destroyed.
+    std::future<ProcessCollection> process_refresh_;
+    std::chrono::steady_clock::time_point next_process_refresh_{};
+    bool has_cached_processes_{false};
+    ProcessCollection cached_processes_;
 };
 
 }  // namespace aura::shell
@@ -24,6 +24,10 @@ enum class PanelId : std::size_t {
 struct DockState {
     std::array<std::vector<PanelId>, 3> slot_tabs{};
     std::array<std::size_t, 3> active_tab{};
+    // Reverse index of slot_tabs: the slot each panel is docked in.  It is a
+    // hint only; slot_tabs stays authoritative, so a default-constructed or
+    // hand-filled state with no (or a stale) hint still resolves correctly.
+    std::array<std::optional<DockSlot>, 4> panel_slot{};
 };
 
 struct PanelMoveRequest {
@@ -32,13 +36,34 @@ struct PanelMoveRequest {
     std::optional<std::size_t> to_index;
 };
 
-std::array<PanelId, 4> all_panel_ids();
-std::array<DockSlot, 3> all_dock_slots();
+// The id sets are compile-time constants, so iterating them or checking an
+// id against them needs no call and no allocation.
+constexpr std::array<PanelId, 4> all_panel_ids() {
+    return {
+        PanelId::TelemetryOverview,
+        PanelId::TopProcesses,
+        PanelId::DvrTimeline,
+        PanelId::RenderSurface,
+    };
+}
+
+constexpr std::array<DockSlot, 3> all_dock_slots() {
+    return {DockSlot::Left, DockSlot::Center, DockSlot::Right};
+}
+
+constexpr bool is_valid_dock_slot(const DockSlot slot) {
+    return static_cast<std::size_t>(slot) < all_dock_slots().size();
+}
 
 DockState build_default_dock_state();
 DockState move_panel(const DockState& state, const PanelMoveRequest& request);
 DockState set_active_tab(const DockState& state, DockSlot slot, std::size_t tab_index);
+// In-place variants: only the touched slots are modified, and the request is
+// validated before anything changes, so `state` is left intact on throw.
+DockState move_panel(DockState&& state, const PanelMoveRequest& request);
+DockState set_active_tab(DockState&& state, DockSlot slot, std::size_t tab_index);
 std::optional<PanelId> active_panel(const DockState& state, DockSlot slot);
+std::optional<DockSlot> find_panel_slot(const DockState& state, PanelId panel_id);
 
 std::string_view to_string(DockSlot slot);
 std::string_view to_string(PanelId panel_id);
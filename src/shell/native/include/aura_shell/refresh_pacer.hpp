@@ -0,0 +1,53 @@
+#pragma once
+
+#include <chrono>
+#include <string>
+
+#include "aura_shell/cockpit_types.hpp"
+
+namespace aura::shell {
+
+// Picks the cockpit refresh timer interval.  The timer follows the
+// recommended frame delay until the telemetry the user can see has held still
+// for idle_after, then backs off to at least idle_interval_ms; the next real
+// change restores the recommended delay.
+//
+// The phase-driven style tokens are ignored, and CPU and memory percentages
+// count as changed only once they move percent_tolerance points away from the
+// value seen at the last change, so per-tick sampling jitter is not activity.
+class RefreshPacer {
+public:
+    struct Config {
+        std::chrono::milliseconds idle_after{2000};
+        int idle_interval_ms{250};
+        double percent_tolerance{0.5};
+    };
+
+    using Clock = std::chrono::steady_clock;
+
+    RefreshPacer();
+    explicit RefreshPacer(Config config);
+
+    // Records `state` as seen at `now` and returns the timer interval to use
+    // until the next tick.
+    int next_interval_ms(const CockpitUiState& state, Clock::time_point now);
+
+    bool idle(Clock::time_point now) const;
+
+private:
+    bool inputs_changed(const CockpitUiState& state) const;
+    void remember_inputs(const CockpitUiState& state);
+
+    Config config_;
+    bool has_inputs_{false};
+    Clock::time_point last_change_{};
+    double cpu_percent_{0.0};
+    double memory_percent_{0.0};
+    int severity_level_{0};
+    int quality_hint_{0};
+    bool telemetry_available_{false};
+    bool render_available_{false};
+    std::string status_line_;
+};
+
+}  // namespace aura::shell
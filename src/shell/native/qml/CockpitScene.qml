@@ -29,6 +29,8 @@ Rectangle {
     // ── Smoothed animated values used by Canvas gauges ───────────────────────
     property real smoothCpu: 0.0
     property real smoothMem: 0.0
+    property real smoothCpuTarget: 0.0
+    property real smoothMemTarget: 0.0
 
     Behavior on smoothCpu {
         NumberAnimation { duration: Math.max(120, Math.round(600 * root.motionScale)); easing.type: Easing.OutCubic }
@@ -40,8 +42,26 @@ Rectangle {
         NumberAnimation { duration: Math.max(80, Math.round(400 * root.motionScale)); easing.type: Easing.OutCubic }
     }
 
-    onCpuPercentChanged:    { smoothCpu = cpuPercent;    cpuSparkCanvas.pushSample(cpuPercent) }
-    onMemoryPercentChanged: { smoothMem = memoryPercent; memSparkCanvas.pushSample(memoryPercent) }
+    // Sparklines take every sample.  The gauges only retarget once a value
+    // moves by gaugeStep: smaller changes are invisible on the arcs but would
+    // restart the smoothing animation and repaint both gauge canvases for
+    // its whole duration.  The percentage labels bind to the raw values.
+    readonly property real gaugeStep: 0.5
+
+    onCpuPercentChanged: {
+        cpuSparkCanvas.pushSample(cpuPercent)
+        if (Math.abs(cpuPercent - smoothCpuTarget) >= gaugeStep) {
+            smoothCpuTarget = cpuPercent
+            smoothCpu = cpuPercent
+        }
+    }
+    onMemoryPercentChanged: {
+        memSparkCanvas.pushSample(memoryPercent)
+        if (Math.abs(memoryPercent - smoothMemTarget) >= gaugeStep) {
+            smoothMemTarget = memoryPercent
+            smoothMem = memoryPercent
+        }
+    }
 
     // ── Derived accent color helpers ─────────────────────────────────────────
     function accentColor(alpha) {
@@ -82,6 +102,68 @@ Rectangle {
         )
     }
 
+    // Gauge colors are derived once per smoothed value change and shared by
+    // the glow and arc canvases instead of being rebuilt inside every onPaint.
+    readonly property color cpuGaugeColor: gaugeColor(smoothCpu, 1.0)
+    readonly property color cpuGaugeStartColor: gaugeColor(Math.max(0, smoothCpu * 0.5), 1.0)
+    readonly property color memGaugeColor: gaugeColor(smoothMem, 1.0)
+    readonly property color memGaugeStartColor: gaugeColor(Math.max(0, smoothMem * 0.5), 1.0)
+
+    // ── Gauge track helper ───────────────────────────────────────────────────
+    // Track and tick marks never change with the value, so they live on their
+    // own canvas and only repaint when the gauge is resized.
+    function paintGaugeTrack(ctx, w, h) {
+        ctx.clearRect(0, 0, w, h)
+        var cx = w / 2
+        var cy = h / 2
+        var r  = w / 2 - 10
+        var trackW = 11
+        var startAngle = Math.PI * 0.75            // 135°
+        var fullSweep  = Math.PI * 1.50            // 270°
+
+        ctx.beginPath()
+        ctx.arc(cx, cy, r, startAngle, startAngle + fullSweep, false)
+        ctx.strokeStyle = "#1a2940"
+        ctx.lineWidth   = trackW
+        ctx.lineCap     = "butt"
+        ctx.stroke()
+
+        // Tick marks at 25%, 50%, 75%
+        ctx.strokeStyle = "#0c1829"
+        ctx.lineWidth   = trackW + 2
+        var ticks = [0.25, 0.50, 0.75]
+        for (var i = 0; i < ticks.length; i++) {
+            var ta = startAngle + fullSweep * ticks[i]
+            ctx.beginPath()
+            ctx.arc(cx, cy, r, ta, ta + 0.012, false)
+            ctx.stroke()
+        }
+    }
+
+    // ── Sparkline geometry helpers ───────────────────────────────────────────
+    // Points are packed into one flat [x0, y0, x1, y1, ...] array so each paint
+    // allocates a single array instead of one {x, y} object per sample.
+    function packSparkPoints(samples, cw, ch, pad) {
+        var n = samples.length
+        var pts = new Array(n * 2)
+        var step = cw / (n - 1)
+        for (var i = 0; i < n; i++) {
+            pts[2 * i]     = i * step
+            pts[2 * i + 1] = ch - (samples[i] / 100.0) * ch + pad
+        }
+        return pts
+    }
+
+    function traceSparkCurve(ctx, pts) {
+        var last = pts.length - 2
+        ctx.moveTo(pts[0], pts[1])
+        for (var j = 2; j < last; j += 2) {
+            ctx.quadraticCurveTo(pts[j], pts[j + 1],
+                                 (pts[j] + pts[j + 2]) / 2, (pts[j + 1] + pts[j + 3]) / 2)
+        }
+        ctx.lineTo(pts[last], pts[last + 1])
+    }
+
     // ── Gauge size ────────────────────────────────────────────────────────────
     property real gaugeSize: Math.min(Math.max(root.width * 0.30, 110), 160)
 
@@ -205,7 +287,7 @@ Rectangle {
                         var startAngle = Math.PI * 0.75
                         var sweepAngle = Math.PI * 1.50 * (root.smoothCpu / 100.0)
 
-                        var gc = root.gaugeColor(root.smoothCpu, 1.0)
+                        var gc = root.cpuGaugeColor
                         ctx.beginPath()
                         ctx.arc(cx, cy, r, startAngle, startAngle + sweepAngle, false)
                         ctx.strokeStyle = Qt.rgba(gc.r, gc.g, gc.b, 0.30)
@@ -217,11 +299,20 @@ Rectangle {
                     Connections {
                         target: root
                         function onSmoothCpuChanged() { cpuGlowCanvas.requestPaint() }
-                        function onAccentIntensityChanged() { cpuGlowCanvas.requestPaint() }
                     }
                 }
 
-                // Main arc gauge canvas
+                // Static track layer
+                Canvas {
+                    id: cpuTrackCanvas
+                    anchors.centerIn: parent
+                    width:  parent.width
+                    height: parent.height
+
+                    onPaint: root.paintGaugeTrack(getContext("2d"), width, height)
+                }
+
+                // Main arc gauge canvas — value layer only
                 Canvas {
                     id: cpuArcCanvas
                     anchors.centerIn: parent
@@ -240,36 +331,16 @@ Rectangle {
                         var fullSweep  = Math.PI * 1.50            // 270°
                         var endAngle   = startAngle + fullSweep * (root.smoothCpu / 100.0)
 
-                        // Track arc
-                        ctx.beginPath()
-                        ctx.arc(cx, cy, r, startAngle, startAngle + fullSweep, false)
-                        ctx.strokeStyle = "#1a2940"
-                        ctx.lineWidth   = trackW
-                        ctx.lineCap     = "butt"
-                        ctx.stroke()
-
-                        // Tick marks at 25%, 50%, 75%
-                        ctx.strokeStyle = "#0c1829"
-                        ctx.lineWidth   = 2
-                        var ticks = [0.25, 0.50, 0.75]
-                        for (var i = 0; i < ticks.length; i++) {
-                            var ta = startAngle + fullSweep * ticks[i]
-                            ctx.beginPath()
-                            ctx.arc(cx, cy, r, ta, ta + 0.012, false)
-                            ctx.lineWidth = trackW + 2
-                            ctx.stroke()
-                        }
-
                         // Value arc
                         if (root.smoothCpu > 0.2) {
-                            var gc = root.gaugeColor(root.smoothCpu, 1.0)
+                            var gc = root.cpuGaugeColor
                             var grad = ctx.createLinearGradient(
                                 cx + r * Math.cos(startAngle),
                                 cy + r * Math.sin(startAngle),
                                 cx + r * Math.cos(endAngle),
                                 cy + r * Math.sin(endAngle)
                             )
-                            var gcStart = root.gaugeColor(Math.max(0, root.smoothCpu * 0.5), 1.0)
+                            var gcStart = root.cpuGaugeStartColor
                             grad.addColorStop(0.0, Qt.rgba(gcStart.r, gcStart.g, gcStart.b, 0.85))
                             grad.addColorStop(1.0, Qt.rgba(gc.r,      gc.g,      gc.b,      1.00))
 
@@ -293,7 +364,6 @@ Rectangle {
                     Connections {
                         target: root
                         function onSmoothCpuChanged() { cpuArcCanvas.requestPaint() }
-                        function onAccentIntensityChanged() { cpuArcCanvas.requestPaint() }
                     }
                 }
 
@@ -345,7 +415,7 @@ Rectangle {
                         var startAngle = Math.PI * 0.75
                         var sweepAngle = Math.PI * 1.50 * (root.smoothMem / 100.0)
 
-                        var gc = root.gaugeColor(root.smoothMem, 1.0)
+                        var gc = root.memGaugeColor
                         ctx.beginPath()
                         ctx.arc(cx, cy, r, startAngle, startAngle + sweepAngle, false)
                         ctx.strokeStyle = Qt.rgba(gc.r, gc.g, gc.b, 0.30)
@@ -357,10 +427,18 @@ Rectangle {
                     Connections {
                         target: root
                         function onSmoothMemChanged() { memGlowCanvas.requestPaint() }
-                        function onAccentIntensityChanged() { memGlowCanvas.requestPaint() }
                     }
                 }
 
+                Canvas {
+                    id: memTrackCanvas
+                    anchors.centerIn: parent
+                    width:  parent.width
+                    height: parent.height
+
+                    onPaint: root.paintGaugeTrack(getContext("2d"), width, height)
+                }
+
                 Canvas {
                     id: memArcCanvas
                     anchors.centerIn: parent
@@ -379,35 +457,16 @@ Rectangle {
                         var fullSweep  = Math.PI * 1.50
                         var endAngle   = startAngle + fullSweep * (root.smoothMem / 100.0)
 
-                        // Track arc
-                        ctx.beginPath()
-                        ctx.arc(cx, cy, r, startAngle, startAngle + fullSweep, false)
-                        ctx.strokeStyle = "#1a2940"
-                        ctx.lineWidth   = trackW
-                        ctx.lineCap     = "butt"
-                        ctx.stroke()
-
-                        // Tick marks
-                        ctx.strokeStyle = "#0c1829"
-                        var ticks = [0.25, 0.50, 0.75]
-                        for (var i = 0; i < ticks.length; i++) {
-                            var ta = startAngle + fullSweep * ticks[i]
-                            ctx.beginPath()
-                            ctx.arc(cx, cy, r, ta, ta + 0.012, false)
-                            ctx.lineWidth = trackW + 2
-                            ctx.stroke()
-                        }
-
                         // Value arc
                         if (root.smoothMem > 0.2) {
-                            var gc = root.gaugeColor(root.smoothMem, 1.0)
+                            var gc = root.memGaugeColor
                             var grad = ctx.createLinearGradient(
                                 cx + r * Math.cos(startAngle),
                                 cy + r * Math.sin(startAngle),
                                 cx + r * Math.cos(endAngle),
                                 cy + r * Math.sin(endAngle)
                             )
-                            var gcStart = root.gaugeColor(Math.max(0, root.smoothMem * 0.5), 1.0)
+                            var gcStart = root.memGaugeStartColor
                             grad.addColorStop(0.0, Qt.rgba(gcStart.r, gcStart.g, gcStart.b, 0.85))
                             grad.addColorStop(1.0, Qt.rgba(gc.r,      gc.g,      gc.b,      1.00))
 
@@ -431,7 +490,6 @@ Rectangle {
                     Connections {
                         target: root
                         function onSmoothMemChanged() { memArcCanvas.requestPaint() }
-                        function onAccentIntensityChanged() { memArcCanvas.requestPaint() }
                     }
                 }
 
@@ -517,6 +575,9 @@ Rectangle {
                 height: parent.height - 18
 
                 property var samples: []
+                // Fill gradient is rebuilt only when its height or colour changes.
+                property var fillGradient: null
+                property var fillGradientKey: null
 
                 function pushSample(val) {
                     samples.push(val)
@@ -535,23 +596,11 @@ Rectangle {
                     var cw  = width
                     var ch  = height - pad
 
-                    // Build point array
-                    var pts = []
-                    for (var i = 0; i < n; i++) {
-                        var x = (i / (n - 1)) * cw
-                        var y = ch - (samples[i] / 100.0) * ch + pad
-                        pts.push({x: x, y: y})
-                    }
+                    var pts = root.packSparkPoints(samples, cw, ch, pad)
 
                     // Filled gradient area
                     ctx.beginPath()
-                    ctx.moveTo(pts[0].x, pts[0].y)
-                    for (var j = 1; j < n - 1; j++) {
-                        var mx = (pts[j].x + pts[j+1].x) / 2
-                        var my = (pts[j].y + pts[j+1].y) / 2
-                        ctx.quadraticCurveTo(pts[j].x, pts[j].y, mx, my)
-                    }
-                    ctx.lineTo(pts[n-1].x, pts[n-1].y)
+                    root.traceSparkCurve(ctx, pts)
                     ctx.lineTo(cw, ch + pad)
                     ctx.lineTo(0, ch + pad)
                     ctx.closePath()
@@ -559,30 +608,27 @@ Rectangle {
                     var acR = root.accentRed
                     var acG = root.accentGreen
                     var acB = root.accentBlue
-                    var fillGrad = ctx.createLinearGradient(0, 0, 0, ch)
-                    fillGrad.addColorStop(0.0, Qt.rgba(acR, acG, acB, 0.28))
-                    fillGrad.addColorStop(1.0, Qt.rgba(acR, acG, acB, 0.02))
-                    ctx.fillStyle   = fillGrad
+                    var gradKey = ch + "|" + acR + "|" + acG + "|" + acB
+                    if (fillGradient === null || fillGradientKey !== gradKey) {
+                        fillGradient = ctx.createLinearGradient(0, 0, 0, ch)
+                        fillGradient.addColorStop(0.0, Qt.rgba(acR, acG, acB, 0.28))
+                        fillGradient.addColorStop(1.0, Qt.rgba(acR, acG, acB, 0.02))
+                        fillGradientKey = gradKey
+                    }
+                    ctx.fillStyle   = fillGradient
                     ctx.fill()
 
                     // Crisp line on top
                     ctx.beginPath()
-                    ctx.moveTo(pts[0].x, pts[0].y)
-                    for (var k = 1; k < n - 1; k++) {
-                        var lmx = (pts[k].x + pts[k+1].x) / 2
-                        var lmy = (pts[k].y + pts[k+1].y) / 2
-                        ctx.quadraticCurveTo(pts[k].x, pts[k].y, lmx, lmy)
-                    }
-                    ctx.lineTo(pts[n-1].x, pts[n-1].y)
+                    root.traceSparkCurve(ctx, pts)
                     ctx.strokeStyle = Qt.rgba(acR, acG, acB, 0.70)
                     ctx.lineWidth   = 1.5
                     ctx.lineJoin    = "round"
                     ctx.stroke()
 
                     // Latest value dot
-                    var lp = pts[n-1]
                     ctx.beginPath()
-                    ctx.arc(lp.x, lp.y, 2.5, 0, Math.PI * 2, false)
+                    ctx.arc(pts[2 * n - 2], pts[2 * n - 1], 2.5, 0, Math.PI * 2, false)
                     ctx.fillStyle = Qt.rgba(acR, acG, acB, 1.0)
                     ctx.fill()
                 }
@@ -628,6 +674,9 @@ Rectangle {
                 height: parent.height - 18
 
                 property var samples: []
+                // Fill gradient is rebuilt only when its height or colour changes.
+                property var fillGradient: null
+                property var fillGradientKey: null
 
                 function pushSample(val) {
                     samples.push(val)
@@ -646,50 +695,35 @@ Rectangle {
                     var cw  = width
                     var ch  = height - pad
 
-                    var pts = []
-                    for (var i = 0; i < n; i++) {
-                        var x = (i / (n - 1)) * cw
-                        var y = ch - (samples[i] / 100.0) * ch + pad
-                        pts.push({x: x, y: y})
-                    }
+                    var pts = root.packSparkPoints(samples, cw, ch, pad)
 
                     // Filled area — memory uses a slightly warmer tint to visually separate
                     ctx.beginPath()
-                    ctx.moveTo(pts[0].x, pts[0].y)
-                    for (var j = 1; j < n - 1; j++) {
-                        var mx = (pts[j].x + pts[j+1].x) / 2
-                        var my = (pts[j].y + pts[j+1].y) / 2
-                        ctx.quadraticCurveTo(pts[j].x, pts[j].y, mx, my)
-                    }
-                    ctx.lineTo(pts[n-1].x, pts[n-1].y)
+                    root.traceSparkCurve(ctx, pts)
                     ctx.lineTo(cw, ch + pad)
                     ctx.lineTo(0, ch + pad)
                     ctx.closePath()
 
                     // Memory sparkline: tint shifted toward cyan regardless of accent
-                    var fillGrad = ctx.createLinearGradient(0, 0, 0, ch)
-                    fillGrad.addColorStop(0.0, Qt.rgba(0.15, 0.65, 0.78, 0.28))
-                    fillGrad.addColorStop(1.0, Qt.rgba(0.15, 0.65, 0.78, 0.02))
-                    ctx.fillStyle = fillGrad
+                    if (fillGradient === null || fillGradientKey !== ch) {
+                        fillGradient = ctx.createLinearGradient(0, 0, 0, ch)
+                        fillGradient.addColorStop(0.0, Qt.rgba(0.15, 0.65, 0.78, 0.28))
+                        fillGradient.addColorStop(1.0, Qt.rgba(0.15, 0.65, 0.78, 0.02))
+                        fillGradientKey = ch
+                    }
+                    ctx.fillStyle = fillGradient
                     ctx.fill()
 
                     ctx.beginPath()
-                    ctx.moveTo(pts[0].x, pts[0].y)
-                    for (var k = 1; k < n - 1; k++) {
-                        var lmx = (pts[k].x + pts[k+1].x) / 2
-                        var lmy = (pts[k].y + pts[k+1].y) / 2
-                        ctx.quadraticCurveTo(pts[k].x, pts[k].y, lmx, lmy)
-                    }
-                    ctx.lineTo(pts[n-1].x, pts[n-1].y)
+                    root.traceSparkCurve(ctx, pts)
                     ctx.strokeStyle = Qt.rgba(0.15, 0.65, 0.78, 0.70)
                     ctx.lineWidth   = 1.5
                     ctx.lineJoin    = "round"
                     ctx.stroke()
 
                     // Latest dot
-                    var lp = pts[n-1]
                     ctx.beginPath()
-                    ctx.arc(lp.x, lp.y, 2.5, 0, Math.PI * 2, false)
+                    ctx.arc(pts[2 * n - 2], pts[2 * n - 1], 2.5, 0, Math.PI * 2, false)
                     ctx.fillStyle = Qt.rgba(0.15, 0.65, 0.78, 1.0)
                     ctx.fill()
                 }
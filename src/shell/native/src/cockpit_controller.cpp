@@ -146,6 +146,10 @@ CockpitController::CockpitController(
     if (config_.timeline_refresh_ticks == 0U) {
         config_.timeline_refresh_ticks = 1U;
     }
+    if (!std::isfinite(config_.timeline_refresh_interval_seconds) ||
+        config_.timeline_refresh_interval_seconds < 0.0) {
+        config_.timeline_refresh_interval_seconds = 0.0;
+    }
 }
 
 CockpitUiState CockpitController::tick(
@@ -174,11 +178,9 @@ CockpitUiState CockpitController::tick(
     state.cpu_percent = clamp_percent(snapshot->cpu_percent);
     state.memory_percent = clamp_percent(snapshot->memory_percent);
 
-    std::vector<ProcessSample> processes;
-    std::string process_error;
-    if (telemetry_bridge_ != nullptr) {
-        processes = telemetry_bridge_->collect_top_processes(config_.max_process_rows, process_error);
-    }
+    ProcessCollection process_collection = latest_processes();
+    std::vector<ProcessSample>& processes = process_collection.samples;
+    const std::string& process_error = process_collection.error;
     if (processes.size() > config_.max_process_rows) {
         processes.resize(config_.max_process_rows);
     }
@@ -269,25 +271,28 @@ CockpitUiState CockpitController::tick(
         recommended_delay_ms(state.style_tokens.next_delay_seconds, state.quality_hint);
     state.fps_target = fps_from_delay_ms(state.fps_recommended_delay_ms);
 
-    SnapshotLines lines = fallback_snapshot_lines(state.timestamp, state.cpu_percent, state.memory_percent);
+    // The local fallback lines are only formatted when the render module
+    // cannot supply them.
+    std::optional<SnapshotLines> lines;
     if (state.render_available) {
-        const auto formatted = render_bridge_->format_snapshot_lines(
+        lines = render_bridge_->format_snapshot_lines(
             state.timestamp,
             state.cpu_percent,
             state.memory_percent,
             render_error
         );
-        if (formatted.has_value()) {
-            lines = *formatted;
-        } else {
+        if (!lines.has_value()) {
             state.render_available = false;
             state.degraded = true;
             stream_error = optional_or(stream_error, render_error);
         }
     }
-    state.cpu_line = lines.cpu;
-    state.memory_line = lines.memory;
-    state.timestamp_line = lines.timestamp;
+    if (!lines.has_value()) {
+        lines = fallback_snapshot_lines(state.timestamp, state.cpu_percent, state.memory_percent);
+    }
+    state.cpu_line = std::move(lines->cpu);
+    state.memory_line = std::move(lines->memory);
+    state.timestamp_line = std::move(lines->timestamp);
 
     if (processes.empty()) {
         state.process_rows.push_back("<no process samples>");
@@ -349,6 +354,45 @@ CockpitUiState CockpitController::tick(
     return state;
 }
 
+CockpitController::ProcessCollection CockpitController::collect_processes_now() const {
+    ProcessCollection out;
+    if (telemetry_bridge_ != nullptr) {
+        out.samples = telemetry_bridge_->collect_top_processes(config_.max_process_rows, out.error);
+    }
+    return out;
+}
+
+CockpitController::ProcessCollection CockpitController::latest_processes() {
+    if (!config_.background_process_refresh || telemetry_bridge_ == nullptr) {
+        return collect_processes_now();
+    }
+
+    if (process_refresh_.valid() &&
+        process_refresh_.wait_for(std::chrono::seconds(0)) == std::future_status::ready) {
+        cached_processes_ = process_refresh_.get();
+        has_cached_processes_ = true;
+    }
+
+    // Refreshes are due on absolute deadlines one poll interval apart, so
+    // the cadence does not slip by however late each tick happened to land.
+    // A deadline already in the past restarts from now instead of bursting
+    // to catch up.
+    const auto now = std::chrono::steady_clock::now();
+    const auto interval = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+        std::chrono::duration<double>(config_.poll_interval_seconds)
+    );
+    if (!has_cached_processes_) {
+        // The first tick collects inline so the panel never starts empty.
+        cached_processes_ = collect_processes_now();
+        has_cached_processes_ = true;
+        next_process_refresh_ = now + interval;
+    } else if (!process_refresh_.valid() && now >= next_process_refresh_) {
+        process_refresh_ = std::async(std::launch::async, [this]() { return collect_processes_now(); });
+        next_process_refresh_ = std::max(next_process_refresh_ + interval, now);
+    }
+    return cached_processes_;
+}
+
 const CockpitUiState& CockpitController::last_state() const {
     return last_state_;
 }
@@ -462,24 +506,14 @@ void CockpitController::append_live_timeline_point(
     );
 }
 
-std::vector<TimelinePoint> CockpitController::copy_live_timeline_window(const double now_timestamp) const {
-    std::vector<TimelinePoint> output;
-    const double cutoff = now_timestamp - config_.timeline_window_seconds;
-    output.reserve(live_timeline_points_.size());
-    for (const TimelinePoint& point : live_timeline_points_) {
-        if (point.timestamp >= cutoff) {
-            output.push_back(point);
-        }
-    }
-    return output;
-}
-
 void CockpitController::populate_timeline_state(
     CockpitUiState& state,
     std::optional<std::string>& stream_error
 ) {
+    // append_live_timeline_point already drops points outside the window, so
+    // the live ring is read in place rather than copied per tick.
     append_live_timeline_point(state.timestamp, state.cpu_percent, state.memory_percent);
-    const std::vector<TimelinePoint> live_points = copy_live_timeline_window(state.timestamp);
+    const std::size_t live_point_count = live_timeline_points_.size();
 
     const bool has_db_path = config_.db_path.has_value() && !config_.db_path->empty();
     const bool can_query_dvr = config_.prefer_dvr_timeline && has_db_path &&
@@ -487,9 +521,14 @@ void CockpitController::populate_timeline_state(
 
     if (can_query_dvr) {
         ++ticks_since_timeline_query_;
-        if (!has_dvr_timeline_cache_ || ticks_since_timeline_query_ >= config_.timeline_refresh_ticks) {
+        bool refresh_due = ticks_since_timeline_query_ >= config_.timeline_refresh_ticks;
+        if (config_.timeline_refresh_interval_seconds > 0.0) {
+            const double since_query = state.timestamp - last_timeline_query_timestamp_;
+            refresh_due = since_query >= config_.timeline_refresh_interval_seconds || since_query < 0.0;
+        }
+        if (!has_dvr_timeline_cache_ || refresh_due) {
             std::string timeline_error;
-            const auto queried = timeline_bridge_->query_recent(
+            auto queried = timeline_bridge_->query_recent(
                 *config_.db_path,
                 state.timestamp,
                 config_.timeline_window_seconds,
@@ -497,14 +536,15 @@ void CockpitController::populate_timeline_state(
                 timeline_error
             );
             ticks_since_timeline_query_ = 0U;
+            last_timeline_query_timestamp_ = state.timestamp;
             if (!timeline_error.empty()) {
                 has_dvr_timeline_cache_ = false;
                 dvr_timeline_cache_.clear();
-                if (live_points.size() < 2U) {
+                if (live_point_count < 2U) {
                     stream_error = optional_or(stream_error, timeline_error);
                 }
             } else if (queried.size() >= 8U) {
-                dvr_timeline_cache_ = queried;
+                dvr_timeline_cache_ = std::move(queried);
                 has_dvr_timeline_cache_ = true;
             } else {
                 has_dvr_timeline_cache_ = false;
@@ -520,9 +560,9 @@ void CockpitController::populate_timeline_state(
     if (has_dvr_timeline_cache_ && !dvr_timeline_cache_.empty()) {
         state.timeline_source = TimelineSource::Dvr;
         state.timeline_points = dvr_timeline_cache_;
-    } else if (live_points.size() >= 2U) {
+    } else if (live_point_count >= 2U) {
         state.timeline_source = TimelineSource::Live;
-        state.timeline_points = live_points;
+        state.timeline_points = live_timeline_points_;
     } else {
         state.timeline_source = TimelineSource::None;
         state.timeline_points.clear();
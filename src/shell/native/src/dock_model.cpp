@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include <stdexcept>
+#include <utility>
 
 namespace aura::shell {
 
@@ -15,6 +16,11 @@ constexpr std::size_t panel_index(const PanelId panel_id) {
     return static_cast<std::size_t>(panel_id);
 }
 
+bool slot_contains(const DockState& state, const DockSlot slot, const PanelId panel_id) {
+    const auto& tabs = state.slot_tabs[slot_index(slot)];
+    return std::find(tabs.begin(), tabs.end(), panel_id) != tabs.end();
+}
+
 std::size_t clamp_active_index(const std::size_t value, const std::size_t tab_count) {
     if (tab_count == 0U) {
         return 0U;
@@ -24,19 +30,6 @@ std::size_t clamp_active_index(const std::size_t value, const std::size_t tab_co
 
 }  // namespace
 
-std::array<PanelId, 4> all_panel_ids() {
-    return {
-        PanelId::TelemetryOverview,
-        PanelId::TopProcesses,
-        PanelId::DvrTimeline,
-        PanelId::RenderSurface,
-    };
-}
-
-std::array<DockSlot, 3> all_dock_slots() {
-    return {DockSlot::Left, DockSlot::Center, DockSlot::Right};
-}
-
 DockState build_default_dock_state() {
     DockState state;
     state.slot_tabs[slot_index(DockSlot::Left)] = {PanelId::TelemetryOverview};
@@ -46,72 +39,83 @@ DockState build_default_dock_state() {
     };
     state.slot_tabs[slot_index(DockSlot::Right)] = {PanelId::RenderSurface};
     state.active_tab = {0U, 0U, 0U};
+    state.panel_slot[panel_index(PanelId::TelemetryOverview)] = DockSlot::Left;
+    state.panel_slot[panel_index(PanelId::TopProcesses)] = DockSlot::Center;
+    state.panel_slot[panel_index(PanelId::DvrTimeline)] = DockSlot::Center;
+    state.panel_slot[panel_index(PanelId::RenderSurface)] = DockSlot::Right;
     return state;
 }
 
 DockState move_panel(const DockState& state, const PanelMoveRequest& request) {
-    DockState next_state = state;
+    return move_panel(DockState(state), request);
+}
 
-    const auto panel = request.panel_id;
-    std::optional<DockSlot> source_slot;
-    for (const auto slot : all_dock_slots()) {
-        const auto idx = slot_index(slot);
-        const auto& tabs = next_state.slot_tabs[idx];
-        if (std::find(tabs.begin(), tabs.end(), panel) != tabs.end()) {
-            source_slot = slot;
-            break;
-        }
+DockState move_panel(DockState&& state, const PanelMoveRequest& request) {
+    if (!is_valid_dock_slot(request.to_slot)) {
+        throw std::invalid_argument("to_slot is not a dock slot.");
     }
-
+    const auto panel = request.panel_id;
+    const std::optional<DockSlot> source_slot = find_panel_slot(state, panel);
     if (!source_slot.has_value()) {
         throw std::invalid_argument("Panel is not docked.");
     }
 
-    auto& source_tabs = next_state.slot_tabs[slot_index(*source_slot)];
-    source_tabs.erase(std::remove(source_tabs.begin(), source_tabs.end(), panel), source_tabs.end());
-
-    auto& destination_tabs = next_state.slot_tabs[slot_index(request.to_slot)];
-    const std::size_t insert_index = request.to_index.value_or(destination_tabs.size());
-    if (insert_index > destination_tabs.size()) {
+    // The destination range is checked as it will be after the panel leaves
+    // its source slot, before either slot is modified.
+    auto& source_tabs = state.slot_tabs[slot_index(*source_slot)];
+    auto& destination_tabs = state.slot_tabs[slot_index(request.to_slot)];
+    const std::size_t destination_size =
+        destination_tabs.size() - (*source_slot == request.to_slot ? 1U : 0U);
+    const std::size_t insert_index = request.to_index.value_or(destination_size);
+    if (insert_index > destination_size) {
         throw std::invalid_argument("to_index is outside the destination slot range.");
     }
+
+    source_tabs.erase(std::remove(source_tabs.begin(), source_tabs.end(), panel), source_tabs.end());
     destination_tabs.insert(destination_tabs.begin() + static_cast<std::ptrdiff_t>(insert_index), panel);
+    state.panel_slot[panel_index(panel)] = request.to_slot;
 
     for (const auto slot : all_dock_slots()) {
         const auto idx = slot_index(slot);
-        next_state.active_tab[idx] = clamp_active_index(
-            next_state.active_tab[idx],
-            next_state.slot_tabs[idx].size()
-        );
+        state.active_tab[idx] = clamp_active_index(state.active_tab[idx], state.slot_tabs[idx].size());
     }
-    next_state.active_tab[slot_index(request.to_slot)] = clamp_active_index(
+    state.active_tab[slot_index(request.to_slot)] = clamp_active_index(
         insert_index,
         destination_tabs.size()
     );
-    return next_state;
+    return std::move(state);
 }
 
 DockState set_active_tab(const DockState& state, const DockSlot slot, const std::size_t tab_index) {
-    DockState next_state = state;
+    return set_active_tab(DockState(state), slot, tab_index);
+}
+
+DockState set_active_tab(DockState&& state, const DockSlot slot, const std::size_t tab_index) {
+    if (!is_valid_dock_slot(slot)) {
+        throw std::invalid_argument("slot is not a dock slot.");
+    }
     const auto idx = slot_index(slot);
-    const auto tab_count = next_state.slot_tabs[idx].size();
+    const auto tab_count = state.slot_tabs[idx].size();
 
     if (tab_count == 0U) {
         if (tab_index != 0U) {
             throw std::invalid_argument("tab_index must be 0 when slot is empty.");
         }
-        next_state.active_tab[idx] = 0U;
-        return next_state;
+        state.active_tab[idx] = 0U;
+        return std::move(state);
     }
 
     if (tab_index >= tab_count) {
         throw std::invalid_argument("tab_index is outside the slot range.");
     }
-    next_state.active_tab[idx] = tab_index;
-    return next_state;
+    state.active_tab[idx] = tab_index;
+    return std::move(state);
 }
 
 std::optional<PanelId> active_panel(const DockState& state, const DockSlot slot) {
+    if (!is_valid_dock_slot(slot)) {
+        return std::nullopt;
+    }
     const auto idx = slot_index(slot);
     const auto& tabs = state.slot_tabs[idx];
     if (tabs.empty()) {
@@ -121,6 +125,25 @@ std::optional<PanelId> active_panel(const DockState& state, const DockSlot slot)
     return tabs[selected];
 }
 
+std::optional<DockSlot> find_panel_slot(const DockState& state, const PanelId panel_id) {
+    const auto idx = panel_index(panel_id);
+    if (idx >= state.panel_slot.size()) {
+        return std::nullopt;
+    }
+    // Trust the index only once its slot is confirmed to hold the panel;
+    // otherwise fall back to scanning slot_tabs.
+    const std::optional<DockSlot> hint = state.panel_slot[idx];
+    if (hint.has_value() && is_valid_dock_slot(*hint) && slot_contains(state, *hint, panel_id)) {
+        return hint;
+    }
+    for (const auto slot : all_dock_slots()) {
+        if (slot_contains(state, slot, panel_id)) {
+            return slot;
+        }
+    }
+    return std::nullopt;
+}
+
 std::string_view to_string(const DockSlot slot) {
     switch (slot) {
         case DockSlot::Left:
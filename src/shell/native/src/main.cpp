@@ -4,15 +4,19 @@
 #include <QEvent>
 #include <QFont>
 #include <QFrame>
+#include <QHideEvent>
 #include <QHBoxLayout>
 #include <QLabel>
 #include <QMainWindow>
+#include <QMetaObject>
+#include <QMetaProperty>
 #include <QMouseEvent>
 #include <QObject>
 #include <QPushButton>
 #include <QQuickItem>
 #include <QQuickWidget>
 #include <QScrollArea>
+#include <QShowEvent>
 #include <QSizePolicy>
 #include <QStackedWidget>
 #include <QTabBar>
@@ -24,13 +28,18 @@
 
 #include <algorithm>
 #include <array>
+#include <chrono>
 #include <cmath>
 #include <memory>
 #include <optional>
 #include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
 
 #include "aura_shell/cockpit_controller.hpp"
 #include "aura_shell/dock_model.hpp"
+#include "aura_shell/refresh_pacer.hpp"
 #include "aura_shell/render_bridge.hpp"
 #include "aura_shell/telemetry_bridge.hpp"
 #include "aura_shell/timeline_bridge.hpp"
@@ -151,51 +160,121 @@ int interval_to_milliseconds(const double interval_seconds) {
     return std::clamp(static_cast<int>(std::llround(interval_seconds * 1000.0)), 16, 2000);
 }
 
-int clamp_timer_interval_ms(const int value) {
-    return std::clamp(value, 16, 2000);
+// Placeholder for process rows without a sample; shared by the initial labels
+// and every repaint that pads a short row list.
+static const QString k_empty_process_row = QStringLiteral("-");
+
+// Accent intensity quantised to kAccentIntensityBuckets steps.  Every
+// accent-driven QML binding re-evaluates when the property is written, so
+// writes within the same bucket are skipped.  This trades resolution for
+// fewer writes: the scene scales accent by up to 0.40 in alpha and 3.0 px in
+// glow border width, so one 0.05 step can move an alpha by 0.02 and the glow
+// border by 0.15 px.  The Behavior on accentIntensity eases each step over
+// 80-400 ms rather than hiding it.
+constexpr double kAccentIntensityBuckets = 20.0;
+
+int accent_intensity_bucket(const double intensity) {
+    if (!std::isfinite(intensity)) {
+        return 0;
+    }
+    return static_cast<int>(std::lround(std::clamp(intensity, 0.0, 1.0) * kAccentIntensityBuckets));
 }
 
-LaunchConfig parse_args(QCoreApplication& app) {
+// True when every value shown by the widget labels and footer is unchanged.
+bool same_widget_text(const aura::shell::CockpitUiState& a, const aura::shell::CockpitUiState& b) {
+    return a.cpu_line == b.cpu_line && a.memory_line == b.memory_line &&
+           a.timestamp_line == b.timestamp_line && a.status_line == b.status_line &&
+           a.timeline_line == b.timeline_line && a.process_rows == b.process_rows &&
+           a.telemetry_available == b.telemetry_available && a.render_available == b.render_available &&
+           a.timeline_source == b.timeline_source && a.style_tokens_available == b.style_tokens_available &&
+           a.severity_level == b.severity_level && a.quality_hint == b.quality_hint &&
+           a.fps_target == b.fps_target && a.timeline_anomaly_count == b.timeline_anomaly_count &&
+           a.style_token_error == b.style_token_error;
+}
+
+// Sets `text` on `label` unless it matches `painted`, the text the label was
+// last given; skips the UTF-8 to QString conversion for unchanged lines.
+void set_label_text(QLabel* label, const std::string& text, const std::string* painted) {
+    if (painted != nullptr && *painted == text) {
+        return;
+    }
+    label->setText(QString::fromStdString(text));
+}
+
+// True when every value pushed into the QML scene is unchanged.  Accent
+// intensity is compared by bucket, matching how it is written.  The style
+// tokens pulse with the frame phase, so while the render backend animates
+// them this is false on nearly every tick; it only saves work when the tokens
+// hold still.
+bool same_scene_values(const aura::shell::CockpitUiState& a, const aura::shell::CockpitUiState& b) {
+    const aura::shell::RenderStyleTokens& ta = a.style_tokens;
+    const aura::shell::RenderStyleTokens& tb = b.style_tokens;
+    return accent_intensity_bucket(a.accent_intensity) == accent_intensity_bucket(b.accent_intensity) &&
+           a.cpu_percent == b.cpu_percent && a.memory_percent == b.memory_percent &&
+           ta.accent_red == tb.accent_red && ta.accent_green == tb.accent_green &&
+           ta.accent_blue == tb.accent_blue && ta.accent_alpha == tb.accent_alpha &&
+           ta.frost_intensity == tb.frost_intensity && ta.tint_strength == tb.tint_strength &&
+           ta.ring_line_width == tb.ring_line_width && ta.ring_glow_strength == tb.ring_glow_strength &&
+           ta.cpu_alpha == tb.cpu_alpha && ta.memory_alpha == tb.memory_alpha &&
+           a.severity_level == b.severity_level && a.motion_scale == b.motion_scale &&
+           a.quality_hint == b.quality_hint && ta.timeline_anomaly_alpha == tb.timeline_anomaly_alpha &&
+           a.status_line == b.status_line;
+}
+
+// Parser and option definitions are built once per process and reused by
+// every parse_args call.
+struct GuiCommandLine {
     QCommandLineParser parser;
-    parser.setApplicationDescription("Aura native shell");
-    parser.addHelpOption();
-
-    QCommandLineOption interval_option(
-        "interval",
-        "Polling interval in seconds.",
-        "seconds",
-        "1.0"
-    );
-    QCommandLineOption no_persist_option(
-        "no-persist",
-        "Disable telemetry persistence."
-    );
-    QCommandLineOption db_path_option(
-        "db-path",
-        "SQLite telemetry store path.",
-        "path"
-    );
-    QCommandLineOption retention_option(
-        "retention-seconds",
-        "Retention horizon in seconds.",
-        "seconds"
-    );
-
-    parser.addOption(interval_option);
-    parser.addOption(no_persist_option);
-    parser.addOption(db_path_option);
-    parser.addOption(retention_option);
+    QCommandLineOption interval_option{
+        QStringLiteral("interval"),
+        QStringLiteral("Polling interval in seconds."),
+        QStringLiteral("seconds"),
+        QStringLiteral("1.0")
+    };
+    QCommandLineOption no_persist_option{
+        QStringLiteral("no-persist"),
+        QStringLiteral("Disable telemetry persistence.")
+    };
+    QCommandLineOption db_path_option{
+        QStringLiteral("db-path"),
+        QStringLiteral("SQLite telemetry store path."),
+        QStringLiteral("path")
+    };
+    QCommandLineOption retention_option{
+        QStringLiteral("retention-seconds"),
+        QStringLiteral("Retention horizon in seconds."),
+        QStringLiteral("seconds")
+    };
+
+    GuiCommandLine() {
+        parser.setApplicationDescription(QStringLiteral("Aura native shell"));
+        parser.addHelpOption();
+        parser.addOption(interval_option);
+        parser.addOption(no_persist_option);
+        parser.addOption(db_path_option);
+        parser.addOption(retention_option);
+    }
+};
+
+GuiCommandLine& gui_command_line() {
+    static GuiCommandLine command_line;
+    return command_line;
+}
+
+LaunchConfig parse_args(QCoreApplication& app) {
+    GuiCommandLine& command_line = gui_command_line();
+    QCommandLineParser& parser = command_line.parser;
     parser.process(app);
 
     LaunchConfig config{};
-    config.interval_seconds = parser.value(interval_option).toDouble();
-    config.persistence_enabled = !parser.isSet(no_persist_option);
+    config.interval_seconds = parser.value(command_line.interval_option).toDouble();
+    config.persistence_enabled = !parser.isSet(command_line.no_persist_option);
 
-    if (parser.isSet(db_path_option)) {
-        config.db_path = parser.value(db_path_option);
+    if (parser.isSet(command_line.db_path_option)) {
+        config.db_path = parser.value(command_line.db_path_option);
     }
-    if (parser.isSet(retention_option)) {
-        config.retention_seconds = parser.value(retention_option).toDouble();
+    if (parser.isSet(command_line.retention_option)) {
+        config.retention_seconds = parser.value(command_line.retention_option).toDouble();
     }
     return config;
 }
@@ -206,6 +285,60 @@ struct SlotWidgets {
     QStackedWidget* stack;
 };
 
+// QML root properties written on every scene repaint.  They are resolved once
+// per root object so a repaint writes through the cached QMetaProperty instead
+// of looking each name up in the meta-object.
+struct SceneProperties {
+    const QObject* root{nullptr};
+    QMetaProperty accent_intensity;
+    QMetaProperty cpu_percent;
+    QMetaProperty memory_percent;
+    QMetaProperty accent_red;
+    QMetaProperty accent_green;
+    QMetaProperty accent_blue;
+    QMetaProperty accent_alpha;
+    QMetaProperty frost_intensity;
+    QMetaProperty tint_strength;
+    QMetaProperty ring_line_width;
+    QMetaProperty ring_glow_strength;
+    QMetaProperty cpu_alpha;
+    QMetaProperty memory_alpha;
+    QMetaProperty severity_level;
+    QMetaProperty motion_scale;
+    QMetaProperty quality_hint;
+    QMetaProperty timeline_anomaly_alpha;
+    QMetaProperty status_text;
+};
+
+QMetaProperty scene_property(const QMetaObject* meta, const char* name) {
+    return meta->property(meta->indexOfProperty(name));
+}
+
+SceneProperties resolve_scene_properties(const QObject* root) {
+    const QMetaObject* meta = root->metaObject();
+    SceneProperties out;
+    out.root = root;
+    out.accent_intensity = scene_property(meta, "accentIntensity");
+    out.cpu_percent = scene_property(meta, "cpuPercent");
+    out.memory_percent = scene_property(meta, "memoryPercent");
+    out.accent_red = scene_property(meta, "accentRed");
+    out.accent_green = scene_property(meta, "accentGreen");
+    out.accent_blue = scene_property(meta, "accentBlue");
+    out.accent_alpha = scene_property(meta, "accentAlpha");
+    out.frost_intensity = scene_property(meta, "frostIntensity");
+    out.tint_strength = scene_property(meta, "tintStrength");
+    out.ring_line_width = scene_property(meta, "ringLineWidth");
+    out.ring_glow_strength = scene_property(meta, "ringGlowStrength");
+    out.cpu_alpha = scene_property(meta, "cpuAlpha");
+    out.memory_alpha = scene_property(meta, "memoryAlpha");
+    out.severity_level = scene_property(meta, "severityLevel");
+    out.motion_scale = scene_property(meta, "motionScale");
+    out.quality_hint = scene_property(meta, "qualityHint");
+    out.timeline_anomaly_alpha = scene_property(meta, "timelineAnomalyAlpha");
+    out.status_text = scene_property(meta, "statusText");
+    return out;
+}
+
 // ---------------------------------------------------------------------------
 // Comprehensive application stylesheet
 // ---------------------------------------------------------------------------
@@ -555,6 +688,8 @@ public:
         aura::shell::CockpitController::Config controller_config;
         controller_config.poll_interval_seconds = current_interval_seconds_;
         controller_config.max_process_rows = process_labels_.size();
+        controller_config.background_process_refresh = true;
+        controller_config.timeline_refresh_interval_seconds = current_interval_seconds_;
         if (config.db_path.has_value()) {
             controller_config.db_path = config.db_path->toStdString();
         }
@@ -677,6 +812,9 @@ public:
         // Refresh timer
         // ---------------------------------------------------------------
         update_timer_ = new QTimer(this);
+        // Coarse timing is plenty for UI refresh and, unlike a precise
+        // timer, does not hold the system timer at high resolution.
+        update_timer_->setTimerType(Qt::CoarseTimer);
         update_timer_->setInterval(interval_to_milliseconds(current_interval_seconds_));
         connect(update_timer_, &QTimer::timeout, this, [this]() {
             refresh_cockpit();
@@ -715,6 +853,23 @@ protected:
         return QMainWindow::eventFilter(watched, event);
     }
 
+    // Nothing is visible while the window is hidden or minimized, so the
+    // refresh timer is stopped until it is shown again.
+    void hideEvent(QHideEvent* event) override {
+        if (update_timer_ != nullptr) {
+            update_timer_->stop();
+        }
+        QMainWindow::hideEvent(event);
+    }
+
+    void showEvent(QShowEvent* event) override {
+        QMainWindow::showEvent(event);
+        if (update_timer_ != nullptr && !update_timer_->isActive()) {
+            update_timer_->start();
+            refresh_cockpit();
+        }
+    }
+
 private:
     // -----------------------------------------------------------------------
     // build_slot  —  creates one of the three dock-slot frames
@@ -781,9 +936,7 @@ private:
             auto* move_button = new QPushButton(slot_short_label(slot), page);
             move_button->setObjectName("moveBtn");
             move_button->setFocusPolicy(Qt::NoFocus);
-            connect(move_button, &QPushButton::clicked, this, [this, panel_id, slot]() {
-                move_panel_to_slot(panel_id, slot);
-            });
+            connect(move_button, &QPushButton::clicked, this, &AuraShellWindow::on_move_button_clicked);
             panel_move_buttons_[panel_index(panel_id)][slot_index(slot)] = move_button;
             header_layout->addWidget(move_button);
         }
@@ -877,7 +1030,7 @@ private:
             processes_layout->addWidget(process_status_);
 
             for (std::size_t i = 0; i < process_labels_.size(); ++i) {
-                process_labels_[i] = new QLabel("-", parent_page);
+                process_labels_[i] = new QLabel(k_empty_process_row, parent_page);
                 // Alternate row styling for readability
                 process_labels_[i]->setObjectName((i % 2 == 0) ? "processRow" : "processRowAlt");
                 process_labels_[i]->setTextInteractionFlags(Qt::TextSelectableByMouse);
@@ -926,19 +1079,37 @@ private:
     // Dock model helpers
     // -----------------------------------------------------------------------
     std::optional<aura::shell::DockSlot> panel_slot(const aura::shell::PanelId panel_id) const {
-        for (const auto slot : aura::shell::all_dock_slots()) {
-            const auto& tabs = dock_state_.slot_tabs[slot_index(slot)];
-            if (std::find(tabs.begin(), tabs.end(), panel_id) != tabs.end()) {
-                return slot;
-            }
+        return aura::shell::find_panel_slot(dock_state_, panel_id);
+    }
+
+    // Moves made within one event-loop pass (e.g. rapid clicks) share a
+    // single relayout, queued behind the events that are already pending.
+    void schedule_dock_relayout() {
+        if (relayout_pending_) {
+            return;
         }
-        return std::nullopt;
+        relayout_pending_ = true;
+        QTimer::singleShot(0, this, [this]() {
+            relayout_pending_ = false;
+            rebuild_dock_slots();
+        });
     }
 
     void rebuild_dock_slots() {
+        // Only slots whose tab list changed are emptied and refilled; the
+        // panel pages themselves are reparented, never rebuilt.
+        std::array<bool, 3> changed{};
+        for (const auto slot : aura::shell::all_dock_slots()) {
+            const std::size_t slot_idx = slot_index(slot);
+            changed[slot_idx] = shown_slot_tabs_[slot_idx] != dock_state_.slot_tabs[slot_idx];
+        }
+
         syncing_tabs_ = true;
         for (const auto slot : aura::shell::all_dock_slots()) {
             const std::size_t slot_idx = slot_index(slot);
+            if (!changed[slot_idx]) {
+                continue;
+            }
             auto& sw = slot_widgets_[slot_idx];
 
             while (sw.tab_bar->count() > 0) {
@@ -954,12 +1125,15 @@ private:
             auto& sw = slot_widgets_[slot_idx];
             const auto& tabs = dock_state_.slot_tabs[slot_idx];
 
-            for (const auto panel_id : tabs) {
-                sw.tab_bar->addTab(panel_title(panel_id));
-                QWidget* page = panel_pages_[panel_index(panel_id)];
-                if (page != nullptr) {
-                    sw.stack->addWidget(page);
+            if (changed[slot_idx]) {
+                for (const auto panel_id : tabs) {
+                    sw.tab_bar->addTab(panel_title(panel_id));
+                    QWidget* page = panel_pages_[panel_index(panel_id)];
+                    if (page != nullptr) {
+                        sw.stack->addWidget(page);
+                    }
                 }
+                shown_slot_tabs_[slot_idx] = tabs;
             }
 
             if (tabs.empty()) {
@@ -980,7 +1154,9 @@ private:
     }
 
     void on_tab_changed(const aura::shell::DockSlot slot, const int tab_index) {
-        if (syncing_tabs_ || tab_index < 0) {
+        // While a relayout is queued the tab bars still show the old layout,
+        // so their indices do not match dock_state_.
+        if (syncing_tabs_ || relayout_pending_ || tab_index < 0) {
             return;
         }
 
@@ -991,15 +1167,35 @@ private:
         }
 
         try {
-            dock_state_ = aura::shell::set_active_tab(dock_state_, slot, static_cast<std::size_t>(tab_index));
+            dock_state_ = aura::shell::set_active_tab(std::move(dock_state_), slot, static_cast<std::size_t>(tab_index));
         } catch (const std::invalid_argument&) {
             return;
         }
 
+        // A tab switch only flips the slot's page stack.  Move-button states
+        // depend on which slot holds each panel, not on the active tab, so
+        // they are left alone.
         syncing_tabs_ = true;
         slot_widgets_[slot_idx].stack->setCurrentIndex(tab_index);
         syncing_tabs_ = false;
-        update_move_button_states();
+    }
+
+    // Every move button shares this handler; the panel and target slot are
+    // recovered from the button's position in panel_move_buttons_.
+    void on_move_button_clicked() {
+        const QObject* button = sender();
+        if (button == nullptr) {
+            return;
+        }
+        for (const auto panel_id : aura::shell::all_panel_ids()) {
+            const auto& buttons = panel_move_buttons_[panel_index(panel_id)];
+            for (const auto slot : aura::shell::all_dock_slots()) {
+                if (buttons[slot_index(slot)] == button) {
+                    move_panel_to_slot(panel_id, slot);
+                    return;
+                }
+            }
+        }
     }
 
     void move_panel_to_slot(
@@ -1008,7 +1204,7 @@ private:
     ) {
         try {
             dock_state_ = aura::shell::move_panel(
-                dock_state_,
+                std::move(dock_state_),
                 aura::shell::PanelMoveRequest{
                     panel_id,
                     target_slot,
@@ -1018,7 +1214,7 @@ private:
         } catch (const std::invalid_argument&) {
             return;
         }
-        rebuild_dock_slots();
+        schedule_dock_relayout();
     }
 
     void update_move_button_states() {
@@ -1042,21 +1238,66 @@ private:
         if (!controller_) {
             return;
         }
-        const auto state = controller_->tick(current_interval_seconds_);
+        auto state = controller_->tick(current_interval_seconds_);
+
+        // The timer can fire every 16 ms while telemetry only moves once per
+        // poll, so widgets and scene properties are only touched when the
+        // values they show differ from the last painted state.
+        const bool widgets_dirty = !has_painted_state_ ||
+                                   painted_interval_seconds_ != current_interval_seconds_ ||
+                                   !same_widget_text(state, painted_state_);
+        const bool scene_dirty = !has_painted_state_ || last_accent_bucket_ < 0 ||
+                                 !same_scene_values(state, painted_state_);
+        if (widgets_dirty) {
+            paint_widgets(state);
+        }
+        if (scene_dirty) {
+            paint_scene(state);
+        }
+        painted_interval_seconds_ = current_interval_seconds_;
 
-        telemetry_cpu_->setText(QString::fromStdString(state.cpu_line));
-        telemetry_memory_->setText(QString::fromStdString(state.memory_line));
-        telemetry_timestamp_->setText(QString::fromStdString(state.timestamp_line));
-        telemetry_status_->setText(QString::fromStdString(state.status_line));
-        process_status_->setText(QString::fromStdString(state.status_line));
-        render_status_->setText(QString::fromStdString(state.status_line));
-        timeline_status_->setText(QString::fromStdString(state.timeline_line));
+        // Idleness follows the visible telemetry, not scene_dirty: the pulse
+        // alone keeps the style tokens moving, and while idle it runs at the
+        // idle cadence, smoothed by the scene's Behaviors.
+        const int next_interval = refresh_pacer_.next_interval_ms(state, std::chrono::steady_clock::now());
+        if (update_timer_ != nullptr) {
+            if (update_timer_->interval() != next_interval) {
+                update_timer_->setInterval(next_interval);
+            }
+            current_interval_seconds_ = static_cast<double>(next_interval) / 1000.0;
+        }
+
+        painted_state_ = std::move(state);
+        has_painted_state_ = true;
+    }
+
+    void paint_widgets(const aura::shell::CockpitUiState& state) {
+        // Only labels whose line differs from the last painted state are set.
+        const aura::shell::CockpitUiState* painted = has_painted_state_ ? &painted_state_ : nullptr;
+        set_label_text(telemetry_cpu_, state.cpu_line, painted != nullptr ? &painted->cpu_line : nullptr);
+        set_label_text(
+            telemetry_memory_, state.memory_line, painted != nullptr ? &painted->memory_line : nullptr
+        );
+        set_label_text(
+            telemetry_timestamp_, state.timestamp_line, painted != nullptr ? &painted->timestamp_line : nullptr
+        );
+        const std::string* painted_status = painted != nullptr ? &painted->status_line : nullptr;
+        set_label_text(telemetry_status_, state.status_line, painted_status);
+        set_label_text(process_status_, state.status_line, painted_status);
+        set_label_text(render_status_, state.status_line, painted_status);
+        set_label_text(
+            timeline_status_, state.timeline_line, painted != nullptr ? &painted->timeline_line : nullptr
+        );
 
         for (std::size_t i = 0; i < process_labels_.size(); ++i) {
-            const QString line = i < state.process_rows.size()
-                                     ? QString::fromStdString(state.process_rows[i])
-                                     : QStringLiteral("-");
-            process_labels_[i]->setText(line);
+            const bool painted_row = painted != nullptr && i < painted->process_rows.size();
+            if (i < state.process_rows.size()) {
+                set_label_text(
+                    process_labels_[i], state.process_rows[i], painted_row ? &painted->process_rows[i] : nullptr
+                );
+            } else if (painted == nullptr || painted_row) {
+                process_labels_[i]->setText(k_empty_process_row);
+            }
         }
 
         // Footer — compact status summary
@@ -1081,36 +1322,39 @@ private:
             footer_text += QString("  style_err=%1").arg(error_text);
         }
         footer_status_->setText(footer_text);
+    }
 
+    void paint_scene(const aura::shell::CockpitUiState& state) {
         // QML property bridge — property names unchanged
         if (quick_ != nullptr && quick_->rootObject() != nullptr) {
             QQuickItem* root = quick_->rootObject();
-            root->setProperty("accentIntensity", state.accent_intensity);
-            root->setProperty("cpuPercent", state.cpu_percent);
-            root->setProperty("memoryPercent", state.memory_percent);
-            root->setProperty("accentRed", state.style_tokens.accent_red);
-            root->setProperty("accentGreen", state.style_tokens.accent_green);
-            root->setProperty("accentBlue", state.style_tokens.accent_blue);
-            root->setProperty("accentAlpha", state.style_tokens.accent_alpha);
-            root->setProperty("frostIntensity", state.style_tokens.frost_intensity);
-            root->setProperty("tintStrength", state.style_tokens.tint_strength);
-            root->setProperty("ringLineWidth", state.style_tokens.ring_line_width);
-            root->setProperty("ringGlowStrength", state.style_tokens.ring_glow_strength);
-            root->setProperty("cpuAlpha", state.style_tokens.cpu_alpha);
-            root->setProperty("memoryAlpha", state.style_tokens.memory_alpha);
-            root->setProperty("severityLevel", state.severity_level);
-            root->setProperty("motionScale", state.motion_scale);
-            root->setProperty("qualityHint", state.quality_hint);
-            root->setProperty("timelineAnomalyAlpha", state.style_tokens.timeline_anomaly_alpha);
-            root->setProperty("statusText", QString::fromStdString(state.status_line));
-        }
-
-        if (update_timer_ != nullptr) {
-            const int recommended_interval = clamp_timer_interval_ms(state.fps_recommended_delay_ms);
-            if (update_timer_->interval() != recommended_interval) {
-                update_timer_->setInterval(recommended_interval);
+            if (scene_properties_.root != root) {
+                scene_properties_ = resolve_scene_properties(root);
+                last_accent_bucket_ = -1;
+            }
+            const SceneProperties& scene = scene_properties_;
+            const int accent_bucket = accent_intensity_bucket(state.accent_intensity);
+            if (accent_bucket != last_accent_bucket_) {
+                scene.accent_intensity.write(root, state.accent_intensity);
+                last_accent_bucket_ = accent_bucket;
             }
-            current_interval_seconds_ = static_cast<double>(recommended_interval) / 1000.0;
+            scene.cpu_percent.write(root, state.cpu_percent);
+            scene.memory_percent.write(root, state.memory_percent);
+            scene.accent_red.write(root, state.style_tokens.accent_red);
+            scene.accent_green.write(root, state.style_tokens.accent_green);
+            scene.accent_blue.write(root, state.style_tokens.accent_blue);
+            scene.accent_alpha.write(root, state.style_tokens.accent_alpha);
+            scene.frost_intensity.write(root, state.style_tokens.frost_intensity);
+            scene.tint_strength.write(root, state.style_tokens.tint_strength);
+            scene.ring_line_width.write(root, state.style_tokens.ring_line_width);
+            scene.ring_glow_strength.write(root, state.style_tokens.ring_glow_strength);
+            scene.cpu_alpha.write(root, state.style_tokens.cpu_alpha);
+            scene.memory_alpha.write(root, state.style_tokens.memory_alpha);
+            scene.severity_level.write(root, state.severity_level);
+            scene.motion_scale.write(root, state.motion_scale);
+            scene.quality_hint.write(root, state.quality_hint);
+            scene.timeline_anomaly_alpha.write(root, state.style_tokens.timeline_anomaly_alpha);
+            scene.status_text.write(root, QString::fromStdString(state.status_line));
         }
     }
 
@@ -1122,9 +1366,17 @@ private:
     std::unique_ptr<aura::shell::CockpitController> controller_;
     aura::shell::DockState dock_state_{aura::shell::build_default_dock_state()};
     std::array<SlotWidgets, 3> slot_widgets_{};
+    std::array<std::vector<aura::shell::PanelId>, 3> shown_slot_tabs_{};
     std::array<QWidget*, 4> panel_pages_{};
     std::array<std::array<QPushButton*, 3>, 4> panel_move_buttons_{};
     bool syncing_tabs_{false};
+    bool relayout_pending_{false};
+    int last_accent_bucket_{-1};
+    SceneProperties scene_properties_{};
+    bool has_painted_state_{false};
+    double painted_interval_seconds_{0.0};
+    aura::shell::RefreshPacer refresh_pacer_{};
+    aura::shell::CockpitUiState painted_state_{};
     QFrame* titlebar_{nullptr};
     QQuickWidget* quick_{nullptr};
     QTimer* update_timer_{nullptr};
@@ -0,0 +1,62 @@
+#include "aura_shell/refresh_pacer.hpp"
+
+#include <algorithm>
+#include <cmath>
+
+namespace aura::shell {
+
+namespace {
+
+constexpr int kMinTimerIntervalMs = 16;
+constexpr int kMaxTimerIntervalMs = 2000;
+
+bool percent_moved(const double reference, const double value, const double tolerance) {
+    if (!std::isfinite(reference) || !std::isfinite(value)) {
+        return std::isfinite(reference) != std::isfinite(value);
+    }
+    return std::abs(value - reference) >= tolerance;
+}
+
+}  // namespace
+
+RefreshPacer::RefreshPacer() : RefreshPacer(Config{}) {}
+
+RefreshPacer::RefreshPacer(Config config) : config_(config) {}
+
+int RefreshPacer::next_interval_ms(const CockpitUiState& state, const Clock::time_point now) {
+    if (!has_inputs_ || inputs_changed(state)) {
+        remember_inputs(state);
+        last_change_ = now;
+    }
+
+    const int recommended = std::clamp(state.fps_recommended_delay_ms, kMinTimerIntervalMs, kMaxTimerIntervalMs);
+    if (idle(now)) {
+        return std::max(recommended, config_.idle_interval_ms);
+    }
+    return recommended;
+}
+
+bool RefreshPacer::idle(const Clock::time_point now) const {
+    return has_inputs_ && now - last_change_ >= config_.idle_after;
+}
+
+bool RefreshPacer::inputs_changed(const CockpitUiState& state) const {
+    return percent_moved(cpu_percent_, state.cpu_percent, config_.percent_tolerance) ||
+           percent_moved(memory_percent_, state.memory_percent, config_.percent_tolerance) ||
+           severity_level_ != state.severity_level || quality_hint_ != state.quality_hint ||
+           telemetry_available_ != state.telemetry_available ||
+           render_available_ != state.render_available || status_line_ != state.status_line;
+}
+
+void RefreshPacer::remember_inputs(const CockpitUiState& state) {
+    has_inputs_ = true;
+    cpu_percent_ = state.cpu_percent;
+    memory_percent_ = state.memory_percent;
+    severity_level_ = state.severity_level;
+    quality_hint_ = state.quality_hint;
+    telemetry_available_ = state.telemetry_available;
+    render_available_ = state.render_available;
+    status_line_ = state.status_line;
+}
+
+}  // namespace aura::shell
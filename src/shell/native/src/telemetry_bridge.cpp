@@ -5,6 +5,7 @@
 #include <cmath>
 #include <cstdint>
 #include <filesystem>
+#include <mutex>
 #include <string>
 #include <vector>
 
@@ -20,6 +21,8 @@ namespace aura::shell {
 
 namespace {
 
+// Error buffers are read with c_string_length, bounded by their size, so
+// only the first byte is cleared before each call.
 constexpr std::size_t kErrorBufferSize = 256;
 constexpr int kStatusOk = 0;
 constexpr std::size_t kMaxProcessSamples = 64;
@@ -143,6 +146,9 @@ struct TelemetryBridge::Impl {
     HMODULE module_handle{nullptr};
     CollectSnapshotFn collect_snapshot_fn{nullptr};
     CollectProcessesFn collect_processes_fn{nullptr};
+    // Reused across ticks so process polling does not reallocate the ABI rows.
+    std::mutex raw_samples_mutex;
+    std::vector<aura_process_sample> raw_samples;
 #endif
     bool loaded{false};
     std::string loaded_path;
@@ -212,7 +218,8 @@ std::optional<TelemetrySnapshot> TelemetryBridge::collect_snapshot(std::string&
     }
 
 #ifdef _WIN32
-    std::array<char, kErrorBufferSize> error_buffer{};
+    std::array<char, kErrorBufferSize> error_buffer;
+    error_buffer[0] = '\0';
     double cpu_percent = 0.0;
     double memory_percent = 0.0;
     const int status = impl_->collect_snapshot_fn(
@@ -255,12 +262,17 @@ std::vector<ProcessSample> TelemetryBridge::collect_top_processes(
 
 #ifdef _WIN32
     const std::size_t bounded_samples = std::min(max_samples, kMaxProcessSamples);
-    std::vector<aura_process_sample> raw_samples(bounded_samples);
-    std::array<char, kErrorBufferSize> error_buffer{};
+    const std::lock_guard<std::mutex> lock(impl_->raw_samples_mutex);
+    std::vector<aura_process_sample>& raw_samples = impl_->raw_samples;
+    if (raw_samples.size() < bounded_samples) {
+        raw_samples.resize(bounded_samples);
+    }
+    std::array<char, kErrorBufferSize> error_buffer;
+    error_buffer[0] = '\0';
     std::uint32_t out_count = 0U;
     const int status = impl_->collect_processes_fn(
         raw_samples.data(),
-        static_cast<std::uint32_t>(raw_samples.size()),
+        static_cast<std::uint32_t>(bounded_samples),
         &out_count,
         error_buffer.data(),
         error_buffer.size()
@@ -273,7 +285,7 @@ std::vector<ProcessSample> TelemetryBridge::collect_top_processes(
         return output;
     }
 
-    const std::size_t result_count = std::min<std::size_t>(out_count, raw_samples.size());
+    const std::size_t result_count = std::min<std::size_t>(out_count, bounded_samples);
     output.reserve(result_count);
     for (std::size_t i = 0; i < result_count; ++i) {
         const aura_process_sample& raw = raw_samples[i];
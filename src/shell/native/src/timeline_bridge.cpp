@@ -151,13 +151,32 @@ struct TimelineBridge::Impl {
     using StoreCloseFn = int (*)(aura_store_t*);
     using QueryTimelineFn =
         int (*)(aura_store_t*, int, double, int, double, int, aura_snapshot_t*, int, int*, aura_error_t*);
+    using StoreCountFn = int (*)(aura_store_t*, int*, aura_error_t*);
+    using StoreLatestFn = int (*)(aura_store_t*, int, aura_snapshot_t*, int, int*, aura_error_t*);
 
     HMODULE module_handle{nullptr};
     StoreOpenFn store_open_fn{nullptr};
     StoreCloseFn store_close_fn{nullptr};
     QueryTimelineFn query_timeline_fn{nullptr};
+    StoreCountFn store_count_fn{nullptr};
+    StoreLatestFn store_latest_fn{nullptr};
     aura_store_t* open_store{nullptr};
     std::string open_store_path;
+
+    // Last successful query.  The store's row count and newest timestamp
+    // stand in for a rowid: while both are unchanged and the new window
+    // neither drops a returned row nor reaches past the old end, the same
+    // rows would be downsampled again, so the cached points are returned.
+    bool has_cached_query{false};
+    int cached_resolution{0};
+    int cached_row_count{0};
+    double cached_start_timestamp{0.0};
+    double cached_end_timestamp{0.0};
+    double cached_newest_timestamp{0.0};
+    std::vector<TimelinePoint> cached_points;
+
+    // Raw query rows, kept across refreshes so the buffer is allocated once.
+    std::vector<aura_snapshot_t> raw_buffer;
 #endif
     bool loaded{false};
     std::string loaded_path;
@@ -189,6 +208,10 @@ TimelineBridge::TimelineBridge() : impl_(std::make_unique<Impl>()) {
         impl_->store_open_fn = store_open;
         impl_->store_close_fn = store_close;
         impl_->query_timeline_fn = query_timeline;
+        // Optional: without them every refresh simply re-runs the query.
+        impl_->store_count_fn = reinterpret_cast<Impl::StoreCountFn>(GetProcAddress(module, "aura_store_count"));
+        impl_->store_latest_fn =
+            reinterpret_cast<Impl::StoreLatestFn>(GetProcAddress(module, "aura_store_latest"));
         impl_->loaded = true;
         impl_->loaded_path = narrow_from_wide(path);
         impl_->load_error.clear();
@@ -259,6 +282,7 @@ std::vector<TimelinePoint> TimelineBridge::query_recent(
         impl_->store_close_fn(impl_->open_store);
         impl_->open_store = nullptr;
         impl_->open_store_path.clear();
+        impl_->has_cached_query = false;
     }
 
     if (impl_->open_store == nullptr) {
@@ -281,8 +305,34 @@ std::vector<TimelinePoint> TimelineBridge::query_recent(
     }
 
     const int bounded_resolution = std::clamp(resolution, 2, 2048);
+
+    int row_count = -1;
+    double newest_timestamp = 0.0;
+    if (impl_->store_count_fn != nullptr && impl_->store_latest_fn != nullptr) {
+        aura_error_t probe_error{};
+        aura_snapshot_t newest{};
+        int newest_count = 0;
+        if (impl_->store_count_fn(impl_->open_store, &row_count, &probe_error) != kStatusOk ||
+            impl_->store_latest_fn(impl_->open_store, 1, &newest, 1, &newest_count, &probe_error) != kStatusOk) {
+            row_count = -1;
+        } else if (newest_count == 1) {
+            newest_timestamp = newest.timestamp;
+        }
+    }
+    if (row_count >= 0 && impl_->has_cached_query && impl_->cached_resolution == bounded_resolution &&
+        impl_->cached_row_count == row_count && impl_->cached_newest_timestamp == newest_timestamp &&
+        start_timestamp >= impl_->cached_start_timestamp && end_timestamp >= impl_->cached_end_timestamp &&
+        newest_timestamp <= impl_->cached_end_timestamp &&
+        (impl_->cached_points.empty() || impl_->cached_points.front().timestamp >= start_timestamp)) {
+        return impl_->cached_points;
+    }
+    impl_->has_cached_query = false;
+
     const int out_capacity = std::clamp(bounded_resolution * 4, 64, 4096);
-    std::vector<aura_snapshot_t> raw(static_cast<std::size_t>(out_capacity));
+    std::vector<aura_snapshot_t>& raw = impl_->raw_buffer;
+    if (raw.size() < static_cast<std::size_t>(out_capacity)) {
+        raw.resize(static_cast<std::size_t>(out_capacity));
+    }
     aura_error_t query_error{};
     int out_count = 0;
     const int status = impl_->query_timeline_fn(
@@ -318,13 +368,22 @@ std::vector<TimelinePoint> TimelineBridge::query_recent(
         next.memory_percent = clamp_percent(point.memory_percent);
         output.push_back(next);
     }
-    std::sort(
-        output.begin(),
-        output.end(),
-        [](const TimelinePoint& lhs, const TimelinePoint& rhs) {
-            return lhs.timestamp < rhs.timestamp;
-        }
-    );
+    // The store returns rows in time order, so the sort is normally skipped.
+    const auto by_timestamp = [](const TimelinePoint& lhs, const TimelinePoint& rhs) {
+        return lhs.timestamp < rhs.timestamp;
+    };
+    if (!std::is_sorted(output.begin(), output.end(), by_timestamp)) {
+        std::sort(output.begin(), output.end(), by_timestamp);
+    }
+    if (row_count >= 0) {
+        impl_->has_cached_query = true;
+        impl_->cached_resolution = bounded_resolution;
+        impl_->cached_row_count = row_count;
+        impl_->cached_start_timestamp = start_timestamp;
+        impl_->cached_end_timestamp = end_timestamp;
+        impl_->cached_newest_timestamp = newest_timestamp;
+        impl_->cached_points = output;
+    }
     return output;
 #else
     error = "Timeline bridge is only supported on Windows.";
@@ -0,0 +1,69 @@
+#ifndef AURA_TELEMETRY_DISK_OP_COUNTS_H
+#define AURA_TELEMETRY_DISK_OP_COUNTS_H
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+
+namespace aura::telemetry {
+
+// Advances a 64-bit total by the unsigned 32-bit delta, which is correct
+// across a single wrap of the native counter.
+inline void accumulate_wrapping_count(uint64_t& total, uint32_t& last, const uint32_t current) {
+    total += static_cast<uint32_t>(current - last);
+    last = current;
+}
+
+// DISK_PERFORMANCE reports ReadCount/WriteCount as 32-bit values that wrap.
+// DiskOpCounts extends them into 64-bit running totals, the way psutil's
+// nowrap mode does.  Totals are keyed by PhysicalDrive index rather than by
+// open handle, so re-probing the drive handles does not reseed a drive from
+// its raw, possibly already wrapped, counter.  A drive index that stops
+// opening is forgotten, so whatever drive appears there next starts fresh.
+class DiskOpCounts {
+public:
+    static constexpr int kMaxDrives = 64;
+
+    struct Totals {
+        uint64_t read_count = 0;
+        uint64_t write_count = 0;
+    };
+
+    // Folds one drive's raw counters in and returns its running totals.
+    Totals Observe(const int drive_index, const uint32_t read_count, const uint32_t write_count) {
+        if (drive_index < 0 || drive_index >= kMaxDrives) {
+            return Totals{read_count, write_count};
+        }
+        DriveState& drive = drives_[static_cast<size_t>(drive_index)];
+        if (drive.seen) {
+            accumulate_wrapping_count(drive.totals.read_count, drive.last_read_count, read_count);
+            accumulate_wrapping_count(drive.totals.write_count, drive.last_write_count, write_count);
+        } else {
+            drive.seen = true;
+            drive.last_read_count = read_count;
+            drive.last_write_count = write_count;
+            drive.totals = Totals{read_count, write_count};
+        }
+        return drive.totals;
+    }
+
+    void Forget(const int drive_index) {
+        if (drive_index >= 0 && drive_index < kMaxDrives) {
+            drives_[static_cast<size_t>(drive_index)] = DriveState{};
+        }
+    }
+
+private:
+    struct DriveState {
+        bool seen = false;
+        uint32_t last_read_count = 0;
+        uint32_t last_write_count = 0;
+        Totals totals;
+    };
+
+    std::array<DriveState, kMaxDrives> drives_{};
+};
+
+}  // namespace aura::telemetry
+
+#endif  // AURA_TELEMETRY_DISK_OP_COUNTS_H
@@ -1,15 +1,17 @@
 #include "telemetry_abi.h"
 
+#include "disk_op_counts.h"
+
 #include <algorithm>
 #include <array>
 #include <cmath>
 #include <cstdint>
 #include <cstring>
+#include <cwchar>
 #include <limits>
 #include <mutex>
 #include <string>
 #include <unordered_map>
-#include <unordered_set>
 #include <vector>
 
 #ifdef _WIN32
@@ -138,9 +140,14 @@ std::mutex g_cpu_snapshot_mutex;
 struct ProcessCpuState {
     uint64_t process_total_100ns = 0;
     uint64_t sampled_at_100ns = 0;
+    uint64_t seen_pass = 0;
 };
 
+// Each full enumeration starts a new pass and stamps the pids it samples, so
+// exited processes are pruned by comparing stamps instead of collecting a
+// set of every pid seen.  Both globals are guarded by g_process_cpu_mutex.
 std::unordered_map<uint32_t, ProcessCpuState> g_process_cpu_state;
+uint64_t g_process_cpu_pass = 0;
 std::mutex g_process_cpu_mutex;
 
 int logical_cpu_count() {
@@ -153,30 +160,14 @@ int logical_cpu_count() {
     return static_cast<int>(cpus);
 }
 
-bool compute_process_cpu_percent(
+// Records the process's total kernel+user time and returns its CPU percent
+// since the previous sample of the same pid (0.0 on the first sample).
+double process_cpu_percent_from_total(
     uint32_t pid,
-    HANDLE process_handle,
+    uint64_t process_total,
     uint64_t sampled_at_100ns,
-    int cpu_count,
-    double* out_percent
+    int cpu_count
 ) {
-    if (out_percent == nullptr) {
-        return false;
-    }
-    *out_percent = 0.0;
-    if (process_handle == nullptr || process_handle == INVALID_HANDLE_VALUE) {
-        return false;
-    }
-
-    FILETIME creation{};
-    FILETIME exit{};
-    FILETIME kernel{};
-    FILETIME user{};
-    if (!GetProcessTimes(process_handle, &creation, &exit, &kernel, &user)) {
-        return false;
-    }
-
-    const uint64_t process_total = filetime_to_uint64(kernel) + filetime_to_uint64(user);
     ProcessCpuState previous{};
     bool had_previous = false;
     {
@@ -186,34 +177,65 @@ bool compute_process_cpu_percent(
             previous = existing->second;
             had_previous = true;
         }
-        g_process_cpu_state[pid] = ProcessCpuState{process_total, sampled_at_100ns};
+        g_process_cpu_state[pid] = ProcessCpuState{process_total, sampled_at_100ns, g_process_cpu_pass};
     }
 
     if (!had_previous || sampled_at_100ns <= previous.sampled_at_100ns || cpu_count <= 0) {
-        return true;
+        return 0.0;
     }
     if (process_total < previous.process_total_100ns) {
-        return true;
+        return 0.0;
     }
 
     const uint64_t delta_process_100ns = process_total - previous.process_total_100ns;
     const uint64_t delta_wall_100ns = sampled_at_100ns - previous.sampled_at_100ns;
     if (delta_wall_100ns == 0) {
-        return true;
+        return 0.0;
     }
 
     const double cpu = (static_cast<double>(delta_process_100ns) * 100.0) /
                        (static_cast<double>(delta_wall_100ns) * static_cast<double>(cpu_count));
-    if (std::isfinite(cpu) && cpu > 0.0) {
-        *out_percent = cpu;
+    return std::isfinite(cpu) && cpu > 0.0 ? cpu : 0.0;
+}
+
+bool compute_process_cpu_percent(
+    uint32_t pid,
+    HANDLE process_handle,
+    uint64_t sampled_at_100ns,
+    int cpu_count,
+    double* out_percent
+) {
+    if (out_percent == nullptr) {
+        return false;
+    }
+    *out_percent = 0.0;
+    if (process_handle == nullptr || process_handle == INVALID_HANDLE_VALUE) {
+        return false;
+    }
+
+    FILETIME creation{};
+    FILETIME exit{};
+    FILETIME kernel{};
+    FILETIME user{};
+    if (!GetProcessTimes(process_handle, &creation, &exit, &kernel, &user)) {
+        return false;
     }
+
+    const uint64_t process_total = filetime_to_uint64(kernel) + filetime_to_uint64(user);
+    *out_percent = process_cpu_percent_from_total(pid, process_total, sampled_at_100ns, cpu_count);
     return true;
 }
 
-void prune_process_cpu_state(const std::unordered_set<uint32_t>& seen_pids) {
+uint64_t begin_process_cpu_pass() {
+    std::lock_guard<std::mutex> lock(g_process_cpu_mutex);
+    return ++g_process_cpu_pass;
+}
+
+// Drops the state of every pid not sampled since `pass` began.
+void prune_process_cpu_state(const uint64_t pass) {
     std::lock_guard<std::mutex> lock(g_process_cpu_mutex);
     for (auto it = g_process_cpu_state.begin(); it != g_process_cpu_state.end();) {
-        if (seen_pids.find(it->first) == seen_pids.end()) {
+        if (it->second.seen_pass < pass) {
             it = g_process_cpu_state.erase(it);
         } else {
             ++it;
@@ -275,19 +297,41 @@ bool collect_memory_percent(double* memory_percent) {
     return true;
 }
 
-bool collect_disk_counters_impl(aura_disk_counters* counters) {
-    if (counters == nullptr) {
-        return false;
-    }
+// Physical drive handles are opened once and reused across polls instead of
+// probing all 64 PhysicalDriveN paths on every call.  The set is re-probed
+// when a handle stops answering, when none are open, and every
+// kDiskRescanIntervalMs so newly attached drives are picked up.
+constexpr ULONGLONG kDiskRescanIntervalMs = 30000;
 
-    uint64_t read_bytes = 0;
-    uint64_t write_bytes = 0;
-    uint64_t read_count = 0;
-    uint64_t write_count = 0;
-    bool collected_any = false;
+struct CachedDisk {
+    HANDLE handle = INVALID_HANDLE_VALUE;
+    int drive_index = 0;
+};
+
+// The wrap-extended op counts live beside the handles rather than in them,
+// so they carry over when the handles are closed and re-probed.
+struct DiskHandleCache {
+    std::vector<CachedDisk> disks;
+    aura::telemetry::DiskOpCounts op_counts;
+    ULONGLONG probed_at_ms = 0;
+    bool probed = false;
+};
+
+DiskHandleCache g_disk_handle_cache;
+std::mutex g_disk_handle_mutex;
+
+void close_disk_handles(DiskHandleCache& cache) {
+    for (const CachedDisk& disk : cache.disks) {
+        CloseHandle(disk.handle);
+    }
+    cache.disks.clear();
+    cache.probed = false;
+}
 
-    for (int index = 0; index < 64; ++index) {
-        std::wstring path = L"\\\\.\\PhysicalDrive" + std::to_wstring(index);
+void probe_disk_handles(DiskHandleCache& cache) {
+    close_disk_handles(cache);
+    for (int index = 0; index < aura::telemetry::DiskOpCounts::kMaxDrives; ++index) {
+        const std::wstring path = L"\\\\.\\PhysicalDrive" + std::to_wstring(index);
         HANDLE disk = CreateFileW(
             path.c_str(),
             0,
@@ -297,14 +341,40 @@ bool collect_disk_counters_impl(aura_disk_counters* counters) {
             FILE_ATTRIBUTE_NORMAL,
             nullptr
         );
-        if (disk == INVALID_HANDLE_VALUE) {
-            continue;
+        if (disk != INVALID_HANDLE_VALUE) {
+            cache.disks.push_back(CachedDisk{disk, index});
+        } else {
+            cache.op_counts.Forget(index);
         }
+    }
+    cache.probed_at_ms = GetTickCount64();
+    cache.probed = true;
+}
 
+bool collect_disk_counters_impl(aura_disk_counters* counters) {
+    if (counters == nullptr) {
+        return false;
+    }
+
+    uint64_t read_bytes = 0;
+    uint64_t write_bytes = 0;
+    uint64_t read_count = 0;
+    uint64_t write_count = 0;
+    bool collected_any = false;
+
+    std::lock_guard<std::mutex> lock(g_disk_handle_mutex);
+    DiskHandleCache& cache = g_disk_handle_cache;
+    if (!cache.probed || cache.disks.empty() ||
+        GetTickCount64() - cache.probed_at_ms >= kDiskRescanIntervalMs) {
+        probe_disk_handles(cache);
+    }
+
+    bool any_failed = false;
+    for (const CachedDisk& disk : cache.disks) {
         DISK_PERFORMANCE perf{};
         DWORD bytes_returned = 0;
         const BOOL ok = DeviceIoControl(
-            disk,
+            disk.handle,
             IOCTL_DISK_PERFORMANCE,
             nullptr,
             0,
@@ -313,16 +383,25 @@ bool collect_disk_counters_impl(aura_disk_counters* counters) {
             &bytes_returned,
             nullptr
         );
-        CloseHandle(disk);
         if (!ok) {
+            any_failed = true;
             continue;
         }
 
         collected_any = true;
         read_bytes += static_cast<uint64_t>(perf.BytesRead.QuadPart);
         write_bytes += static_cast<uint64_t>(perf.BytesWritten.QuadPart);
-        read_count += static_cast<uint64_t>(perf.ReadCount);
-        write_count += static_cast<uint64_t>(perf.WriteCount);
+        const aura::telemetry::DiskOpCounts::Totals totals = cache.op_counts.Observe(
+            disk.drive_index,
+            static_cast<uint32_t>(perf.ReadCount),
+            static_cast<uint32_t>(perf.WriteCount)
+        );
+        read_count += totals.read_count;
+        write_count += totals.write_count;
+    }
+    if (any_failed) {
+        // A drive went away or stopped reporting; re-probe on the next poll.
+        cache.probed = false;
     }
 
     if (!collected_any) {
@@ -367,6 +446,194 @@ bool collect_network_counters_impl(aura_network_counters* counters) {
     counters->packets_recv = packets_recv;
     return true;
 }
+
+using NtQuerySystemInformationFn = LONG(WINAPI*)(ULONG, PVOID, ULONG, PULONG);
+
+NtQuerySystemInformationFn nt_query_system_information() {
+    static const NtQuerySystemInformationFn resolved = []() -> NtQuerySystemInformationFn {
+        HMODULE ntdll = GetModuleHandleW(L"ntdll.dll");
+        if (ntdll == nullptr) {
+            return nullptr;
+        }
+        return reinterpret_cast<NtQuerySystemInformationFn>(
+            GetProcAddress(ntdll, "NtQuerySystemInformation")
+        );
+    }();
+    return resolved;
+}
+
+// Rank fields are gathered into parallel arrays and the names into one
+// wide-char pool, so the ranking only moves small indices and the UTF-8
+// names and 260-byte ABI rows are built for the returned rows alone.
+struct ProcessTable {
+    std::vector<uint32_t> pids;
+    std::vector<double> cpu_percents;
+    std::vector<uint64_t> rss_bytes_by_process;
+    std::vector<size_t> name_offsets;
+    std::wstring name_pool;
+
+    void reserve(size_t expected_processes) {
+        pids.reserve(expected_processes);
+        cpu_percents.reserve(expected_processes);
+        rss_bytes_by_process.reserve(expected_processes);
+        name_offsets.reserve(expected_processes);
+        name_pool.reserve(expected_processes * 16U);
+    }
+
+    void append(uint32_t pid, const wchar_t* name, size_t name_length, double cpu, uint64_t rss_bytes) {
+        name_offsets.push_back(name_pool.size());
+        if (name != nullptr) {
+            name_pool.append(name, name_length);
+        }
+        name_pool.push_back(L'\0');
+        pids.push_back(pid);
+        cpu_percents.push_back(std::isfinite(cpu) && cpu > 0.0 ? cpu : 0.0);
+        rss_bytes_by_process.push_back(rss_bytes);
+    }
+};
+
+// Leading fields of SYSTEM_PROCESS_INFORMATION, up to WorkingSetSize.
+struct NtProcessEntry {
+    struct UnicodeString {
+        USHORT length;
+        USHORT maximum_length;
+        PWSTR buffer;
+    };
+
+    ULONG next_entry_offset;
+    ULONG number_of_threads;
+    LARGE_INTEGER working_set_private_size;
+    ULONG hard_fault_count;
+    ULONG number_of_threads_high_watermark;
+    ULONGLONG cycle_time;
+    LARGE_INTEGER create_time;
+    LARGE_INTEGER user_time;
+    LARGE_INTEGER kernel_time;
+    UnicodeString image_name;
+    LONG base_priority;
+    HANDLE unique_process_id;
+    HANDLE inherited_from_unique_process_id;
+    ULONG handle_count;
+    ULONG session_id;
+    ULONG_PTR unique_process_key;
+    SIZE_T peak_virtual_size;
+    SIZE_T virtual_size;
+    ULONG page_fault_count;
+    SIZE_T peak_working_set_size;
+    SIZE_T working_set_size;
+};
+
+constexpr ULONG kSystemProcessInformation = 5;
+constexpr LONG kStatusInfoLengthMismatch = static_cast<LONG>(0xC0000004UL);
+
+// One SystemProcessInformation query returns the image name, CPU times and
+// working set of every process in a single kernel transition, so no
+// per-process handle has to be opened.  Returns false when the query is
+// unavailable so the caller can fall back to Toolhelp.
+bool enumerate_processes_nt(ProcessTable& table, uint64_t sampled_at, int cpu_count) {
+    const NtQuerySystemInformationFn nt_query = nt_query_system_information();
+    if (nt_query == nullptr) {
+        return false;
+    }
+
+    // The buffer is kept per thread and only grows, since the process list
+    // rarely shrinks enough to matter between polls.
+    thread_local std::vector<unsigned char> buffer(256U * 1024U);
+    LONG status = kStatusInfoLengthMismatch;
+    for (int attempt = 0; attempt < 4 && status == kStatusInfoLengthMismatch; ++attempt) {
+        ULONG needed = 0;
+        status = nt_query(
+            kSystemProcessInformation,
+            buffer.data(),
+            static_cast<ULONG>(buffer.size()),
+            &needed
+        );
+        if (status == kStatusInfoLengthMismatch) {
+            // Leave headroom for processes started between the two calls.
+            buffer.resize(std::max<size_t>(needed, buffer.size()) + (64U * 1024U));
+        }
+    }
+    if (status != 0) {
+        return false;
+    }
+
+    size_t offset = 0;
+    for (;;) {
+        const auto* entry = reinterpret_cast<const NtProcessEntry*>(buffer.data() + offset);
+        const uint32_t pid = static_cast<uint32_t>(reinterpret_cast<uintptr_t>(entry->unique_process_id));
+        if (pid != 0) {
+            const uint64_t process_total = static_cast<uint64_t>(entry->kernel_time.QuadPart) +
+                                           static_cast<uint64_t>(entry->user_time.QuadPart);
+            table.append(
+                pid,
+                entry->image_name.buffer,
+                entry->image_name.length / sizeof(wchar_t),
+                process_cpu_percent_from_total(pid, process_total, sampled_at, cpu_count),
+                static_cast<uint64_t>(entry->working_set_size)
+            );
+        }
+        if (entry->next_entry_offset == 0) {
+            break;
+        }
+        offset += entry->next_entry_offset;
+    }
+    return true;
+}
+
+// Fallback enumeration through Toolhelp, opening each process for its
+// working set and CPU times.
+bool enumerate_processes_toolhelp(ProcessTable& table, uint64_t sampled_at, int cpu_count) {
+    HANDLE snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
+    if (snapshot == INVALID_HANDLE_VALUE) {
+        return false;
+    }
+
+    PROCESSENTRY32W entry{};
+    entry.dwSize = sizeof(entry);
+
+    BOOL has_entry = Process32FirstW(snapshot, &entry);
+    while (has_entry) {
+        const uint32_t pid = static_cast<uint32_t>(entry.th32ProcessID);
+        if (pid == 0) {
+            has_entry = Process32NextW(snapshot, &entry);
+            continue;
+        }
+
+        HANDLE process = OpenProcess(
+            PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ,
+            FALSE,
+            static_cast<DWORD>(pid)
+        );
+
+        uint64_t rss_bytes = 0;
+        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
+            PROCESS_MEMORY_COUNTERS_EX memory{};
+            memory.cb = sizeof(memory);
+            if (GetProcessMemoryInfo(
+                    process,
+                    reinterpret_cast<PROCESS_MEMORY_COUNTERS*>(&memory),
+                    sizeof(memory)
+                )) {
+                rss_bytes = static_cast<uint64_t>(memory.WorkingSetSize);
+            }
+        }
+
+        double cpu = 0.0;
+        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
+            (void)compute_process_cpu_percent(pid, process, sampled_at, cpu_count, &cpu);
+        }
+
+        table.append(pid, entry.szExeFile, std::wcslen(entry.szExeFile), cpu, rss_bytes);
+
+        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
+            CloseHandle(process);
+        }
+        has_entry = Process32NextW(snapshot, &entry);
+    }
+
+    CloseHandle(snapshot);
+    return true;
+}
 #endif
 
 }  // namespace
@@ -427,101 +694,64 @@ extern "C" int aura_collect_processes(
         return AURA_STATUS_ERROR;
     }
 
-    HANDLE snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
-    if (snapshot == INVALID_HANDLE_VALUE) {
+    const uint64_t sampled_at = now_100ns();
+    const int cpu_count = logical_cpu_count();
+    const uint64_t cpu_pass = begin_process_cpu_pass();
+    ProcessTable table;
+    table.reserve(static_cast<size_t>(max_samples) * 4U);
+    if (!enumerate_processes_nt(table, sampled_at, cpu_count) &&
+        !enumerate_processes_toolhelp(table, sampled_at, cpu_count)) {
         write_error(error_buffer, error_buffer_len, "CreateToolhelp32Snapshot failed.");
         *out_count = 0;
         return AURA_STATUS_ERROR;
     }
+    prune_process_cpu_state(cpu_pass);
 
-    PROCESSENTRY32W entry{};
-    entry.dwSize = sizeof(entry);
-    std::vector<aura_process_sample> collected;
-    collected.reserve(static_cast<size_t>(max_samples) * 4U);
-
-    const uint64_t sampled_at = now_100ns();
-    const int cpu_count = logical_cpu_count();
-    std::unordered_set<uint32_t> seen_pids;
-
-    BOOL has_entry = Process32FirstW(snapshot, &entry);
-    while (has_entry) {
-        const uint32_t pid = static_cast<uint32_t>(entry.th32ProcessID);
-        has_entry = Process32NextW(snapshot, &entry);
-        if (pid == 0) {
-            continue;
-        }
-        seen_pids.insert(pid);
-
-        HANDLE process = OpenProcess(
-            PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ,
-            FALSE,
-            static_cast<DWORD>(pid)
-        );
-
-        uint64_t rss_bytes = 0;
-        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
-            PROCESS_MEMORY_COUNTERS_EX memory{};
-            memory.cb = sizeof(memory);
-            if (GetProcessMemoryInfo(
-                    process,
-                    reinterpret_cast<PROCESS_MEMORY_COUNTERS*>(&memory),
-                    sizeof(memory)
-                )) {
-                rss_bytes = static_cast<uint64_t>(memory.WorkingSetSize);
-            }
-        }
-
-        double cpu = 0.0;
-        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
-            (void)compute_process_cpu_percent(pid, process, sampled_at, cpu_count, &cpu);
-        }
-
-        aura_process_sample sample{};
-        sample.pid = pid;
-        sample.cpu_percent = std::isfinite(cpu) && cpu > 0.0 ? cpu : 0.0;
-        sample.memory_rss_bytes = rss_bytes;
-
-        std::string utf8_name = utf8_from_utf16(entry.szExeFile);
-        if (utf8_name.empty()) {
-            utf8_name = "pid-" + std::to_string(pid);
-        }
-        write_utf8_name(sample.name, kProcessNameBytes, utf8_name);
-        collected.push_back(sample);
-
-        if (process != nullptr && process != INVALID_HANDLE_VALUE) {
-            CloseHandle(process);
-        }
-    }
-
-    CloseHandle(snapshot);
-    prune_process_cpu_state(seen_pids);
+    const std::vector<uint32_t>& pids = table.pids;
+    const std::vector<double>& cpu_percents = table.cpu_percents;
+    const std::vector<uint64_t>& rss_bytes_by_process = table.rss_bytes_by_process;
 
-    const size_t result_count = std::min(static_cast<size_t>(max_samples), collected.size());
+    const size_t result_count = std::min(static_cast<size_t>(max_samples), pids.size());
     if (result_count == 0U) {
         *out_count = 0;
         write_error(error_buffer, error_buffer_len, "");
         return AURA_STATUS_OK;
     }
 
-    const auto process_rank = [](const aura_process_sample& left, const aura_process_sample& right) {
-        if (left.cpu_percent != right.cpu_percent) {
-            return left.cpu_percent > right.cpu_percent;
+    const auto process_rank = [&](const size_t left, const size_t right) {
+        if (cpu_percents[left] != cpu_percents[right]) {
+            return cpu_percents[left] > cpu_percents[right];
         }
-        if (left.memory_rss_bytes != right.memory_rss_bytes) {
-            return left.memory_rss_bytes > right.memory_rss_bytes;
+        if (rss_bytes_by_process[left] != rss_bytes_by_process[right]) {
+            return rss_bytes_by_process[left] > rss_bytes_by_process[right];
         }
-        return left.pid < right.pid;
+        return pids[left] < pids[right];
     };
 
+    std::vector<size_t> order(pids.size());
+    for (size_t i = 0; i < order.size(); ++i) {
+        order[i] = i;
+    }
     std::partial_sort(
-        collected.begin(),
-        collected.begin() + static_cast<std::ptrdiff_t>(result_count),
-        collected.end(),
+        order.begin(),
+        order.begin() + static_cast<std::ptrdiff_t>(result_count),
+        order.end(),
         process_rank
     );
 
     for (size_t i = 0; i < result_count; ++i) {
-        samples[i] = collected[i];
+        const size_t index = order[i];
+        aura_process_sample sample{};
+        sample.pid = pids[index];
+        sample.cpu_percent = cpu_percents[index];
+        sample.memory_rss_bytes = rss_bytes_by_process[index];
+
+        std::string utf8_name = utf8_from_utf16(table.name_pool.c_str() + table.name_offsets[index]);
+        if (utf8_name.empty()) {
+            utf8_name = "pid-" + std::to_string(sample.pid);
+        }
+        write_utf8_name(sample.name, kProcessNameBytes, utf8_name);
+        samples[i] = sample;
     }
     *out_count = static_cast<uint32_t>(result_count);
     write_error(error_buffer, error_buffer_len, "");
@@ -619,18 +849,7 @@ extern "C" int aura_collect_per_core_cpu(
     const int cpu_count = logical_cpu_count();
     const uint32_t cores = std::min(static_cast<uint32_t>(cpu_count), max_cores);
 
-    using NtQuerySysInfoFn = LONG(WINAPI*)(ULONG, PVOID, ULONG, PULONG);
-    static NtQuerySysInfoFn nt_query = nullptr;
-    static bool nt_query_resolved = false;
-    if (!nt_query_resolved) {
-        HMODULE ntdll = GetModuleHandleW(L"ntdll.dll");
-        if (ntdll != nullptr) {
-            nt_query = reinterpret_cast<NtQuerySysInfoFn>(
-                GetProcAddress(ntdll, "NtQuerySystemInformation")
-            );
-        }
-        nt_query_resolved = true;
-    }
+    const NtQuerySystemInformationFn nt_query = nt_query_system_information();
 
     if (nt_query == nullptr) {
         *out_core_count = 0;
@@ -770,7 +989,7 @@ extern "C" int aura_collect_process_details(
 
     const uint64_t sampled_at = now_100ns();
     const int cpu_count = logical_cpu_count();
-    std::unordered_set<uint32_t> seen_pids;
+    const uint64_t cpu_pass = begin_process_cpu_pass();
     std::unordered_map<uint32_t, PROCESSENTRY32W> pid_to_entry;
 
     BOOL has_entry = Process32FirstW(snapshot, &entry);
@@ -794,7 +1013,6 @@ extern "C" int aura_collect_process_details(
             }
         }
 
-        seen_pids.insert(pid);
         pid_to_entry[pid] = entry;
 
         HANDLE process = OpenProcess(
@@ -905,7 +1123,11 @@ extern "C" int aura_collect_process_details(
     }
 
     CloseHandle(snapshot);
-    prune_process_cpu_state(seen_pids);
+    // A name-filtered query only samples the matching processes, so it must
+    // not prune the CPU baselines of everything else.
+    if (options->name_filter[0] == '\0') {
+        prune_process_cpu_state(cpu_pass);
+    }
 
     // Apply max_results limit
     const uint32_t result_limit = std::min(options->max_results, max_samples);
@@ -947,16 +1169,28 @@ extern "C" int aura_collect_process_details(
         }
     };
 
-    std::sort(collected.begin(), collected.end(), process_rank);
-
-    // If descending, reverse
-    if (options->sort_descending) {
-        std::reverse(collected.begin(), collected.end());
+    // Every ordering ends on the unique pid, so it is total and the
+    // descending order is exactly the reversed comparator.  Only indices are
+    // moved, and only the requested rows are ordered, instead of sorting the
+    // multi-kilobyte detail records in full.
+    const bool descending = options->sort_descending != 0;
+    std::vector<size_t> order(collected.size());
+    for (size_t i = 0; i < order.size(); ++i) {
+        order[i] = i;
     }
+    std::partial_sort(
+        order.begin(),
+        order.begin() + static_cast<std::ptrdiff_t>(result_count),
+        order.end(),
+        [&](const size_t left, const size_t right) {
+            return descending ? process_rank(collected[right], collected[left])
+                              : process_rank(collected[left], collected[right]);
+        }
+    );
 
     // Copy to output
     for (size_t i = 0; i < result_count; ++i) {
-        samples[i] = collected[i];
+        samples[i] = collected[order[i]];
     }
     *out_count = static_cast<uint32_t>(result_count);
     write_error(error_buffer, error_buffer_len, "");
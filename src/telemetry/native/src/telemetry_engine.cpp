@@ -6,6 +6,7 @@
 #include <cstring>
 #include <limits>
 #include <sstream>
+#include <string_view>
 
 namespace aura::telemetry {
 
@@ -32,6 +33,9 @@ double clamp_percent(double value) {
     return value;
 }
 
+// Collector error buffers are only read up to their first NUL and never past
+// their length, and the collectors NUL-terminate what they write, so callers
+// clear just the first byte instead of zero-filling the whole buffer.
 std::string decode_error_buffer(const char* error_buffer, size_t error_buffer_len) {
     if (error_buffer == nullptr || error_buffer_len == 0) {
         return {};
@@ -58,21 +62,33 @@ std::string build_status_error(
     return oss.str();
 }
 
+// Per-thread ABI row buffers, reused across calls and only ever grown, so a
+// steady poll does not reallocate and re-zero the 256-row process array or
+// the multi-kilobyte detail records every time.
+template <typename Row>
+Row* reusable_rows(size_t count) {
+    thread_local std::vector<Row> rows;
+    if (rows.size() < count) {
+        rows.resize(count);
+    }
+    return rows.data();
+}
+
 std::string decode_fixed_utf8(const char* data, size_t data_len) {
     if (data == nullptr || data_len == 0) {
         return {};
     }
-    size_t used = 0;
-    while (used < data_len && data[used] != '\0') {
-        ++used;
-    }
-    std::string decoded(data, used);
+    // The NUL is located with memchr and the label is trimmed as a view, so
+    // only the final name is allocated rather than the whole fixed field.
+    const auto* terminator = static_cast<const char*>(std::memchr(data, '\0', data_len));
+    const size_t used = terminator != nullptr ? static_cast<size_t>(terminator - data) : data_len;
+    const std::string_view decoded(data, used);
     const auto first_non_ws = decoded.find_first_not_of(" \t\r\n");
-    if (first_non_ws == std::string::npos) {
+    if (first_non_ws == std::string_view::npos) {
         return {};
     }
     const auto last_non_ws = decoded.find_last_not_of(" \t\r\n");
-    return decoded.substr(first_non_ws, last_non_ws - first_non_ws + 1);
+    return std::string(decoded.substr(first_non_ws, last_non_ws - first_non_ws + 1));
 }
 
 void clear_error(std::string* error_message) {
@@ -127,7 +143,8 @@ bool TelemetryEngine::CollectSystemSnapshot(
         return false;
     }
 
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     double cpu_percent = 0.0;
     double memory_percent = 0.0;
     const int status = collectors_.collect_system_snapshot(
@@ -180,11 +197,12 @@ bool TelemetryEngine::CollectTopProcesses(
     }
 
     const uint32_t collect_capacity = kMaxProcessSamples;
-    std::vector<aura_process_sample> raw_samples(static_cast<size_t>(collect_capacity));
+    aura_process_sample* const raw_samples = reusable_rows<aura_process_sample>(collect_capacity);
     uint32_t out_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_processes(
-        raw_samples.data(),
+        raw_samples,
         collect_capacity,
         &out_count,
         error_buffer.data(),
@@ -203,14 +221,41 @@ bool TelemetryEngine::CollectTopProcesses(
     }
 
     const uint32_t bounded_count = std::min(out_count, collect_capacity);
-    out_samples->clear();
-    out_samples->reserve(static_cast<size_t>(bounded_count));
+
+    // Rows are ranked by index and only the top `limit` are selected, so the
+    // names and ProcessSample objects are built for the returned rows alone.
+    std::vector<uint32_t> order;
+    order.reserve(static_cast<size_t>(bounded_count));
     for (uint32_t i = 0; i < bounded_count; ++i) {
-        const aura_process_sample& raw = raw_samples[static_cast<size_t>(i)];
-        if (raw.pid == 0) {
-            continue;
+        if (raw_samples[static_cast<size_t>(i)].pid != 0) {
+            order.push_back(i);
+        }
+    }
+    const auto process_rank = [raw_samples](const uint32_t left_index, const uint32_t right_index) {
+        const aura_process_sample& left = raw_samples[static_cast<size_t>(left_index)];
+        const aura_process_sample& right = raw_samples[static_cast<size_t>(right_index)];
+        const double left_cpu = clamp_percent(left.cpu_percent);
+        const double right_cpu = clamp_percent(right.cpu_percent);
+        if (left_cpu != right_cpu) {
+            return left_cpu > right_cpu;
         }
+        if (left.memory_rss_bytes != right.memory_rss_bytes) {
+            return left.memory_rss_bytes > right.memory_rss_bytes;
+        }
+        return left.pid < right.pid;
+    };
+    const size_t result_count = std::min(order.size(), static_cast<size_t>(limit));
+    std::partial_sort(
+        order.begin(),
+        order.begin() + static_cast<std::ptrdiff_t>(result_count),
+        order.end(),
+        process_rank
+    );
 
+    out_samples->clear();
+    out_samples->reserve(result_count);
+    for (size_t i = 0; i < result_count; ++i) {
+        const aura_process_sample& raw = raw_samples[static_cast<size_t>(order[i])];
         ProcessSample sample{};
         sample.pid = raw.pid;
         sample.name = decode_fixed_utf8(raw.name, sizeof(raw.name));
@@ -221,24 +266,6 @@ bool TelemetryEngine::CollectTopProcesses(
         sample.memory_rss_bytes = raw.memory_rss_bytes;
         out_samples->push_back(std::move(sample));
     }
-
-    std::sort(
-        out_samples->begin(),
-        out_samples->end(),
-        [](const ProcessSample& left, const ProcessSample& right) {
-            if (left.cpu_percent != right.cpu_percent) {
-                return left.cpu_percent > right.cpu_percent;
-            }
-            if (left.memory_rss_bytes != right.memory_rss_bytes) {
-                return left.memory_rss_bytes > right.memory_rss_bytes;
-            }
-            return left.pid < right.pid;
-        }
-    );
-
-    if (out_samples->size() > limit) {
-        out_samples->resize(limit);
-    }
     clear_error(error_message);
     return true;
 }
@@ -268,7 +295,8 @@ bool TelemetryEngine::CollectDiskSnapshot(
     }
 
     aura_disk_counters current{};
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_disk_counters(
         &current,
         error_buffer.data(),
@@ -363,7 +391,8 @@ bool TelemetryEngine::CollectNetworkSnapshot(
     }
 
     aura_network_counters current{};
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_network_counters(
         &current,
         error_buffer.data(),
@@ -456,7 +485,8 @@ bool TelemetryEngine::CollectThermalSnapshot(
 
     std::array<aura_thermal_reading, kMaxThermalReadings> raw_readings{};
     uint32_t out_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_thermal_readings(
         raw_readings.data(),
         static_cast<uint32_t>(raw_readings.size()),
@@ -544,7 +574,8 @@ bool TelemetryEngine::CollectPerCoreCpu(
 
     std::array<double, kMaxCores> raw_percents{};
     uint32_t out_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_per_core_cpu(
         raw_percents.data(),
         static_cast<uint32_t>(raw_percents.size()),
@@ -593,7 +624,8 @@ bool TelemetryEngine::CollectGpuSnapshot(
     }
 
     aura_gpu_utilization raw{};
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.collect_gpu_utilization(
         &raw,
         error_buffer.data(),
@@ -644,13 +676,14 @@ bool TelemetryEngine::CollectProcessDetails(
     native_options.name_filter[filter_len] = '\0';
 
     const uint32_t max_samples = static_cast<uint32_t>(std::min(static_cast<size_t>(options.max_results), static_cast<size_t>(256)));
-    std::vector<aura_process_detail> raw_samples(max_samples);
+    aura_process_detail* const raw_samples = reusable_rows<aura_process_detail>(max_samples);
     uint32_t out_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
 
     const int status = collectors_.collect_process_details(
         &native_options,
-        raw_samples.data(),
+        raw_samples,
         max_samples,
         &out_count,
         error_buffer.data(),
@@ -669,10 +702,11 @@ bool TelemetryEngine::CollectProcessDetails(
         return false;
     }
 
+    const uint32_t bounded_count = std::min(out_count, max_samples);
     out_details->clear();
-    out_details->reserve(out_count);
+    out_details->reserve(bounded_count);
 
-    for (uint32_t i = 0; i < out_count; ++i) {
+    for (uint32_t i = 0; i < bounded_count; ++i) {
         const aura_process_detail& raw = raw_samples[i];
         ProcessDetail detail{};
         detail.pid = raw.pid;
@@ -746,7 +780,8 @@ bool TelemetryEngine::BuildProcessTree(
 
     std::vector<aura_process_tree_node> tree_nodes(process_details.size());
     uint32_t node_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
 
     const int status = collectors_.build_process_tree(
         native_details.data(),
@@ -813,7 +848,8 @@ bool TelemetryEngine::GetProcessByPid(
     }
 
     aura_process_detail raw{};
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.get_process_by_pid(
         pid,
         &raw,
@@ -871,7 +907,8 @@ bool TelemetryEngine::TerminateProcess(
         return false;
     }
 
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.terminate_process(
         pid,
         exit_code,
@@ -913,7 +950,8 @@ bool TelemetryEngine::SetProcessPriority(
         return false;
     }
 
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
     const int status = collectors_.set_process_priority(
         pid,
         priority_class,
@@ -958,7 +996,8 @@ bool TelemetryEngine::GetProcessChildren(
     const uint32_t max_children = 256;
     std::vector<uint32_t> child_pids(max_children);
     uint32_t child_count = 0;
-    std::array<char, 512> error_buffer{};
+    std::array<char, 512> error_buffer;
+    error_buffer[0] = '\0';
 
     const int status = collectors_.get_process_children(
         pid,
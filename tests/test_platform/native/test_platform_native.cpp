@@ -1,5 +1,6 @@
 #include "aura_platform.h"
 
+#include <atomic>
 #include <cmath>
 #include <chrono>
 #include <cstring>
@@ -141,6 +142,18 @@ void WriteTextFileLines(const std::filesystem::path& path, const std::vector<std
     }
 }
 
+int CountFileLines(const std::filesystem::path& path) {
+    std::ifstream input(path, std::ios::binary);
+    int lines = 0;
+    std::string line;
+    while (std::getline(input, line)) {
+        if (!line.empty()) {
+            lines += 1;
+        }
+    }
+    return lines;
+}
+
 bool StartsWithSqliteMagic(const std::filesystem::path& path) {
     std::ifstream input(path, std::ios::binary);
     if (!input.is_open()) {
@@ -219,6 +232,63 @@ void TestConfigRejectsMalformedTomlRetention() {
     std::filesystem::remove(config_path, remove_error);
 }
 
+void TestConfigMalformedTomlOnlyRejectedWhenConsulted() {
+    ScopedEnvVar db_path_env("AURA_DB_PATH");
+    db_path_env.Set("");
+    ScopedEnvVar retention_env("AURA_RETENTION_SECONDS");
+    retention_env.Set("");
+
+    const std::filesystem::path config_path = BuildStorePath("unconsulted_bad_config");
+    const std::string config_path_raw = config_path.string();
+    const std::filesystem::path cli_db_path = BuildStorePath("unconsulted_bad_config_db");
+    const std::string cli_db_path_raw = cli_db_path.string();
+    WriteTextFileLines(
+        config_path,
+        {
+            "[persistence]",
+            "retention_seconds = 42oops",
+        }
+    );
+
+    // CLI settles both retention and db path, so the file is never read.
+    aura_config_request_t request{};
+    request.no_persist = 0;
+    request.has_cli_retention = 1;
+    request.cli_retention_seconds = 60.0;
+    request.cli_db_path = cli_db_path_raw.c_str();
+    request.config_path_override = config_path_raw.c_str();
+
+    aura_runtime_config_t config{};
+    aura_error_t error{};
+    int rc = aura_config_resolve(&request, &config, &error);
+    ExpectEq(rc, AURA_OK, "malformed TOML should be ignored when CLI settles every setting");
+    ExpectNear(config.retention_seconds, 60.0, 1e-9, "retention should come from CLI");
+    ExpectEq(config.db_source, AURA_DB_SOURCE_CLI, "db source should be CLI");
+
+    // Env settling the db path works the same way.
+    db_path_env.Set(cli_db_path_raw);
+    request.cli_db_path = nullptr;
+    config = aura_runtime_config_t{};
+    error = aura_error_t{};
+    rc = aura_config_resolve(&request, &config, &error);
+    ExpectEq(rc, AURA_OK, "malformed TOML should be ignored when CLI and env settle every setting");
+    ExpectEq(config.db_source, AURA_DB_SOURCE_ENV, "db source should be env");
+
+    // Once db path falls through to the file, the file is parsed and rejected.
+    db_path_env.Set("");
+    config = aura_runtime_config_t{};
+    error = aura_error_t{};
+    rc = aura_config_resolve(&request, &config, &error);
+    ExpectTrue(rc != AURA_OK, "malformed TOML should be rejected once a setting falls through to it");
+    ExpectTrue(
+        std::string(error.message).find("retention_seconds") != std::string::npos,
+        "error should identify malformed TOML retention field"
+    );
+
+    std::error_code remove_error;
+    std::filesystem::remove(config_path, remove_error);
+}
+
 void TestConfigAcceptsTomlInlineCommentRetention() {
     ScopedEnvVar retention_env("AURA_RETENTION_SECONDS");
     retention_env.Set("");
@@ -284,6 +354,92 @@ void TestConfigAcceptsTomlInlineCommentDbPath() {
     CleanupStoreFiles(expected_db_path);
 }
 
+void TestConfigAcceptsCrlfTomlFile() {
+    ScopedEnvVar retention_env("AURA_RETENTION_SECONDS");
+    retention_env.Set("");
+
+    const std::filesystem::path config_path = BuildStorePath("crlf_config");
+    const std::string config_path_raw = config_path.string();
+    {
+        std::ofstream output(config_path, std::ios::trunc | std::ios::binary);
+        output << "[persistence]\r\nretention_seconds = 77\r\n";
+    }
+
+    aura_config_request_t request{};
+    request.no_persist = 1;
+    request.config_path_override = config_path_raw.c_str();
+
+    aura_runtime_config_t config{};
+    aura_error_t error{};
+    const int rc = aura_config_resolve(&request, &config, &error);
+    ExpectEq(rc, AURA_OK, "aura_config_resolve should accept CRLF line endings");
+    ExpectNear(config.retention_seconds, 77.0, 1e-9, "retention should parse from CRLF config");
+
+    std::error_code remove_error;
+    std::filesystem::remove(config_path, remove_error);
+}
+
+void TestConfigReloadsEditedTomlFile() {
+    ScopedEnvVar retention_env("AURA_RETENTION_SECONDS");
+    retention_env.Set("");
+
+    const std::filesystem::path config_path = BuildStorePath("reload_config");
+    const std::string config_path_raw = config_path.string();
+
+    aura_config_request_t request{};
+    request.no_persist = 1;
+    request.config_path_override = config_path_raw.c_str();
+
+    WriteTextFileLines(config_path, {"[persistence]", "retention_seconds = 42"});
+    for (int pass = 0; pass < 2; ++pass) {
+        aura_runtime_config_t config{};
+        aura_error_t error{};
+        const int rc = aura_config_resolve(&request, &config, &error);
+        ExpectEq(rc, AURA_OK, "aura_config_resolve should succeed on repeated reads");
+        ExpectNear(config.retention_seconds, 42.0, 1e-9, "repeated reads should return the same retention");
+    }
+
+    WriteTextFileLines(config_path, {"[persistence]", "retention_seconds = 1234"});
+    aura_runtime_config_t config{};
+    aura_error_t error{};
+    const int rc = aura_config_resolve(&request, &config, &error);
+    ExpectEq(rc, AURA_OK, "aura_config_resolve should succeed after the file changes");
+    ExpectNear(config.retention_seconds, 1234.0, 1e-9, "edited config file should be re-read");
+
+    std::error_code remove_error;
+    std::filesystem::remove(config_path, remove_error);
+}
+
+void TestConfigAutoDbPathTracksAppDataChanges() {
+    ScopedEnvVar db_path_env("AURA_DB_PATH");
+    db_path_env.Set("");
+    ScopedEnvVar retention_env("AURA_RETENTION_SECONDS");
+    retention_env.Set("");
+    ScopedEnvVar appdata_env("APPDATA");
+
+    const std::filesystem::path first_root = BuildStorePath("appdata_first");
+    const std::filesystem::path second_root = BuildStorePath("appdata_second");
+
+    aura_config_request_t request{};
+    request.no_persist = 0;
+
+    for (int pass = 0; pass < 2; ++pass) {
+        for (const std::filesystem::path& root : {first_root, second_root}) {
+            appdata_env.Set(root.string());
+
+            aura_runtime_config_t config{};
+            aura_error_t error{};
+            const int rc = aura_config_resolve(&request, &config, &error);
+            ExpectEq(rc, AURA_OK, "aura_config_resolve should succeed with APPDATA set");
+            ExpectEq(config.db_source, AURA_DB_SOURCE_AUTO, "db source should be auto");
+            ExpectTrue(
+                std::string(config.db_path) == (root / "Aura" / "telemetry.sqlite").string(),
+                "auto db path should follow the current APPDATA value"
+            );
+        }
+    }
+}
+
 void TestStoreMemoryAppendLatestBetween() {
     aura_error_t error{};
     aura_store_t* store = nullptr;
@@ -329,6 +485,44 @@ void TestStoreMemoryAppendLatestBetween() {
     ExpectEq(rc, AURA_OK, "store close should succeed");
 }
 
+void TestStoreBetweenAfterOutOfOrderAppend() {
+    aura_error_t error{};
+    aura_store_t* store = nullptr;
+
+    int rc = aura_store_open(":memory:", 3600.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "aura_store_open :memory: should succeed");
+
+    const double base = NowSeconds();
+    const aura_snapshot_t batch[4] = {
+        {base, 10.0, 20.0},
+        {base + 1.0, 11.0, 21.0},
+        {base + 1.0, 12.0, 22.0},
+        {base + 3.0, 13.0, 23.0},
+    };
+    rc = aura_store_append_many(store, batch, 4, nullptr, &error);
+    ExpectEq(rc, AURA_OK, "in-order batch should append");
+
+    aura_snapshot_t range[4]{};
+    int out_count = 0;
+    rc = aura_store_between(store, 1, base + 1.0, 1, base + 1.0, range, 4, &out_count, &error);
+    ExpectEq(rc, AURA_OK, "between should succeed");
+    ExpectEq(out_count, 2, "between should include both rows at the boundary timestamp");
+
+    const aura_snapshot_t late{base + 2.0, 14.0, 24.0};
+    rc = aura_store_append(store, &late, &error);
+    ExpectEq(rc, AURA_OK, "out-of-order append should succeed");
+
+    out_count = 0;
+    rc = aura_store_between(store, 1, base + 1.5, 0, 0.0, range, 4, &out_count, &error);
+    ExpectEq(rc, AURA_OK, "between after out-of-order append should succeed");
+    ExpectEq(out_count, 2, "between should still find rows appended out of order");
+    ExpectNear(range[0].timestamp, base + 3.0, 1e-9, "range keeps insertion order");
+    ExpectNear(range[1].timestamp, base + 2.0, 1e-9, "late row follows in insertion order");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "store close should succeed");
+}
+
 void TestStoreFilePersistenceAcrossReopen() {
     const std::filesystem::path db_path = BuildStorePath("store_reopen");
     const std::string db_path_raw = db_path.string();
@@ -376,6 +570,186 @@ void TestStoreFilePersistenceAcrossReopen() {
     CleanupStoreFiles(db_path);
 }
 
+void TestStoreAppendManyPersistsBatch() {
+    const std::filesystem::path db_path = BuildStorePath("append_many");
+    const std::string db_path_raw = db_path.string();
+
+    aura_error_t error{};
+    aura_store_t* store = nullptr;
+    int rc = aura_store_open(db_path_raw.c_str(), 3600.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "append_many store open should succeed");
+
+    const double base = NowSeconds() - 10.0;
+    const aura_snapshot_t batch[3]{
+        {base, 15.0, 25.0, 1.0, 2.0},
+        {base + 1.0, 16.0, 26.0, 3.0, 4.0},
+        {base + 2.0, 17.0, 27.0, 5.0, 6.0},
+    };
+    int total_count = -1;
+    rc = aura_store_append_many(store, batch, 3, &total_count, &error);
+    ExpectEq(rc, AURA_OK, "append_many should succeed");
+    ExpectEq(total_count, 3, "append_many should report the retained row count");
+
+    total_count = -1;
+    rc = aura_store_append_many(store, nullptr, 0, &total_count, &error);
+    ExpectEq(rc, AURA_OK, "empty append_many should be a no-op");
+    ExpectEq(total_count, 3, "empty append_many should still report the row count");
+
+    const aura_snapshot_t invalid[2]{
+        {base + 3.0, 18.0, 28.0, 0.0, 0.0},
+        {base + 4.0, 180.0, 28.0, 0.0, 0.0},
+    };
+    rc = aura_store_append_many(store, invalid, 2, nullptr, &error);
+    ExpectEq(rc, AURA_ERR_RUNTIME, "append_many should reject a batch with an invalid sample");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close append_many store handle");
+
+    store = nullptr;
+    rc = aura_store_open(db_path_raw.c_str(), 3600.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "reopen append_many store should succeed");
+
+    int count = 0;
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "count after append_many reopen should succeed");
+    ExpectEq(count, 3, "rejected batch should not be partially persisted");
+
+    aura_snapshot_t latest[1]{};
+    int out_count = 0;
+    rc = aura_store_latest(store, 1, latest, 1, &out_count, &error);
+    ExpectEq(rc, AURA_OK, "latest after append_many reopen should succeed");
+    ExpectNear(latest[0].timestamp, base + 2.0, 1e-9, "latest timestamp after append_many");
+    ExpectNear(latest[0].disk_write_bps, 6.0, 1e-9, "latest disk_write_bps after append_many");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close reopened append_many store");
+
+    CleanupStoreFiles(db_path);
+}
+
+void TestStoreSetRetentionPrunesInPlace() {
+    aura_error_t error{};
+    aura_store_t* store = nullptr;
+    int rc = aura_store_open(":memory:", 3600.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "set_retention store open should succeed");
+
+    const double base = NowSeconds();
+    aura_snapshot_t old_sample{base - 120.0, 10.0, 20.0};
+    aura_snapshot_t fresh_sample{base, 11.0, 21.0};
+    rc = aura_store_append(store, &old_sample, &error);
+    ExpectEq(rc, AURA_OK, "append old sample should succeed");
+    rc = aura_store_append(store, &fresh_sample, &error);
+    ExpectEq(rc, AURA_OK, "append fresh sample should succeed");
+
+    rc = aura_store_set_retention(store, 0.0, &error);
+    ExpectEq(rc, AURA_ERR_RUNTIME, "non-positive retention should be rejected");
+
+    int count = 0;
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "count after rejected retention should succeed");
+    ExpectEq(count, 2, "rejected retention should keep both samples");
+
+    rc = aura_store_set_retention(store, 60.0, &error);
+    ExpectEq(rc, AURA_OK, "set_retention should succeed");
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "count after set_retention should succeed");
+    ExpectEq(count, 1, "shorter retention should prune the old sample");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close set_retention store");
+}
+
+void TestStoreAppendsWithoutRewritingExpiredRows() {
+    const std::filesystem::path db_path = BuildStorePath("append_only");
+    const std::string db_path_raw = db_path.string();
+    const double base = NowSeconds();
+
+    WriteTextFileLines(
+        db_path,
+        {
+            SnapshotLine(base - 120.0, 10.0, 20.0),
+            SnapshotLine(base - 110.0, 11.0, 21.0),
+            SnapshotLine(base - 1.0, 12.0, 22.0),
+        }
+    );
+
+    aura_error_t error{};
+    aura_store_t* store = nullptr;
+    int rc = aura_store_open(db_path_raw.c_str(), 60.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "append-only store open should succeed");
+
+    int count = 0;
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "append-only count should succeed");
+    ExpectEq(count, 1, "expired rows should be pruned in memory");
+    ExpectEq(CountFileLines(db_path), 3, "a few expired rows should not force a rewrite");
+
+    aura_snapshot_t fresh{base, 13.0, 23.0};
+    rc = aura_store_append(store, &fresh, &error);
+    ExpectEq(rc, AURA_OK, "append-only append should succeed");
+    ExpectEq(CountFileLines(db_path), 4, "append should add one line to the store file");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close append-only store");
+
+    store = nullptr;
+    rc = aura_store_open(db_path_raw.c_str(), 60.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "reopen append-only store should succeed");
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "count after append-only reopen should succeed");
+    ExpectEq(count, 2, "reopen should drop expired rows left on disk");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close reopened append-only store");
+
+    CleanupStoreFiles(db_path);
+}
+
+void TestStoreReadersRunAlongsideAppends() {
+    const std::filesystem::path db_path = BuildStorePath("concurrent_reads");
+    const std::string db_path_raw = db_path.string();
+
+    aura_error_t error{};
+    aura_store_t* store = nullptr;
+    int rc = aura_store_open(db_path_raw.c_str(), 3600.0, &store, &error);
+    ExpectEq(rc, AURA_OK, "concurrent store open should succeed");
+
+    constexpr int kAppends = 200;
+    const double base = NowSeconds() - kAppends;
+    std::atomic<bool> writer_done = false;
+    std::atomic<int> reader_failures = 0;
+    std::thread reader([&]() {
+        aura_error_t reader_error{};
+        aura_snapshot_t latest[4]{};
+        while (!writer_done.load()) {
+            int out_count = 0;
+            if (aura_store_latest(store, 4, latest, 4, &out_count, &reader_error) != AURA_OK) {
+                reader_failures += 1;
+            }
+        }
+    });
+
+    for (int i = 0; i < kAppends; ++i) {
+        aura_snapshot_t snapshot{base + i, 10.0, 20.0};
+        rc = aura_store_append(store, &snapshot, &error);
+        ExpectEq(rc, AURA_OK, "append alongside readers should succeed");
+    }
+    writer_done = true;
+    reader.join();
+    ExpectEq(reader_failures.load(), 0, "reads alongside appends should succeed");
+
+    int count = 0;
+    rc = aura_store_count(store, &count, &error);
+    ExpectEq(rc, AURA_OK, "count after concurrent appends should succeed");
+    ExpectEq(count, kAppends, "every concurrent append should be stored");
+
+    rc = aura_store_close(store);
+    ExpectEq(rc, AURA_OK, "close concurrent store");
+    ExpectEq(CountFileLines(db_path), kAppends, "every concurrent append should reach the file");
+
+    CleanupStoreFiles(db_path);
+}
+
 void TestStoreReadQueriesDoNotRewriteWithoutPrune() {
     const std::filesystem::path db_path = BuildStorePath("read_no_rewrite");
     const std::string db_path_raw = db_path.string();
@@ -741,10 +1115,19 @@ int main() {
     TestConfigNoPersist();
     TestConfigRejectsMalformedEnvRetention();
     TestConfigRejectsMalformedTomlRetention();
+    TestConfigMalformedTomlOnlyRejectedWhenConsulted();
     TestConfigAcceptsTomlInlineCommentRetention();
     TestConfigAcceptsTomlInlineCommentDbPath();
+    TestConfigAutoDbPathTracksAppDataChanges();
+    TestConfigReloadsEditedTomlFile();
+    TestConfigAcceptsCrlfTomlFile();
     TestStoreMemoryAppendLatestBetween();
+    TestStoreBetweenAfterOutOfOrderAppend();
     TestStoreFilePersistenceAcrossReopen();
+    TestStoreAppendManyPersistsBatch();
+    TestStoreSetRetentionPrunesInPlace();
+    TestStoreAppendsWithoutRewritingExpiredRows();
+    TestStoreReadersRunAlongsideAppends();
     TestStoreReadQueriesDoNotRewriteWithoutPrune();
     TestStoreRecoveryFromStaleTmpWhenMainMissing();
     TestStoreIgnoresStaleTmpWhenMainExists();
@@ -1102,6 +1102,33 @@ void test_format_snapshot_lines_nan_inf() {
     assert(std::strlen(lines.timestamp) < sizeof(lines.timestamp));
 }
 
+// Repeated timestamps reuse the cached label; a new second rebuilds it.
+void test_format_snapshot_lines_timestamp_label_updates() {
+    AuraSnapshotLines lines = aura_format_snapshot_lines(3723.2, 1.0, 2.0);
+    assert(std::strcmp(lines.timestamp, "Updated 01:02:03 UTC") == 0);
+    lines = aura_format_snapshot_lines(3723.9, 1.0, 2.0);
+    assert(std::strcmp(lines.timestamp, "Updated 01:02:03 UTC") == 0);
+    lines = aura_format_snapshot_lines(86399.0, 1.0, 2.0);
+    assert(std::strcmp(lines.timestamp, "Updated 23:59:59 UTC") == 0);
+    lines = aura_format_snapshot_lines(0.0, 1.0, 2.0);
+    assert(std::strcmp(lines.timestamp, "Updated 00:00:00 UTC") == 0);
+}
+
+// Repeated percentages reuse the cached labels; a changed value rebuilds them.
+void test_format_snapshot_lines_percent_labels_update() {
+    AuraSnapshotLines lines = aura_format_snapshot_lines(0.0, 12.34, 56.78);
+    lines = aura_format_snapshot_lines(1.0, 12.34, 56.78);
+    assert(std::strcmp(lines.cpu, "CPU 12.3%") == 0);
+    assert(std::strcmp(lines.memory, "Memory 56.8%") == 0);
+    lines = aura_format_snapshot_lines(2.0, 99.96, 56.78);
+    assert(std::strcmp(lines.cpu, "CPU 100.0%") == 0);
+    assert(std::strcmp(lines.memory, "Memory 56.8%") == 0);
+    lines = aura_format_snapshot_lines(3.0, 0.0, -0.0);
+    assert(std::strcmp(lines.cpu, "CPU 0.0%") == 0);
+    lines = aura_format_snapshot_lines(4.0, 0.0, 0.0);
+    assert(std::strcmp(lines.memory, "Memory 0.0%") == 0);
+}
+
 // Zero byte rates should format as 0.0 KB/s.
 void test_format_disk_rate_zero() {
     char buf[64] = {};
@@ -1534,6 +1561,8 @@ int main() {
     test_format_process_row_clamped_cpu();
     test_format_process_row_nan_cpu();
     test_format_snapshot_lines_nan_inf();
+    test_format_snapshot_lines_timestamp_label_updates();
+    test_format_snapshot_lines_percent_labels_update();
     test_format_disk_rate_zero();
     test_format_disk_rate_nan();
     test_format_disk_rate_infinity();
@@ -1,12 +1,15 @@
 #include "aura_shell/cockpit_controller.hpp"
 
 #include <algorithm>
+#include <atomic>
+#include <chrono>
 #include <cmath>
 #include <iostream>
 #include <limits>
 #include <memory>
 #include <optional>
 #include <string>
+#include <thread>
 #include <vector>
 
 namespace {
@@ -23,6 +26,7 @@ public:
     };
     std::string snapshot_error;
     std::string process_error;
+    std::atomic<int> process_calls{0};
 
     bool available() const override {
         return backend_available;
@@ -41,6 +45,7 @@ public:
         const std::size_t max_samples,
         std::string& error
     ) override {
+        ++process_calls;
         if (!backend_available) {
             error = process_error.empty() ? "telemetry unavailable" : process_error;
             return {};
@@ -560,6 +565,69 @@ bool test_anomaly_count_detects_spikes() {
     return ok;
 }
 
+bool test_timeline_refresh_interval_limits_queries() {
+    auto telemetry = std::make_unique<FakeTelemetryBridge>();
+    auto render = std::make_unique<FakeRenderBridge>();
+    auto timeline = std::make_unique<FakeTimelineBridge>();
+    auto* timeline_ptr = timeline.get();
+
+    aura::shell::CockpitController::Config config;
+    config.db_path = "C:/tmp/aura.db";
+    config.timeline_refresh_ticks = 1U;
+    config.timeline_refresh_interval_seconds = 1.0;
+
+    aura::shell::CockpitController controller(
+        std::move(telemetry),
+        std::move(render),
+        std::move(timeline),
+        config
+    );
+
+    aura::shell::CockpitUiState state;
+    for (int i = 0; i < 20; ++i) {
+        state = controller.tick(0.1, 1700000400.0 + (0.1 * static_cast<double>(i)));
+    }
+
+    bool ok = true;
+    ok &= expect_true(timeline_ptr->query_count == 2, "interval: one query per second of ticks");
+    ok &= expect_true(state.timeline_source == aura::shell::TimelineSource::Dvr, "interval: dvr cache served");
+    ok &= expect_true(state.timeline_points.size() >= 8U, "interval: cached points");
+    return ok;
+}
+
+bool test_background_process_refresh_reuses_latest_rows() {
+    auto telemetry = std::make_unique<FakeTelemetryBridge>();
+    auto* telemetry_ptr = telemetry.get();
+    auto render = std::make_unique<FakeRenderBridge>();
+    auto timeline = std::make_unique<FakeTimelineBridge>();
+
+    aura::shell::CockpitController::Config config;
+    config.prefer_dvr_timeline = false;
+    config.background_process_refresh = true;
+    config.poll_interval_seconds = 0.01;
+
+    aura::shell::CockpitController controller(
+        std::move(telemetry),
+        std::move(render),
+        std::move(timeline),
+        config
+    );
+
+    const aura::shell::CockpitUiState first = controller.tick(1.0, 1700000300.0);
+    bool ok = true;
+    ok &= expect_true(first.process_rows.size() == 2U, "background: first tick has rows");
+    ok &= expect_true(telemetry_ptr->process_calls.load() == 1, "background: first tick collects inline");
+
+    aura::shell::CockpitUiState state = first;
+    for (int i = 0; i < 400 && telemetry_ptr->process_calls.load() < 2; ++i) {
+        std::this_thread::sleep_for(std::chrono::milliseconds(5));
+        state = controller.tick(1.0, 1700000301.0 + static_cast<double>(i));
+        ok &= expect_true(state.process_rows.size() == 2U, "background: ticks keep cached rows");
+    }
+    ok &= expect_true(telemetry_ptr->process_calls.load() >= 2, "background: refresh runs off the tick");
+    return ok;
+}
+
 }  // namespace
 
 int main() {
@@ -592,6 +660,12 @@ int main() {
     if (!test_anomaly_count_detects_spikes()) {
         ++failures;
     }
+    if (!test_timeline_refresh_interval_limits_queries()) {
+        ++failures;
+    }
+    if (!test_background_process_refresh_reuses_latest_rows()) {
+        ++failures;
+    }
 
     if (failures == 0) {
         std::cout << "All cockpit controller tests passed." << '\n';
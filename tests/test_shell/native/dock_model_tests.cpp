@@ -1,10 +1,12 @@
 #include "aura_shell/dock_model.hpp"
 
+#include <algorithm>
 #include <cassert>
 #include <cstddef>
 #include <optional>
 #include <stdexcept>
 #include <string_view>
+#include <utility>
 
 namespace {
 
@@ -27,6 +29,12 @@ std::size_t panel_count(const aura::shell::DockState& state, const aura::shell::
 void assert_single_instance_per_panel(const aura::shell::DockState& state) {
     for (const auto panel_id : aura::shell::all_panel_ids()) {
         assert(panel_count(state, panel_id) == 1U);
+
+        // The reverse index must agree with slot_tabs.
+        const auto slot = aura::shell::find_panel_slot(state, panel_id);
+        assert(slot.has_value());
+        const auto& tabs = state.slot_tabs[slot_index(*slot)];
+        assert(std::find(tabs.begin(), tabs.end(), panel_id) != tabs.end());
     }
 }
 
@@ -505,6 +513,189 @@ void test_move_out_of_range_index_throws() {
     assert(threw);
 }
 
+// ---------------------------------------------------------------------------
+// NEW: Unknown panel ids are not docked
+// ---------------------------------------------------------------------------
+
+void test_unknown_panel_is_not_docked() {
+    using aura::shell::DockSlot;
+    using aura::shell::PanelId;
+    using aura::shell::PanelMoveRequest;
+
+    const auto state = aura::shell::build_default_dock_state();
+    const auto unknown = static_cast<PanelId>(7U);
+    assert(!aura::shell::find_panel_slot(state, unknown).has_value());
+
+    bool threw = false;
+    try {
+        static_cast<void>(aura::shell::move_panel(
+            state,
+            PanelMoveRequest{
+                .panel_id = unknown,
+                .to_slot = DockSlot::Left,
+                .to_index = std::nullopt,
+            }
+        ));
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+}
+
+// ---------------------------------------------------------------------------
+// NEW: The reverse index never outvotes slot_tabs
+// ---------------------------------------------------------------------------
+
+void test_default_constructed_state_has_no_docked_panels() {
+    using aura::shell::DockSlot;
+    using aura::shell::PanelId;
+    using aura::shell::PanelMoveRequest;
+
+    const aura::shell::DockState state{};
+    for (const auto panel_id : aura::shell::all_panel_ids()) {
+        assert(!aura::shell::find_panel_slot(state, panel_id).has_value());
+    }
+
+    bool threw = false;
+    try {
+        static_cast<void>(aura::shell::move_panel(
+            state,
+            PanelMoveRequest{
+                .panel_id = PanelId::DvrTimeline,
+                .to_slot = DockSlot::Right,
+                .to_index = std::nullopt,
+            }
+        ));
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+}
+
+void test_hand_filled_state_ignores_stale_index() {
+    using aura::shell::DockSlot;
+    using aura::shell::PanelId;
+    using aura::shell::PanelMoveRequest;
+
+    // slot_tabs filled by hand, panel_slot left at its default.
+    aura::shell::DockState state{};
+    state.slot_tabs[slot_index(DockSlot::Right)] = {PanelId::TopProcesses};
+    auto slot = aura::shell::find_panel_slot(state, PanelId::TopProcesses);
+    assert(slot.has_value() && *slot == DockSlot::Right);
+    assert(!aura::shell::find_panel_slot(state, PanelId::TelemetryOverview).has_value());
+
+    // A hint that disagrees with slot_tabs is ignored, so the move takes the
+    // panel out of the slot it is really in and it ends up listed once.
+    state.panel_slot[static_cast<std::size_t>(PanelId::TopProcesses)] = DockSlot::Left;
+    slot = aura::shell::find_panel_slot(state, PanelId::TopProcesses);
+    assert(slot.has_value() && *slot == DockSlot::Right);
+
+    state = aura::shell::move_panel(
+        state,
+        PanelMoveRequest{
+            .panel_id = PanelId::TopProcesses,
+            .to_slot = DockSlot::Center,
+            .to_index = std::nullopt,
+        }
+    );
+    assert(panel_count(state, PanelId::TopProcesses) == 1U);
+    assert(state.slot_tabs[slot_index(DockSlot::Right)].empty());
+    slot = aura::shell::find_panel_slot(state, PanelId::TopProcesses);
+    assert(slot.has_value() && *slot == DockSlot::Center);
+}
+
+// ---------------------------------------------------------------------------
+// NEW: Unknown dock slots are rejected
+// ---------------------------------------------------------------------------
+
+void test_unknown_slot_is_rejected() {
+    using aura::shell::DockSlot;
+    using aura::shell::PanelId;
+    using aura::shell::PanelMoveRequest;
+
+    static_assert(aura::shell::is_valid_dock_slot(DockSlot::Right));
+    const auto state = aura::shell::build_default_dock_state();
+    const auto unknown = static_cast<DockSlot>(5U);
+    assert(!aura::shell::is_valid_dock_slot(unknown));
+    assert(!aura::shell::active_panel(state, unknown).has_value());
+
+    bool threw = false;
+    try {
+        static_cast<void>(aura::shell::move_panel(
+            state,
+            PanelMoveRequest{
+                .panel_id = PanelId::TopProcesses,
+                .to_slot = unknown,
+                .to_index = std::nullopt,
+            }
+        ));
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+
+    threw = false;
+    try {
+        static_cast<void>(aura::shell::set_active_tab(state, unknown, 0U));
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+}
+
+// ---------------------------------------------------------------------------
+// NEW: In-place overloads leave the state intact when the request is invalid
+// ---------------------------------------------------------------------------
+
+void test_in_place_updates_keep_state_on_throw() {
+    using aura::shell::DockSlot;
+    using aura::shell::PanelId;
+    using aura::shell::PanelMoveRequest;
+
+    auto state = aura::shell::build_default_dock_state();
+    bool threw = false;
+    try {
+        state = aura::shell::move_panel(
+            std::move(state),
+            PanelMoveRequest{
+                .panel_id = PanelId::TopProcesses,
+                .to_slot = DockSlot::Center,
+                .to_index = 2U,  // Center holds one other panel once TopProcesses leaves
+            }
+        );
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+    assert(state.slot_tabs[slot_index(DockSlot::Center)].size() == 2U);
+    assert(state.slot_tabs[slot_index(DockSlot::Center)][0] == PanelId::TopProcesses);
+    assert_single_instance_per_panel(state);
+
+    threw = false;
+    try {
+        state = aura::shell::set_active_tab(std::move(state), DockSlot::Center, 5U);
+    } catch (const std::invalid_argument&) {
+        threw = true;
+    }
+    assert(threw);
+    assert(state.slot_tabs[slot_index(DockSlot::Center)].size() == 2U);
+
+    state = aura::shell::set_active_tab(std::move(state), DockSlot::Center, 1U);
+    assert(state.active_tab[slot_index(DockSlot::Center)] == 1U);
+    state = aura::shell::move_panel(
+        std::move(state),
+        PanelMoveRequest{
+            .panel_id = PanelId::DvrTimeline,
+            .to_slot = DockSlot::Left,
+            .to_index = 0U,
+        }
+    );
+    assert(state.slot_tabs[slot_index(DockSlot::Left)][0] == PanelId::DvrTimeline);
+    assert(state.active_tab[slot_index(DockSlot::Left)] == 0U);
+    assert(state.active_tab[slot_index(DockSlot::Center)] == 0U);
+    assert_single_instance_per_panel(state);
+}
+
 // ---------------------------------------------------------------------------
 // NEW: set_active_tab with tab_index=0 on empty slot is allowed
 // ---------------------------------------------------------------------------
@@ -675,6 +866,11 @@ int main() {
     // --- New: Error path coverage ---
     test_move_out_of_range_index_throws();
     test_set_active_tab_zero_on_empty_slot_allowed();
+    test_in_place_updates_keep_state_on_throw();
+    test_unknown_panel_is_not_docked();
+    test_default_constructed_state_has_no_docked_panels();
+    test_hand_filled_state_ignores_stale_index();
+    test_unknown_slot_is_rejected();
 
     // --- New: Append semantics ---
     test_move_nullopt_index_appends_to_end();
@@ -0,0 +1,160 @@
+#include "aura_shell/refresh_pacer.hpp"
+
+#include <chrono>
+#include <iostream>
+#include <string>
+
+namespace {
+
+using Clock = aura::shell::RefreshPacer::Clock;
+using std::chrono::milliseconds;
+
+bool expect_true(const bool condition, const std::string& name) {
+    if (!condition) {
+        std::cerr << "FAILED: " << name << '\n';
+        return false;
+    }
+    return true;
+}
+
+aura::shell::CockpitUiState live_state(const double cpu_percent) {
+    aura::shell::CockpitUiState state;
+    state.cpu_percent = cpu_percent;
+    state.memory_percent = 48.0;
+    state.telemetry_available = true;
+    state.render_available = true;
+    state.fps_recommended_delay_ms = 16;
+    state.status_line = "db=<none> telemetry=ok render=ok";
+    // The pulse moves the style tokens every tick; they must not count.
+    state.style_tokens.phase = cpu_percent / 100.0;
+    state.accent_intensity = cpu_percent / 100.0;
+    return state;
+}
+
+bool test_jittering_cpu_backs_off_then_recovers() {
+    aura::shell::RefreshPacer pacer;
+    const Clock::time_point start{};
+    const double jitter[] = {12.31, 12.34, 12.29};
+
+    bool ok = true;
+    int interval = 0;
+    // Tick every 16 ms for just under 2 s with sampling jitter.
+    int tick = 0;
+    for (; tick * 16 < 2000; ++tick) {
+        interval = pacer.next_interval_ms(live_state(jitter[tick % 3]), start + milliseconds(tick * 16));
+        if (interval != 16) {
+            break;
+        }
+    }
+    ok &= expect_true(interval == 16, "jitter: recommended interval kept before idle_after");
+
+    interval = pacer.next_interval_ms(live_state(jitter[tick % 3]), start + milliseconds(2000));
+    ok &= expect_true(interval == 250, "jitter: backs off to 250 ms after 2 s of jitter");
+    interval = pacer.next_interval_ms(live_state(jitter[(tick + 1) % 3]), start + milliseconds(2250));
+    ok &= expect_true(interval == 250, "jitter: stays backed off while jitter continues");
+
+    interval = pacer.next_interval_ms(live_state(37.5), start + milliseconds(2500));
+    ok &= expect_true(interval == 16, "jitter: real cpu change restores recommended interval");
+    interval = pacer.next_interval_ms(live_state(37.4), start + milliseconds(4400));
+    ok &= expect_true(interval == 16, "jitter: idle timer restarts from the real change");
+    interval = pacer.next_interval_ms(live_state(37.6), start + milliseconds(4500));
+    ok &= expect_true(interval == 250, "jitter: backs off again 2 s after the real change");
+    return ok;
+}
+
+bool test_slow_drift_counts_once_past_tolerance() {
+    aura::shell::RefreshPacer pacer;
+    const Clock::time_point start{};
+
+    bool ok = true;
+    // Each step is below the tolerance, but the drift from the value seen at
+    // the last change is not.
+    static_cast<void>(pacer.next_interval_ms(live_state(10.0), start));
+    static_cast<void>(pacer.next_interval_ms(live_state(10.3), start + milliseconds(1000)));
+    ok &= expect_true(
+        pacer.next_interval_ms(live_state(10.6), start + milliseconds(1500)) == 16,
+        "drift: movement past tolerance counts as a change"
+    );
+    ok &= expect_true(
+        pacer.next_interval_ms(live_state(10.6), start + milliseconds(3000)) == 16,
+        "drift: idle_after measured from the drift change"
+    );
+    ok &= expect_true(
+        pacer.next_interval_ms(live_state(10.6), start + milliseconds(3500)) == 250,
+        "drift: backs off 2 s after the drift change"
+    );
+    return ok;
+}
+
+bool test_discrete_inputs_restore_recommended_interval() {
+    aura::shell::RefreshPacer pacer;
+    const Clock::time_point start{};
+
+    bool ok = true;
+    static_cast<void>(pacer.next_interval_ms(live_state(20.0), start));
+    ok &= expect_true(
+        pacer.next_interval_ms(live_state(20.0), start + milliseconds(2000)) == 250,
+        "discrete: idle before change"
+    );
+
+    auto state = live_state(20.0);
+    state.severity_level = 2;
+    ok &= expect_true(
+        pacer.next_interval_ms(state, start + milliseconds(2100)) == 16,
+        "discrete: severity change restores recommended interval"
+    );
+
+    static_cast<void>(pacer.next_interval_ms(state, start + milliseconds(4100)));
+    state.status_line += " warning=store unavailable";
+    ok &= expect_true(
+        pacer.next_interval_ms(state, start + milliseconds(4200)) == 16,
+        "discrete: status change restores recommended interval"
+    );
+    return ok;
+}
+
+bool test_idle_never_shortens_a_slower_recommendation() {
+    aura::shell::RefreshPacer pacer;
+    const Clock::time_point start{};
+
+    auto state = live_state(5.0);
+    state.fps_recommended_delay_ms = 500;
+    bool ok = true;
+    ok &= expect_true(pacer.next_interval_ms(state, start) == 500, "slow: recommended interval used");
+    ok &= expect_true(
+        pacer.next_interval_ms(state, start + milliseconds(3000)) == 500,
+        "slow: idle keeps the longer recommended interval"
+    );
+    state.fps_recommended_delay_ms = 5000;
+    ok &= expect_true(
+        pacer.next_interval_ms(state, start + milliseconds(3100)) == 2000,
+        "slow: recommended interval clamped to 2000 ms"
+    );
+    return ok;
+}
+
+}  // namespace
+
+int main() {
+    int failures = 0;
+
+    if (!test_jittering_cpu_backs_off_then_recovers()) {
+        ++failures;
+    }
+    if (!test_slow_drift_counts_once_past_tolerance()) {
+        ++failures;
+    }
+    if (!test_discrete_inputs_restore_recommended_interval()) {
+        ++failures;
+    }
+    if (!test_idle_never_shortens_a_slower_recommendation()) {
+        ++failures;
+    }
+
+    if (failures == 0) {
+        std::cout << "All refresh pacer tests passed." << '\n';
+        return 0;
+    }
+    std::cerr << failures << " refresh pacer tests failed." << '\n';
+    return 1;
+}
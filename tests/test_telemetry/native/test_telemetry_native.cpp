@@ -1,5 +1,7 @@
 #include "telemetry_engine.h"
 
+#include "disk_op_counts.h"
+
 #include <algorithm>
 #include <array>
 #include <cmath>
@@ -13,6 +15,7 @@
 
 namespace {
 
+using aura::telemetry::DiskOpCounts;
 using aura::telemetry::DiskSnapshot;
 using aura::telemetry::NativeCollectors;
 using aura::telemetry::NetworkSnapshot;
@@ -713,6 +716,65 @@ int test_disk_rate_computation() {
     return 0;
 }
 
+int test_accumulate_wrapping_count_extends_across_wrap() {
+    uint64_t total = 0xFFFFFFF0ULL;
+    uint32_t last = 0xFFFFFFF0U;
+    aura::telemetry::accumulate_wrapping_count(total, last, 0x10U);
+    if (expect(total == 0x100000010ULL, "wrapped count should keep increasing")) {
+        return 1;
+    }
+    if (expect(last == 0x10U, "last raw count should track the native value")) {
+        return 1;
+    }
+    aura::telemetry::accumulate_wrapping_count(total, last, 0x10U);
+    if (expect(total == 0x100000010ULL, "unchanged raw count should not advance the total")) {
+        return 1;
+    }
+    return 0;
+}
+
+int test_disk_op_counts_survive_rescan_after_wrap() {
+    DiskOpCounts counts;
+    DiskOpCounts::Totals totals = counts.Observe(0, 0xFFFFFFF0U, 7U);
+    if (expect(totals.read_count == 0xFFFFFFF0ULL, "first observation seeds from the raw count")) {
+        return 1;
+    }
+    totals = counts.Observe(0, 0x10U, 9U);
+    if (expect(totals.read_count == 0x100000010ULL, "read count should extend across the wrap")) {
+        return 1;
+    }
+    if (expect(totals.write_count == 9ULL, "write count mismatch")) {
+        return 1;
+    }
+
+    // A handle re-probe observes the same drive index again; the totals must
+    // not be reseeded from the already wrapped raw counter.
+    totals = counts.Observe(0, 0x20U, 9U);
+    if (expect(totals.read_count == 0x100000020ULL, "rescan must not drop the wrapped total")) {
+        return 1;
+    }
+
+    // Drives are tracked independently.
+    totals = counts.Observe(1, 5U, 6U);
+    if (expect(totals.read_count == 5ULL && totals.write_count == 6ULL, "second drive seeds independently")) {
+        return 1;
+    }
+
+    // A drive that stops opening is forgotten; whatever appears at that
+    // index next starts fresh instead of reading as a wrap.
+    counts.Forget(0);
+    totals = counts.Observe(0, 3U, 4U);
+    if (expect(totals.read_count == 3ULL && totals.write_count == 4ULL, "forgotten drive should start fresh")) {
+        return 1;
+    }
+
+    totals = counts.Observe(DiskOpCounts::kMaxDrives, 11U, 12U);
+    if (expect(totals.read_count == 11ULL && totals.write_count == 12ULL, "out-of-range index passes raw counts")) {
+        return 1;
+    }
+    return 0;
+}
+
 int test_disk_non_increasing_timestamp_keeps_baseline() {
     g_disk_status = AURA_STATUS_OK;
     g_disk_index = 0;
@@ -1666,6 +1728,8 @@ int main() {
         test_process_empty_name_falls_back_to_pid,
         test_native_process_collector_returns_ranked_top_k,
         test_disk_rate_computation,
+        test_accumulate_wrapping_count_extends_across_wrap,
+        test_disk_op_counts_survive_rescan_after_wrap,
         test_disk_non_increasing_timestamp_keeps_baseline,
         test_disk_unavailable_degrades_gracefully,
         test_disk_error_still_fails,